@@ -39,12 +39,20 @@ class Config:
     # validated as present by Reddit.__init__, so they are typed as required.
     client_id: str
     client_secret: str | None
+    connection_pool_size: int | None
+    http_cache: str | None
+    http_cache_max_entries: int
+    identity_map: bool
+    json_decoder: str
     oauth_url: str
     password: str | None
     ratelimit_seconds: int
     reddit_url: str
     redirect_uri: str | None
     refresh_token: str | None
+    response_cache_size: int
+    response_cache_ttl: float
+    response_cache_ttls: dict[str, float]
     timeout: int
     user_agent: str
     username: str | None
@@ -57,6 +65,20 @@ class Config:
             return False
         return item.lower() in {"1", "yes", "true", "on"}
 
+    @staticmethod
+    def _config_mapping(*, item: dict[str, float] | str, option: str) -> dict[str, float]:
+        if isinstance(item, dict):
+            return item
+        mapping = {}
+        for pair in filter(None, (pair.strip() for pair in item.split(","))):
+            key, _, value = pair.partition("=")
+            try:
+                mapping[key.strip()] = float(value)
+            except ValueError:
+                msg = f"An incorrect config value was given for option {option}. The expected format is 'name=number, ...', but the given value is {item}."
+                raise ValueError(msg) from None
+        return mapping
+
     @staticmethod
     def _warn_on_endpoint_override(
         interpolator_class: configparser.Interpolation | None,
@@ -179,7 +201,18 @@ class Config:
         self._short_url = self._fetch_default("short_url") or self.CONFIG_NOT_SET
         self.check_for_async = self._config_boolean(item=self._fetch_default("check_for_async", default=True))
         self.check_for_updates = self._config_boolean(item=self._fetch_or_not_set("check_for_updates"))
+        self.compact_models = self._config_boolean(item=self._fetch_default("compact_models", default=False))
         self.window_size = self._fetch_default("window_size", default=600)
+        self.connection_pool_size = self._fetch_default("connection_pool_size")
+        self.http_cache = self._fetch_default("http_cache")
+        self.http_cache_max_entries = self._fetch_default("http_cache_max_entries", default=10000)
+        self.identity_map = self._config_boolean(item=self._fetch_default("identity_map", default=False))
+        self.json_decoder = self._fetch_default("json_decoder", default="json")
+        self.response_cache_size = self._fetch_default("response_cache_size", default=1024)
+        self.response_cache_ttl = self._fetch_default("response_cache_ttl", default=0)
+        self.response_cache_ttls = self._config_mapping(
+            item=self._fetch_default("response_cache_ttls", default=""), option="response_cache_ttls"
+        )
         self.kinds = {
             x: self._fetch(f"{x}_kind")
             for x in [
@@ -211,10 +244,16 @@ class Config:
         ):
             setattr(self, required_attribute, self._fetch(required_attribute))
 
-        for attribute, conversion in {
+        conversions: dict[str, type] = {
+            "http_cache_max_entries": int,
             "ratelimit_seconds": int,
+            "response_cache_size": int,
+            "response_cache_ttl": float,
             "timeout": int,
-        }.items():
+        }
+        if self.connection_pool_size is not None:
+            conversions["connection_pool_size"] = int
+        for attribute, conversion in conversions.items():
             try:
                 setattr(self, attribute, conversion(getattr(self, attribute)))
             except ValueError:
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from heapq import heappop, heappush
 from typing import TYPE_CHECKING, cast
 
+from praw.const import API_PATH
 from praw.exceptions import DuplicateReplaceException
 from praw.models.reddit.more import MoreComments
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from praw import models
 
 
@@ -19,6 +25,8 @@ class CommentForest:
 
     """
 
+    MAX_CHILDREN_PER_REQUEST = 100
+
     @staticmethod
     def _gather_more_comments(
         tree: list[models.Comment | models.MoreComments],
@@ -27,9 +35,11 @@ class CommentForest:
     ) -> list[MoreComments]:
         """Return a list of :class:`.MoreComments` objects obtained from tree."""
         more_comments: list[MoreComments] = []
-        queue: list[tuple[models.Comment | None, models.Comment | models.MoreComments]] = [(None, x) for x in tree]
+        queue: deque[tuple[models.Comment | None, models.Comment | models.MoreComments]] = deque(
+            (None, x) for x in tree
+        )
         while queue:
-            parent, comment = queue.pop(0)
+            parent, comment = queue.popleft()
             if isinstance(comment, MoreComments):
                 heappush(more_comments, comment)
                 if parent:
@@ -40,6 +50,87 @@ class CommentForest:
                 queue.extend((comment, item) for item in comment.replies)
         return more_comments
 
+    @staticmethod
+    def _remove_more_comments(more_comments: list[MoreComments]) -> None:
+        """Remove ``more_comments`` from the trees they were gathered from.
+
+        Each affected tree is rebuilt once, rather than searched once per removed item.
+
+        """
+        removals: dict[int, tuple[list[models.Comment | models.MoreComments], set[int]]] = {}
+        for item in more_comments:
+            removals.setdefault(id(item._remove_from), (item._remove_from, set()))[1].add(id(item))
+        for tree, item_ids in removals.values():
+            tree[:] = [comment for comment in tree if id(comment) not in item_ids]
+
+    @classmethod
+    def _batch_for(cls, batches: list[list[MoreComments]], item: MoreComments) -> list[MoreComments] | None:
+        """Return the batch in ``batches`` that can also request ``item``'s children."""
+        if not item.children:  # "continue this thread" links need their own request
+            return None
+        for batch in batches:
+            if batch[0].children and (
+                sum(len(more.children) for more in batch) + len(item.children) <= cls.MAX_CHILDREN_PER_REQUEST
+            ):
+                return batch
+        return None
+
+    @classmethod
+    def _select_unit(
+        cls, more_comments: list[MoreComments], *, batch: bool, remaining: int | None, threshold: int
+    ) -> tuple[list[MoreComments] | None, list[MoreComments]]:
+        """Pop the :class:`.MoreComments` instances to request next from the heap.
+
+        Returns the instances to request together, or ``None`` when none are left to
+        request, along with the instances that were skipped. With ``batch``, each later
+        instance whose children still fit is added to the first one, and the instances
+        that do not fit are left on the heap.
+
+        """
+        unit: list[MoreComments] | None = None
+        size = 0
+        skipped = []
+        rejected = []
+        while more_comments:
+            item = more_comments[0]
+            if unit is not None and item.count >= threshold and batch and cls._batch_for([unit], item):
+                unit.append(item)
+                size += len(item.children)
+            elif (remaining is not None and remaining <= 0) or item.count < threshold:
+                skipped.append(item)
+            elif unit is None:
+                unit = [item]
+                size = len(item.children)
+                if remaining is not None:
+                    remaining -= 1
+            elif batch and unit[0].children and size < cls.MAX_CHILDREN_PER_REQUEST:
+                rejected.append(item)
+            else:
+                break
+            heappop(more_comments)
+        for item in rejected:
+            heappush(more_comments, item)
+        return unit, skipped
+
+    def _attach_comments(self, comments: list[models.Comment | models.MoreComments]) -> None:
+        """Attach ``comments`` to their parents, which must already be in the tree."""
+        for comment in comments:
+            if comment.name in self._submission._comments_by_id:
+                raise DuplicateReplaceException
+            comment.submission = self._submission
+            parent = self._submission._comments_by_id.get(comment.parent_id)
+            (self._comments if parent is None else parent.replies._comments).append(comment)
+
+    def _fetch_more_comments(self, batch: list[MoreComments]) -> list[models.Comment | models.MoreComments]:
+        if len(batch) == 1:
+            return cast("list[models.Comment | models.MoreComments]", batch[0].comments(update=False))
+        data = {
+            "children": ",".join(child for item in batch for child in item.children),
+            "link_id": self._submission.fullname,
+            "sort": self._submission.comment_sort,
+        }
+        return self._submission._reddit.post(API_PATH["morechildren"], data=data)
+
     def __getitem__(self, index: int) -> models.Comment | models.MoreComments:
         """Return the comment at position ``index`` in the list.
 
@@ -93,11 +184,142 @@ class CommentForest:
             parent = self._submission._comments_by_id[comment.parent_id]
             parent.replies._comments.append(comment)
 
+    def _prefetch(
+        self,
+        executor: ThreadPoolExecutor,
+        more_comments: list[MoreComments],
+        *,
+        batch: bool,
+        prefetched: dict[tuple[int, ...], Future[list[models.Comment | models.MoreComments]]],
+        remaining: int | None,
+        threshold: int,
+        units: int,
+    ) -> None:
+        """Request the ``units`` that would be selected next from ``more_comments``.
+
+        ``more_comments`` is consumed. The units are those selected if the responses in
+        flight uncover no further :class:`.MoreComments` instances.
+
+        """
+        for _ in range(units):
+            unit, _ = self._select_unit(more_comments, batch=batch, remaining=remaining, threshold=threshold)
+            if unit is None:
+                return
+            if remaining is not None:
+                remaining -= 1
+            key = tuple(map(id, unit))
+            if key not in prefetched:
+                prefetched[key] = executor.submit(self._fetch_more_comments, unit)
+
     def _update(self, comments: list[models.Comment | models.MoreComments]) -> None:
         self._comments = comments
         for comment in comments:
             comment.submission = self._submission
 
+    def _walk(
+        self,
+        *,
+        breadth_first: bool,
+        max_depth: int | None,
+        predicate: Callable[[models.Comment | models.MoreComments], bool] | None,
+        replace_more: bool,
+    ) -> Iterator[models.Comment | models.MoreComments]:
+        # Each entry is the depth of a comment, the list holding it, and the comment.
+        queue = deque((0, self._comments, comment) for comment in self._comments)
+        if not breadth_first:
+            queue.reverse()
+        while queue:
+            depth, tree, comment = queue.popleft() if breadth_first else queue.pop()
+            if replace_more and isinstance(comment, MoreComments):
+                new_comments = list(self._fetch_more_comments([comment]))
+                del tree[next(index for index, item in enumerate(tree) if item is comment)]
+                self._attach_comments([item for item in new_comments if item.parent_id == comment.parent_id])
+                self._attach_comments([item for item in new_comments if item.parent_id != comment.parent_id])
+                siblings = [(depth, tree, item) for item in new_comments if item.parent_id == comment.parent_id]
+                if breadth_first:
+                    queue.extendleft(reversed(siblings))
+                else:
+                    queue.extend(reversed(siblings))
+                continue
+            if predicate is not None and not predicate(comment):
+                continue
+            yield comment
+            if isinstance(comment, MoreComments) or (max_depth is not None and depth >= max_depth):
+                continue
+            replies = comment.replies._comments
+            children = [(depth + 1, replies, reply) for reply in replies]
+            queue.extend(children if breadth_first else reversed(children))
+
+    def iter_bfs(
+        self,
+        *,
+        max_depth: int | None = None,
+        predicate: Callable[[models.Comment | models.MoreComments], bool] | None = None,
+        replace_more: bool = False,
+    ) -> Iterator[models.Comment | models.MoreComments]:
+        """Yield the comments of the forest in breadth-first order as they are reached.
+
+        :param max_depth: The maximum depth to descend to, where top-level comments have
+            a depth of ``0``. When ``None``, the whole forest is walked (default:
+            ``None``).
+        :param predicate: A callable invoked with each comment before it is yielded.
+            When it returns ``False``, the comment is not yielded and its replies are
+            not visited (default: ``None``).
+        :param replace_more: When ``True``, each :class:`.MoreComments` instance is
+            replaced in the forest as it is reached, and the comments it hides are
+            yielded in its place. Each replacement requires 1 API request (default:
+            ``False``).
+
+        Unlike :meth:`.list`, nothing is collected up front, so processing can start
+        with the first comment and stop at any time. For example, to score the
+        top-level comments and their direct replies while the rest of a large thread
+        is fetched on demand, try:
+
+        .. code-block:: python
+
+            for comment in submission.comments.iter_bfs(max_depth=1, replace_more=True):
+                print(comment.score, comment.body)
+
+        """
+        return self._walk(breadth_first=True, max_depth=max_depth, predicate=predicate, replace_more=replace_more)
+
+    def iter_dfs(
+        self,
+        *,
+        max_depth: int | None = None,
+        predicate: Callable[[models.Comment | models.MoreComments], bool] | None = None,
+        replace_more: bool = False,
+    ) -> Iterator[models.Comment | models.MoreComments]:
+        """Yield the comments of the forest in depth-first order as they are reached.
+
+        Each comment is yielded before its replies, so the order matches the order in
+        which comments are displayed on Reddit.
+
+        :param max_depth: The maximum depth to descend to, where top-level comments have
+            a depth of ``0``. When ``None``, the whole forest is walked (default:
+            ``None``).
+        :param predicate: A callable invoked with each comment before it is yielded.
+            When it returns ``False``, the comment is not yielded and its replies are
+            not visited (default: ``None``).
+        :param replace_more: When ``True``, each :class:`.MoreComments` instance is
+            replaced in the forest as it is reached, and the comments it hides are
+            yielded in its place. Each replacement requires 1 API request (default:
+            ``False``).
+
+        For example, to skip over the replies to removed comments, try:
+
+        .. code-block:: python
+
+            def not_removed(comment):
+                return getattr(comment, "body", None) != "[removed]"
+
+
+            for comment in submission.comments.iter_dfs(predicate=not_removed):
+                print(comment)
+
+        """
+        return self._walk(breadth_first=False, max_depth=max_depth, predicate=predicate, replace_more=replace_more)
+
     def list(
         self,
     ) -> list[models.Comment | models.MoreComments]:
@@ -108,17 +330,22 @@ class CommentForest:
 
         """
         comments: list[models.Comment | models.MoreComments] = []
-        queue = list(self._comments)
+        queue = deque(self._comments)
         while queue:
-            comment = queue.pop(0)
+            comment = queue.popleft()
             comments.append(comment)
             if not isinstance(comment, MoreComments):
                 queue.extend(comment.replies._comments)
         return comments
 
-    def replace_more(self, *, limit: int | None = 32, threshold: int = 0) -> list[models.MoreComments]:
+    def replace_more(
+        self, *, batch: bool = False, limit: int | None = 32, threshold: int = 0, workers: int | None = None
+    ) -> list[models.MoreComments]:
         """Update the comment forest by resolving instances of :class:`.MoreComments`.
 
+        :param batch: When ``True``, the children of several :class:`.MoreComments`
+            instances are combined into a single request of up to 100 comment IDs, and
+            ``limit`` counts requests rather than instances (default: ``False``).
         :param limit: The maximum number of :class:`.MoreComments` instances to replace.
             Each replacement requires 1 API request. Set to ``None`` to have no limit,
             or to ``0`` to remove all :class:`.MoreComments` instances without
@@ -127,11 +354,12 @@ class CommentForest:
             :class:`.MoreComments` instance must have in order to be replaced.
             :class:`.MoreComments` instances that represent "continue this thread" links
             unfortunately appear to have 0 children (default: ``0``).
+        :param workers: The maximum number of :class:`.MoreComments` instances to fetch
+            concurrently. When ``None``, they are fetched one at a time (default:
+            ``None``).
 
         :returns: A list of :class:`.MoreComments` instances that were not replaced.
 
-        :raises: ``prawcore.TooManyRequests`` when used concurrently.
-
         For example, to replace up to 32 :class:`.MoreComments` instances of a
         submission try:
 
@@ -165,6 +393,25 @@ class CommentForest:
                         print("Handling replace_more exception")
                         sleep(1)
 
+        Threads with many :class:`.MoreComments` instances that each hide only a few
+        comments can be resolved with far fewer requests by passing ``batch=True``:
+
+        .. code-block:: python
+
+            submission.comments.replace_more(batch=True, limit=None)
+
+        On large threads, the :class:`.MoreComments` instances can be fetched
+        concurrently by passing ``workers``. While one instance is being fetched, the
+        instances that would be replaced next are requested ahead of time. The instances
+        are still replaced in the same order, and the same ones are replaced, as without
+        ``workers``; a request made ahead of time is discarded when a newly uncovered
+        instance takes precedence over it. Requests are paced by the rate limiter shared
+        by all threads of the :class:`.Reddit` instance:
+
+        .. code-block:: python
+
+            submission.comments.replace_more(limit=None, workers=4)
+
         .. warning::
 
             If this method is called, and the comments are refreshed, calling this
@@ -173,32 +420,52 @@ class CommentForest:
         """
         remaining = limit
         more_comments = self._gather_more_comments(self._comments)
-        skipped = []
-
-        # Fetch largest more_comments until reaching the limit or the threshold
-        while more_comments:
-            item = heappop(more_comments)
-            if (remaining is not None and remaining <= 0) or item.count < threshold:
-                skipped.append(item)
-                item._remove_from.remove(item)
-                continue
-
-            new_comments = cast(
-                "list[models.Comment | models.MoreComments]",
-                item.comments(update=False),
-            )
-            if remaining is not None:
-                remaining -= 1
-
-            # Add new MoreComment objects to the heap of more_comments
-            for more in self._gather_more_comments(new_comments, parent_tree=self._comments):
-                more.submission = self._submission
-                heappush(more_comments, more)
-            # Insert all items into the tree
-            for comment in new_comments:
-                self._insert_comment(comment)
-
-            # Remove from forest
-            item._remove_from.remove(item)
+        skipped: list[MoreComments] = []
+        removed: list[MoreComments] = []
+        # Requests made ahead of time, keyed by the identity of the instances they fetch.
+        prefetched: dict[tuple[int, ...], Future[list[models.Comment | models.MoreComments]]] = {}
+        with ExitStack() as stack:
+            # Resolved and skipped items are removed from the forest in one pass at the end.
+            stack.callback(self._remove_more_comments, removed)
+            executor = None if workers is None else stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            stack.callback(lambda: [future.cancel() for future in prefetched.values()])
+            # Fetch largest more_comments until reaching the limit or the threshold
+            while more_comments:
+                unit, unit_skipped = self._select_unit(
+                    more_comments, batch=batch, remaining=remaining, threshold=threshold
+                )
+                skipped.extend(unit_skipped)
+                removed.extend(unit_skipped)
+                if unit is None:
+                    continue
+                if remaining is not None:
+                    remaining -= 1
+                if executor is None:
+                    new_comments = self._fetch_more_comments(unit)
+                else:
+                    future = prefetched.pop(tuple(map(id, unit)), None)
+                    if future is None:
+                        future = executor.submit(self._fetch_more_comments, unit)
+                    self._prefetch(
+                        executor,
+                        list(more_comments),
+                        batch=batch,
+                        prefetched=prefetched,
+                        remaining=remaining,
+                        threshold=threshold,
+                        units=(workers or 1) - 1,
+                    )
+                    new_comments = future.result()
+
+                # Add new MoreComment objects to the heap of more_comments
+                for more in self._gather_more_comments(new_comments, parent_tree=self._comments):
+                    more.submission = self._submission
+                    heappush(more_comments, more)
+                # Insert all items into the tree
+                for comment in new_comments:
+                    self._insert_comment(comment)
+
+                # Remove from forest
+                removed.extend(unit)
 
         return more_comments + skipped
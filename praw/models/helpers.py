@@ -408,6 +408,10 @@ class SubredditHelper(PRAWBase):
         :param display_name: The name of the subreddit.
 
         """
+        if self._reddit._identity_map is not None:
+            return self._reddit._identity_map.get(
+                Subreddit, display_name, lambda: Subreddit(self._reddit, display_name=display_name)
+            )
         return Subreddit(self._reddit, display_name=display_name)
 
     def create(
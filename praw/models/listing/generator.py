@@ -2,17 +2,62 @@
 
 from __future__ import annotations
 
+import asyncio
+import math
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict, cast
+from weakref import WeakMethod
 
 from praw.models.base import PRAWBase
-from praw.models.listing.listing import FlairListing, Listing, ModNoteListing
+from praw.models.listing.listing import FlairListing, Listing, ModmailConversationsListing, ModNoteListing
 
 if TYPE_CHECKING:
     import praw
     from praw.models.reddit.base import RedditBase
 
+# Returned by ``next`` in place of raising StopIteration, which cannot be propagated
+# through the future that ``asyncio.to_thread`` returns.
+_EXHAUSTED = object()
+
+
+def _call_weakly(method: WeakMethod, *args: Any) -> Any:
+    """Call ``method`` unless its instance has been garbage collected.
+
+    Prefetched pages are requested through this so that pages waiting to be requested
+    do not keep their :class:`.ListingGenerator` alive.
+
+    """
+    function = method()
+    if function is None:
+        return [], None
+    return function(*args)
+
+
+class _LazyChildren:
+    """The children of a listing, each objectified when it is accessed.
+
+    Each child can only be accessed once, as its data is released once its object is
+    built.
+
+    """
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the objectified child at ``index``."""
+        child, self._children[index] = self._children[index], None
+        return self._reddit._objector.objectify(data=child)
+
+    def __init__(self, reddit: praw.Reddit, children: list[dict[str, Any] | None]) -> None:
+        """Initialize a :class:`._LazyChildren` instance."""
+        self._children = children
+        self._reddit = reddit
+
+    def __len__(self) -> int:
+        """Return the number of children."""
+        return len(self._children)
+
 
 class ListingGenerator(PRAWBase, Iterator):
     """Instances of this class generate :class:`.RedditBase` instances.
@@ -24,8 +69,54 @@ class ListingGenerator(PRAWBase, Iterator):
 
     .. _here: https://praw.readthedocs.io/en/latest/search.html?q=ListingGenerator
 
+    Instances can also be consumed with ``async for``. Each request is then issued from
+    a worker thread so that the event loop is not blocked while waiting on Reddit:
+
+    .. code-block:: python
+
+        async for submission in reddit.subreddit("test").new(limit=None):
+            print(submission.title)
+
+    Pass ``raw=True`` to any method returning a :class:`.ListingGenerator` to receive
+    the data Reddit returns for each item as a ``dict`` instead:
+
+    .. code-block:: python
+
+        for comment in reddit.subreddit("test").comments(limit=None, raw=True):
+            print(comment["id"], comment["author"], comment["created_utc"])
+
+    Pass ``prefetch`` to request the following pages in a background thread while the
+    current one is being processed:
+
+    .. code-block:: python
+
+        for submission in reddit.subreddit("test").top(limit=None, prefetch=2, time_filter="all"):
+            print(submission.title)
+
+    Pages requested ahead are discarded by :meth:`.close`, which is called once the
+    generator is garbage collected.
+
     """
 
+    def __aiter__(self) -> ListingGenerator:
+        """Permit :class:`.ListingGenerator` to operate as an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> RedditBase | dict[str, Any]:
+        """Permit :class:`.ListingGenerator` to operate as an asynchronous generator."""
+        if self._listing is None or self._list_index >= len(self._listing):
+            item = await asyncio.to_thread(next, self, _EXHAUSTED)
+        else:
+            item = next(self, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            raise StopAsyncIteration
+        return cast("RedditBase | dict[str, Any]", item)
+
+    def __del__(self) -> None:
+        """Stop requesting pages ahead when the generator is garbage collected."""
+        if self.__dict__.get("_executor") is not None:
+            self.close()
+
     def __init__(
         self,
         reddit: praw.Reddit,
@@ -33,6 +124,10 @@ class ListingGenerator(PRAWBase, Iterator):
         limit: int | None = 100,
         params: dict[str, str | int] | None = None,
         request_limit: int | None = None,
+        *,
+        lazy: bool = False,
+        prefetch: int = 0,
+        raw: bool = False,
     ) -> None:
         """Initialize a :class:`.ListingGenerator` instance.
 
@@ -47,15 +142,36 @@ class ListingGenerator(PRAWBase, Iterator):
         :param request_limit: The limit provided to Reddit's API for each request. If
             ``request_limit`` is ``None``, then the value of ``limit`` will be used for
             each request.
+        :param lazy: When ``True``, each item of a page is built from the data Reddit
+            returned when it is reached, rather than all items of the page being built
+            before the first is yielded. This lowers the time until the first item is
+            yielded, and the memory used when items are discarded after they are
+            processed (default: ``False``).
+        :param prefetch: The number of pages to request ahead of the one being
+            iterated over. Each page is requested in a background thread as soon as the
+            previous one is received, so that iterating is limited by how fast items are
+            processed rather than by the time taken by each request. As every page
+            depends on the previous one, pages are still requested one at a time
+            (default: ``0``).
+        :param raw: When ``True``, yield the ``dict`` Reddit returns for each item
+            instead of building objects such as :class:`.Comment` or
+            :class:`.Submission` from it. This is considerably faster when only a few
+            fields are needed from many items. Modmail conversations are yielded without
+            their messages (default: ``False``).
 
         """
         super().__init__(reddit, _data=None)
         self._exhausted = False
-        self._listing: Listing | None = None
+        self._listing: Listing | _LazyChildren | list[dict[str, Any]] | None = None
         self._list_index: int
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: deque[Future] = deque()
         self.limit = limit
         self.params = deepcopy(params) if params else {}
+        self.lazy = lazy
         self.params["limit"] = request_limit or limit or 1024
+        self.prefetch = prefetch
+        self.raw = raw
         self.url = url
         self.yielded = 0
 
@@ -63,7 +179,7 @@ class ListingGenerator(PRAWBase, Iterator):
         """Permit :class:`.ListingGenerator` to operate as an iterator."""
         return self
 
-    def __next__(self) -> RedditBase:
+    def __next__(self) -> RedditBase | dict[str, Any]:
         """Permit :class:`.ListingGenerator` to operate as a generator."""
         if self.limit is not None and self.yielded >= self.limit:
             raise StopIteration
@@ -90,21 +206,135 @@ class ListingGenerator(PRAWBase, Iterator):
                 raise ValueError(msg)
         return listing
 
+    def _extract_lazy_sublist(
+        self, data: dict[str, Any] | list[dict[str, Any]]
+    ) -> tuple[str, Any, Listing | _LazyChildren]:
+        """Return the pagination parameter and value, and the lazy items of ``data``."""
+        if isinstance(data, list):
+            data = data[1]  # for submission duplicates
+        if data.get("kind") != "Listing":
+            # Other listings are uncommon, so they are objectified as a whole.
+            objectified = cast("Listing | dict[str, Any]", self._reddit._objector.objectify(data=data))
+            listing = self._extract_sublist(objectified)
+            return listing.AFTER_PARAM, listing.after, listing
+        listing_data: dict[str, Any] = data["data"]
+        return Listing.AFTER_PARAM, listing_data["after"], _LazyChildren(self._reddit, listing_data["children"])
+
+    def _extract_raw_sublist(
+        self, data: dict[str, Any] | list[dict[str, Any]]
+    ) -> tuple[str, Any, list[dict[str, Any]]]:
+        """Return the pagination parameter and value, and the items of raw ``data``."""
+        if isinstance(data, list):
+            data = data[1]  # for submission duplicates
+        for listing_type in [FlairListing, ModNoteListing]:
+            if listing_type.CHILD_ATTRIBUTE in data:
+                children = data[listing_type.CHILD_ATTRIBUTE]
+                # Build the listing without its children to reuse its ``after`` logic.
+                data = {key: value for key, value in data.items() if key != listing_type.CHILD_ATTRIBUTE}
+                return listing_type.AFTER_PARAM, listing_type(self._reddit, data).after, children
+        if "conversationIds" in data:  # modmail conversations
+            conversation_ids = data["conversationIds"]
+            after = conversation_ids[-1] if conversation_ids else None
+            conversations = [data["conversations"][conversation_id] for conversation_id in conversation_ids]
+            return ModmailConversationsListing.AFTER_PARAM, after, conversations
+        listing = data.get("data")
+        if not isinstance(listing, dict) or "children" not in listing:
+            msg = "The generator returned a dictionary PRAW didn't recognize. File a bug report at PRAW."
+            raise ValueError(msg)
+        # The children of a ``UserList``, e.g., banned users, are not things.
+        children = [child["data"] if "kind" in child else child for child in listing["children"]]
+        return Listing.AFTER_PARAM, listing.get("after"), children
+
+    def _fetch_after(
+        self, previous: Future
+    ) -> tuple[Listing | _LazyChildren | list[dict[str, Any]], dict[str, Any] | None]:
+        # ``previous`` has completed as the executor has a single worker.
+        listing, params = previous.result()
+        if not listing or params is None:
+            return [], None
+        return self._fetch_page(params)
+
+    def _fetch_page(
+        self, params: dict[str, Any]
+    ) -> tuple[Listing | _LazyChildren | list[dict[str, Any]], dict[str, Any] | None]:
+        """Return the items of the page requested with ``params``.
+
+        The parameters to request the following page with are returned along with the
+        items, or ``None`` if this is the last page.
+
+        """
+        if self.raw:
+            data = self._reddit.request(method="GET", params=params, path=self.url)
+            self._reddit._objector.check_error(data)
+            after_param, after, listing = self._extract_raw_sublist(data)
+        elif self.lazy:
+            data = self._reddit.request(method="GET", params=params, path=self.url)
+            self._reddit._objector.check_error(data)
+            after_param, after, listing = self._extract_lazy_sublist(data)
+        else:
+            listing = self._extract_sublist(self._reddit.get(self.url, params=params))
+            after_param, after = listing.AFTER_PARAM, listing.after
+        if after and after != params.get(after_param):
+            return listing, {**params, after_param: after}
+        return listing, None
+
     def _next_batch(self) -> None:
         if self._exhausted:
             raise StopIteration
 
-        listing = self._reddit.get(self.url, params=self.params)
-        self._listing = self._extract_sublist(listing)
+        if self.prefetch:
+            self._listing, next_params = self._next_prefetched_page()
+        else:
+            self._listing, next_params = self._fetch_page(self.params)
         self._list_index = 0
 
         if not self._listing:
             raise StopIteration
 
-        if self._listing.after and self._listing.after != self.params.get(self._listing.AFTER_PARAM):
-            self.params[self._listing.AFTER_PARAM] = self._listing.after
-        else:
+        if next_params is None:
             self._exhausted = True
+        else:
+            self.params = next_params
+
+    def _next_prefetched_page(self) -> tuple[Listing | _LazyChildren | list[dict[str, Any]], dict[str, Any] | None]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        if not self._pending:
+            self._pending.append(self._executor.submit(_call_weakly, WeakMethod(self._fetch_page), self.params))
+        current = self._pending.popleft()
+        try:
+            listing, next_params = current.result()
+        except BaseException:
+            # The following pages depend on this one, so they are all requested again.
+            self.close()
+            raise
+        pages = self.prefetch
+        if next_params is None:
+            pages = 0
+        elif self.limit is not None:
+            remaining = self.limit - self.yielded - len(listing)
+            pages = min(pages, max(0, math.ceil(remaining / int(self.params["limit"]))))
+        previous = self._pending[-1] if self._pending else current
+        while len(self._pending) < pages:
+            previous = self._executor.submit(_call_weakly, WeakMethod(self._fetch_after), previous)
+            self._pending.append(previous)
+        if not self._pending or next_params is None:
+            self.close()
+        return listing, next_params
+
+    def close(self) -> None:
+        """Stop requesting pages ahead of the one being iterated over.
+
+        This is called when the generator is garbage collected, e.g., after breaking out
+        of a loop over it. Iterating again requests the following pages as needed.
+
+        """
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
 
 class ListingGeneratorKwargs(TypedDict, total=False):
@@ -114,5 +344,8 @@ class ListingGeneratorKwargs(TypedDict, total=False):
 
     """
 
+    lazy: bool
     limit: int | None
     params: dict[str, str | int] | None
+    prefetch: int
+    raw: bool
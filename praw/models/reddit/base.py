@@ -16,6 +16,14 @@ if TYPE_CHECKING:
 class RedditBase(PRAWBase):
     """Base class that represents actual Reddit objects."""
 
+    # Whether full payloads of this kind are merged into the identity map when it is
+    # enabled.
+    _identity_mapped = False
+
+    if TYPE_CHECKING:
+        # The instances to fetch along with this one, set by :meth:`.Reddit.hydrate`.
+        _siblings: list[RedditBase]
+
     @staticmethod
     def _url_parts(url: str) -> list[str]:
         parsed = urlparse(url)
@@ -32,7 +40,11 @@ class RedditBase(PRAWBase):
     def __getattr__(self, attribute: str) -> Any:
         """Return the value of ``attribute``."""
         if not attribute.startswith("_") and not self._fetched:
-            self._fetch()
+            siblings = self.__dict__.pop("_siblings", None)
+            if siblings:
+                self._reddit.hydrate(siblings)
+            else:
+                self._fetch()
             return getattr(self, attribute)
         msg = f"{self.__class__.__name__!r} object has no attribute {attribute!r}"
         raise AttributeError(msg)
@@ -83,6 +95,10 @@ class RedditBase(PRAWBase):
         path = API_PATH[name].format(**fields)
         return self._reddit.request(method="GET", params=params, path=path)
 
+    def _hydrate(self, other: RedditBase) -> None:
+        self.__dict__.update(other.__dict__)
+        self._fetched = True
+
     def _reset_attributes(self, *attributes: str) -> None:
         for attribute in attributes:
             if attribute in self.__dict__:
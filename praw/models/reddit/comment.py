@@ -9,6 +9,7 @@ from praw.exceptions import ClientException, InvalidURL
 from praw.models.comment_forest import CommentForest
 from praw.models.reddit.base import RedditBase
 from praw.models.reddit.mixins import (
+    CompactMixin,
     CreatedMixin,
     FullnameMixin,
     InboxableMixin,
@@ -23,7 +24,7 @@ if TYPE_CHECKING:
     from praw import models
 
 
-class Comment(InboxableMixin, UserContentMixin, FullnameMixin, CreatedMixin, RedditBase):
+class Comment(InboxableMixin, UserContentMixin, FullnameMixin, CreatedMixin, CompactMixin, RedditBase):
     """A class that represents a Reddit comment.
 
     .. include:: ../../typical_attributes.rst
@@ -66,6 +67,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, CreatedMixin, Red
 
     MISSING_COMMENT_MESSAGE = "This comment does not appear to be in the comment tree"
     STR_FIELD = "id"
+    _compact_eager_attributes = frozenset({"replies"})
 
     @staticmethod
     def id_from_url(url: str) -> str:
@@ -174,7 +176,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, CreatedMixin, Red
         attribute: str,
         value: Any,
     ) -> None:
-        """Objectify author, replies, and subreddit."""
+        """Objectify author, replies, and subreddit, and store compact attributes."""
         if attribute == "author":
             value = Redditor.from_data(self._reddit, value)
         elif attribute == "replies":
@@ -183,10 +185,13 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, CreatedMixin, Red
             attribute = "_replies"
         elif attribute == "subreddit":
             value = self._reddit.subreddit(value)
+        if self._compact is not None and self._compact.holds(attribute):
+            self._compact.set(attribute, value)
+            return
         super().__setattr__(attribute, value)
 
     def _extract_submission_id(self) -> str:
-        if "context" in self.__dict__:
+        if self._has_attribute("context"):
             return self.context.rsplit("/", 4)[1]
         return self.link_id.split("_", 1)[1]
 
@@ -282,7 +287,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, CreatedMixin, Red
             comment.refresh()
 
         """
-        if "context" in self.__dict__:  # Using hasattr triggers a fetch
+        if self._has_attribute("context"):  # Using hasattr triggers a fetch
             comment_path = self.context.split("?", 1)[0]
         else:
             path = API_PATH["submission"].format(id=self.submission.id)
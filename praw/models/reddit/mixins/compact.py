@@ -0,0 +1,119 @@
+"""Provide the CompactMixin class."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import praw
+
+_DELETED = object()
+
+
+@lru_cache(maxsize=1024)
+def _layout(keys: tuple[str, ...]) -> dict[str, int]:
+    """Return the index of each key, shared by every record with the same keys."""
+    return {key: index for index, key in enumerate(keys)}
+
+
+class _CompactRecord:
+    """The raw attributes of an object stored in a list.
+
+    Objects built from responses with the same fields share the mapping from field name
+    to list index, so each record only costs a list of values and a byte per field
+    recording whether the value has been materialized.
+
+    """
+
+    __slots__ = ("_layout", "_materialized", "_values")
+
+    def __contains__(self, attribute: str) -> bool:
+        index = self._layout.get(attribute)
+        return index is not None and self._values[index] is not _DELETED
+
+    def __getstate__(self) -> tuple[dict[str, int], list[Any], bytearray]:
+        return self._layout, self._values, self._materialized
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._layout = _layout(tuple(data))
+        self._values = list(data.values())
+        self._materialized = bytearray(len(self._values))
+
+    def __setstate__(self, state: tuple[dict[str, int], list[Any], bytearray]) -> None:
+        self._layout, self._values, self._materialized = state
+
+    def delete(self, attribute: str) -> None:
+        self._values[self._layout[attribute]] = _DELETED
+
+    def get(self, attribute: str) -> tuple[Any, bool]:
+        index = self._layout[attribute]
+        return self._values[index], bool(self._materialized[index])
+
+    def holds(self, attribute: str) -> bool:
+        """Return whether ``attribute`` belongs in the record, even if deleted."""
+        return attribute in self._layout
+
+    def set(self, attribute: str, value: Any) -> None:
+        index = self._layout[attribute]
+        self._values[index] = value
+        self._materialized[index] = True
+
+
+class CompactMixin:
+    """Interface for classes that can store their attributes in a compact record.
+
+    When the ``compact_models`` configuration option is enabled, the attributes Reddit
+    provides are kept in a single record instead of the instance's ``__dict__``. Each
+    attribute is converted on first access, so, for example, the :class:`.Redditor`
+    for ``author`` is only created when ``author`` is used. Accessing an attribute in
+    this way is slower than a regular attribute lookup.
+
+    Host classes must store an attribute with ``_compact.set`` from their
+    ``__setattr__`` when ``_compact.holds`` it. This is not done here so that
+    non-compact instances do not pay for an extra ``__setattr__`` call per attribute.
+
+    """
+
+    #: The record holding the attributes, or ``None`` when the instance is not compact.
+    _compact: _CompactRecord | None = None
+    #: Attributes that are set on the instance even when it is compact.
+    _compact_eager_attributes: frozenset[str] = frozenset()
+
+    if TYPE_CHECKING:
+        # Provided by the host class (:class:`.RedditBase`).
+        STR_FIELD: str
+
+    def __delattr__(self, attribute: str) -> None:
+        """Delete ``attribute`` from the record if it is stored there."""
+        if self._compact is not None and attribute not in self.__dict__ and attribute in self._compact:
+            self._compact.delete(attribute)
+            return
+        super().__delattr__(attribute)
+
+    def __getattr__(self, attribute: str) -> Any:
+        """Return the value of ``attribute``, materializing it from the record."""
+        record = self._compact
+        if record is not None and attribute in record:
+            value, materialized = record.get(attribute)
+            if materialized:
+                return value
+            setattr(self, attribute, value)
+            return record.get(attribute)[0]
+        return super().__getattr__(attribute)  # pyright: ignore[reportAttributeAccessIssue]  # provided by the host class (RedditBase)
+
+    def __init__(self, reddit: praw.Reddit, _data: dict[str, Any] | None, **kwargs: Any) -> None:
+        """Initialize the instance, storing ``_data`` in a record when compact.
+
+        :param reddit: An instance of :class:`.Reddit`.
+
+        """
+        if _data and reddit.config.compact_models:
+            eager = self._compact_eager_attributes | {self.STR_FIELD}
+            self._compact = _CompactRecord({key: value for key, value in _data.items() if key not in eager})
+            _data = {key: value for key, value in _data.items() if key in eager}
+        super().__init__(reddit, _data=_data, **kwargs)  # pyright: ignore[reportCallIssue]  # the host class (RedditBase) takes these arguments
+
+    def _has_attribute(self, attribute: str) -> bool:
+        """Return whether ``attribute`` is set without triggering a fetch."""
+        return attribute in self.__dict__ or (self._compact is not None and attribute in self._compact)
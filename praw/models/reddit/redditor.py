@@ -66,12 +66,15 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, CreatedMix
     """
 
     STR_FIELD = "name"
+    _identity_mapped = True
 
     @classmethod
     def from_data(cls, reddit: praw.Reddit, data: str) -> Redditor | None:
         """Return an instance of :class:`.Redditor`, or ``None`` from ``data``."""
         if data == "[deleted]":
             return None
+        if reddit._identity_map is not None:
+            return reddit._identity_map.get(cls, data, lambda: cls(reddit, data))
         return cls(reddit, data)
 
     @cachedproperty
@@ -16,6 +16,7 @@ from praw.models.listing.listing import Listing
 from praw.models.listing.mixins import SubmissionListingMixin
 from praw.models.reddit.base import RedditBase
 from praw.models.reddit.mixins import (
+    CompactMixin,
     CreatedMixin,
     FullnameMixin,
     ModNoteMixin,
@@ -43,7 +44,7 @@ MEDIA_TYPE_MAPPING = {
 }
 
 
-class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, CreatedMixin, RedditBase):
+class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, CreatedMixin, CompactMixin, RedditBase):
     """A class for submissions to Reddit.
 
     .. include:: ../../typical_attributes.rst
@@ -250,16 +251,19 @@ class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, Create
         self._comments_by_id = {}
 
     def __setattr__(self, attribute: str, value: Any) -> None:
-        """Objectify author, subreddit, and poll data attributes."""
+        """Objectify author, subreddit, and poll data, and store compact attributes."""
         if attribute == "author":
             value = Redditor.from_data(self._reddit, value)
         elif attribute == "subreddit":
-            value = Subreddit(self._reddit, value)
+            value = self._reddit.subreddit(value)
         elif attribute == "poll_data":
             value = PollData(self._reddit, value)
         elif attribute in {"comment_limit", "comment_sort"} and getattr(self, "_fetched", False):
             msg = f"Cannot update {attribute!r} because the comments for this submission have already been fetched."
             raise ClientException(msg)
+        if self._compact is not None and self._compact.holds(attribute):
+            self._compact.set(attribute, value)
+            return
         super().__setattr__(attribute, value)
 
     def _chunk(
@@ -378,6 +382,14 @@ class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, Create
             {"limit": self.comment_limit, "sort": self.comment_sort},
         )
 
+    def _hydrate(self, other: Submission) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]  # only called with a Submission of the same ID
+        # Leave the submission unfetched so that its comments are fetched on access.
+        del other.comment_limit
+        del other.comment_sort
+        del other._additional_fetch_params
+        del other._comments_by_id
+        self.__dict__.update(other.__dict__)
+
     def _replace_richtext_links(self, richtext_json: dict) -> None:
         parsed_media_types = {
             media_id: MEDIA_TYPE_MAPPING[value["e"]] for media_id, value in self.media_metadata.items()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from praw.models.util import stream_generator
 
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 class SubredditStream:
     """Provides submission and comment streams."""
 
+    # Front pages whose items cannot be told apart from those of other subreddits by
+    # the subreddit they were made in, so missed items cannot be recovered.
+    FILL_GAPS_UNSUPPORTED = frozenset({"friends", "mod", "popular"})
+
     def __init__(self, subreddit: models.Subreddit) -> None:
         """Initialize a :class:`.SubredditStream` instance.
 
@@ -23,18 +27,47 @@ class SubredditStream:
         """
         self.subreddit = subreddit
 
-    def comments(self, **stream_options: Any) -> Iterator[models.Comment]:
+    def _add_backfill(self, stream_options: dict[str, Any]) -> None:
+        if str(self.subreddit).lower() in self.FILL_GAPS_UNSUPPORTED:
+            msg = f"'fill_gaps' is not supported for r/{self.subreddit}."
+            raise ValueError(msg)
+        stream_options["backfill"] = self._backfill
+
+    def _backfill(self, fullnames: Iterator[str]) -> Iterator[models.Comment | models.Submission]:
+        names = str(self.subreddit).lower().split("+")
+        excluded: set[str] = set()
+        if names[0].startswith("all-"):
+            excluded = set(names[0].split("-")[1:])
+            names[0] = "all"
+        # Only comment and submission fullnames are requested.
+        items = cast("Iterator[models.Comment | models.Submission]", self.subreddit._reddit.info(fullnames=fullnames))
+        for item in items:
+            name = item.subreddit.display_name.lower()
+            if name in names or ("all" in names and name not in excluded):
+                yield item
+
+    def comments(self, *, fill_gaps: bool = False, **stream_options: Any) -> Iterator[models.Comment]:
         """Yield new comments as they become available.
 
         Comments are yielded oldest first. Up to 100 historical comments will initially
         be returned.
 
-        Keyword arguments are passed to :func:`.stream_generator`.
+        :param fill_gaps: When ``True``, comments missed because more of them were made
+            between two requests than a response can hold are fetched by ID with
+            :meth:`.Reddit.info` and yielded in order. As comment IDs are shared by all
+            of Reddit, this costs one request per 100 comments made anywhere on Reddit
+            during the gap, so it is best suited to busy streams such as r/all. It is not
+            supported for r/friends, r/mod, and r/popular (default: ``False``).
+
+        Additional keyword arguments are passed to :func:`.stream_generator`.
 
         .. note::
 
             While PRAW tries to catch all new comments, some high-volume streams,
-            especially the r/all stream, may drop some comments.
+            especially the r/all stream, may drop some comments. Passing
+            ``adaptive=True`` reduces how many are dropped by requesting comments again
+            before a page of results can fill up, and ``fill_gaps=True`` recovers those
+            that still are.
 
         For example, to retrieve all new comments made to r/test, try:
 
@@ -53,20 +86,30 @@ class SubredditStream:
                 print(comment)
 
         """
+        if fill_gaps:
+            self._add_backfill(stream_options)
         return stream_generator(self.subreddit.comments, **stream_options)
 
-    def submissions(self, **stream_options: Any) -> Iterator[models.Submission]:
+    def submissions(self, *, fill_gaps: bool = False, **stream_options: Any) -> Iterator[models.Submission]:
         r"""Yield new :class:`.Submission`\ s as they become available.
 
         Submissions are yielded oldest first. Up to 100 historical submissions will
         initially be returned.
 
-        Keyword arguments are passed to :func:`.stream_generator`.
+        :param fill_gaps: When ``True``, submissions missed because more of them were
+            made between two requests than a response can hold are fetched by ID with
+            :meth:`.Reddit.info` and yielded in order. As submission IDs are shared by
+            all of Reddit, this costs one request per 100 submissions made anywhere on
+            Reddit during the gap. It is not supported for r/friends, r/mod, and
+            r/popular (default: ``False``).
+
+        Additional keyword arguments are passed to :func:`.stream_generator`.
 
         .. note::
 
             While PRAW tries to catch all new submissions, some high-volume streams,
-            especially the r/all stream, may drop some submissions.
+            especially the r/all stream, may drop some submissions, unless
+            ``fill_gaps=True`` is passed.
 
         For example, to retrieve all new submissions made to all of Reddit, try:
 
@@ -76,4 +119,6 @@ class SubredditStream:
                 print(submission)
 
         """
+        if fill_gaps:
+            self._add_backfill(stream_options)
         return stream_generator(self.subreddit.new, **stream_options)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from json import dumps, loads
+from json import dumps
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast, overload
 from urllib.parse import urljoin
@@ -118,6 +118,7 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, CreatedM
     MAX_CAPTION_LENGTH = 180
     MESSAGE_PREFIX = "#"
     STR_FIELD = "display_name"
+    _identity_mapped = True
 
     # Bound at import time by the submission and collections modules to avoid circular
     # imports.
@@ -621,7 +622,7 @@ class Subreddit(MessageableMixin, SubredditListingMixin, FullnameMixin, CreatedM
             return None
 
         try:
-            ws_update = loads(connection.recv())
+            ws_update = self._reddit._json_loads(connection.recv())
             connection.close()
         except (OSError, websocket.WebSocketException, BlockingIOError):
             msg = "Websocket error. Check your media file. Your post may still have been created."
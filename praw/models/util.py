@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import math
 import random
 import time
-from collections import OrderedDict
+from collections import OrderedDict, UserList, deque
+from heapq import heappop, heappush
+from itertools import count
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Iterator
+
+    import praw
+    from praw.util.checkpoint import BaseCheckpoint
+
+_EXHAUSTED = object()
 
 
 class BoundedSet:
@@ -40,6 +49,97 @@ class BoundedSet:
             self._set.popitem(last=False)
 
 
+class DedupWindow:
+    """A compact window of the most recently used items.
+
+    Streams use it to remember the items they have already yielded. It behaves like a
+    :class:`.BoundedSet`, but fullnames, e.g., ``"t1_c5s96e0"``, are stored as integers,
+    which take about half the memory of the equivalent strings.
+
+    The order of use is kept in a :py:class:`~collections.deque` to which a key is
+    appended each time it is used, rather than in an
+    :py:class:`~collections.OrderedDict`, which needs a linked list node per item.
+    Earlier occurrences of a key are skipped when evicting, and dropped once the deque
+    grows to twice the size of the window.
+
+    """
+
+    # The values stored in ``_items``: each occurrence of the key in ``_order`` adds
+    # ``_OCCURRENCE``, and ``_ENCODED`` is set when the key is an encoded fullname.
+    _ENCODED = 1
+    _OCCURRENCE = 2
+
+    @staticmethod
+    def _key(item: Any) -> Any:
+        if type(item) is str and item[:1] == "t" and item[2:3] == "_":
+            try:
+                return int(item[3:], base=36) << 4 | int(item[1])
+            except ValueError:
+                pass
+        return item
+
+    def __contains__(self, item: Any) -> bool:
+        """Test if the :class:`.DedupWindow` contains item."""
+        key = self._key(item)
+        if key not in self._items:
+            return False
+        self._use(key)
+        return True
+
+    def __init__(self, max_items: int) -> None:
+        """Initialize a :class:`.DedupWindow` instance.
+
+        :param max_items: The number of items to hold.
+
+        """
+        self.max_items = max_items
+        self._items: dict[Any, int] = {}
+        self._order: deque[Any] = deque()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items of the :class:`.DedupWindow`, least recent first."""
+        remaining: dict[Any, int] = {}
+        for key in self._order:
+            value = remaining.get(key, self._items[key]) - self._OCCURRENCE
+            remaining[key] = value
+            if value < self._OCCURRENCE:
+                yield f"t{key & 15}_{_to_base36(key >> 4)}" if value else key
+
+    def __len__(self) -> int:
+        """Return the number of items in the :class:`.DedupWindow`."""
+        return len(self._items)
+
+    def _compact(self) -> None:
+        keys = list(dict.fromkeys(reversed(self._order)))
+        keys.reverse()
+        for key in keys:
+            self._items[key] = self._OCCURRENCE | self._items[key] & self._ENCODED
+        self._order = deque(keys)
+
+    def _use(self, key: Any) -> None:
+        self._items[key] += self._OCCURRENCE
+        self._order.append(key)
+        if len(self._order) > 2 * self.max_items:
+            self._compact()
+
+    def add(self, item: Any) -> None:
+        """Add an item to the window discarding the least recent item if necessary."""
+        key = self._key(item)
+        if key in self._items:
+            self._use(key)
+            return
+        # ``_key`` returns ``item`` itself unless it was encoded.
+        self._items[key] = self._OCCURRENCE | self._ENCODED if key is not item else self._OCCURRENCE
+        self._order.append(key)
+        while len(self._items) > self.max_items:
+            oldest = self._order.popleft()
+            value = self._items[oldest] - self._OCCURRENCE
+            if value < self._OCCURRENCE:
+                del self._items[oldest]
+            else:
+                self._items[oldest] = value
+
+
 class ExponentialCounter:
     """A class to provide an exponential counter with jitter."""
 
@@ -68,6 +168,416 @@ class ExponentialCounter:
         self._base = 1
 
 
+class StreamBatch(UserList):
+    """The new items of a single response, as yielded by :func:`.stream_generator`.
+
+    Along with the items, oldest first, a :class:`.StreamBatch` holds information about
+    the response they were found in.
+
+    """
+
+    def __init__(self, items: Iterable[Any], *, fill_ratio: float, gap_suspected: bool, latency: float) -> None:
+        """Initialize a :class:`.StreamBatch` instance.
+
+        :param items: The new items.
+        :param fill_ratio: The number of items in the response, new or not, divided by
+            the number of items requested. A ratio of ``1`` means that more items may
+            have been available.
+        :param gap_suspected: Whether the response was full and shared no items with the
+            previous responses, suggesting that items were missed.
+        :param latency: The number of seconds it took to fetch the response.
+
+        """
+        super().__init__(items)
+        self.fill_ratio = fill_ratio
+        self.gap_suspected = gap_suspected
+        self.latency = latency
+
+
+class _StreamPoller:
+    """Fetch the new items of a stream one request at a time.
+
+    This holds the state kept between requests by :func:`.stream_generator` and
+    :class:`.StreamScheduler`, along with an estimate of the rate at which new items
+    arrive.
+
+    """
+
+    #: The bounds of the delay, in seconds, between the requests of an adaptive stream.
+    MAX_INTERVAL = 60
+    MIN_INTERVAL = 1
+    MIN_PAGE_SIZE = 25
+    PAGE_SIZE = 100
+    #: The weight given to the latest observation when updating the arrival rate.
+    RATE_SMOOTHING = 0.3
+
+    def __init__(
+        self,
+        function: Callable,
+        *,
+        attribute_name: str = "fullname",
+        backfill: Callable[[Iterator[str]], Iterable[Any]] | None = None,
+        continue_after_id: str | None = None,
+        dedup_window: int = 301,
+        exclude_before: bool = False,
+        function_kwargs: dict[str, Any],
+    ) -> None:
+        self.attribute_name = attribute_name
+        self.backfill = backfill
+        self.before_attribute = continue_after_id
+        self.exclude_before = exclude_before
+        self.function = function
+        self.fill_ratio = 0.0
+        self.function_kwargs = function_kwargs
+        self.gap_suspected = False
+        self.last_poll: float | None = None
+        self.latency = 0.0
+        self.newest_fullname: tuple[str, int] | None = None
+        self.overflowed = False
+        self.rate: float | None = None
+        self.seen_attributes = DedupWindow(dedup_window)
+        self.without_before_counter = 0
+
+    def _fill_gap(self, new_items: list[Any]) -> list[Any]:
+        """Return the items missed between the newest seen item and ``new_items``."""
+        assert self.backfill is not None
+        assert self.newest_fullname is not None
+        prefix, newest_id = self.newest_fullname
+        oldest_prefix, oldest_id = _parse_fullname(new_items[0].fullname)
+        if oldest_prefix != prefix or oldest_id <= newest_id + 1:
+            return []
+        fullnames = (f"{prefix}_{_to_base36(number)}" for number in range(newest_id + 1, oldest_id))
+        recovered = []
+        for item in self.backfill(fullnames):
+            attribute = getattr(item, self.attribute_name)
+            if attribute in self.seen_attributes:
+                continue
+            self.seen_attributes.add(attribute)
+            recovered.append(item)
+        return recovered
+
+    def _update_newest_fullname(self, new_items: list[Any]) -> None:
+        for item in new_items:
+            prefix, number = _parse_fullname(item.fullname)
+            if self.newest_fullname is None or number > self.newest_fullname[1]:
+                self.newest_fullname = prefix, number
+
+    def _update_rate(self, *, new_items: int, overflowed: bool) -> None:
+        now = time.monotonic()
+        # The first response holds items that existed before the stream started, so it
+        # says nothing about how fast new items arrive.
+        if self.last_poll is not None and now > self.last_poll:
+            observed = new_items / (now - self.last_poll)
+            if overflowed:
+                # More items arrived than the page could hold.
+                observed *= 2
+            if self.rate is None:
+                self.rate = observed
+            else:
+                self.rate += self.RATE_SMOOTHING * (observed - self.rate)
+        self.last_poll = now
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Continue from a ``state`` returned by :meth:`.state`."""
+        self.before_attribute = state["before"]
+        for attribute in state["seen"]:
+            self.seen_attributes.add(attribute)
+
+    def state(self, *, before: str | None, unprocessed: list[Any]) -> dict[str, Any]:
+        """Return the state needed to continue the stream after ``before``.
+
+        :param before: The ID of the last item that was processed.
+        :param unprocessed: The items already fetched that have not been processed. They
+            are left out of the dedup window so that they are yielded again.
+
+        """
+        excluded = {getattr(item, self.attribute_name) for item in unprocessed}
+        return {
+            "before": before,
+            "seen": [attribute for attribute in self.seen_attributes if attribute not in excluded],
+        }
+
+    def interval(self, *, maximum: float, minimum: float) -> float:
+        """Return how long to wait for about half a page of new items to arrive.
+
+        Until the arrival rate has been observed, ``minimum`` is returned. When the
+        previous response was full, ``0`` is returned so that the remaining items are
+        fetched right away.
+
+        """
+        if self.overflowed:
+            return 0
+        if self.rate is None:
+            return minimum
+        if self.rate <= 0:
+            return maximum
+        return min(maximum, max(minimum, self.PAGE_SIZE / 2 / self.rate))
+
+    def page_size(self) -> int:
+        """Return a ``limit`` large enough for the items expected by now.
+
+        The page only shrinks when the request continues from a known item, so that a
+        full page is followed up by the next request rather than lost.
+
+        """
+        if self.before_attribute is None or self.exclude_before or self.last_poll is None or self.rate is None:
+            return self.PAGE_SIZE
+        expected = self.rate * (time.monotonic() - self.last_poll)
+        return min(self.PAGE_SIZE, max(self.MIN_PAGE_SIZE, math.ceil(2 * expected)))
+
+    def poll(self, *, limit: int | None = None) -> list[Any]:
+        """Issue a single request and return the new items, oldest first.
+
+        :param limit: The number of items to request (default: ``PAGE_SIZE``).
+
+        """
+        limit = self.PAGE_SIZE if limit is None else limit
+        continues = self.before_attribute is not None and not self.exclude_before
+        if self.before_attribute is None:
+            limit -= self.without_before_counter
+            self.without_before_counter = (self.without_before_counter + 1) % 30
+        if not self.exclude_before:
+            self.function_kwargs["params"] = {"before": self.before_attribute}
+        had_seen = len(self.seen_attributes) > 0
+        start = time.monotonic()
+        items = list(self.function(limit=limit, **self.function_kwargs))
+        self.latency = time.monotonic() - start
+        self.fill_ratio = len(items) / limit
+        new_items = []
+        for item in reversed(items):
+            attribute = getattr(item, self.attribute_name)
+            if attribute in self.seen_attributes:
+                continue
+            self.seen_attributes.add(attribute)
+            new_items.append(item)
+        self.before_attribute = getattr(new_items[-1], self.attribute_name) if new_items else None
+        self.overflowed = len(new_items) >= limit
+        self._update_rate(new_items=len(new_items), overflowed=self.overflowed)
+        # A full page that does not continue from a known item and shares no items with
+        # the previous responses suggests that items were missed in between.
+        self.gap_suspected = had_seen and self.overflowed and not continues
+        if self.backfill is not None and new_items:
+            if self.gap_suspected and self.newest_fullname is not None:
+                new_items = self._fill_gap(new_items) + new_items
+            self._update_newest_fullname(new_items)
+        return new_items
+
+
+class StreamScheduler:
+    """Follow many streams from a single thread.
+
+    Rather than dedicating a :func:`.stream_generator`, and therefore a thread, to each
+    stream, a :class:`.StreamScheduler` polls every stream that has been added to it in
+    turn. Each stream is polled at its own interval, which adapts to how often new items
+    arrive: busy streams are polled often enough for new items to fit in a single
+    response, and quiet streams are polled rarely. Requests are additionally spaced out
+    so that the scheduler uses no more than ``request_budget`` of the rate limit.
+
+    For example, to follow the comments and submissions of several subreddits along with
+    the authenticated user's unread messages, try:
+
+    .. code-block:: python
+
+        from praw.models.util import StreamScheduler
+
+        scheduler = StreamScheduler(reddit)
+        for name in ["AskReddit", "news", "pics"]:
+            subreddit = reddit.subreddit(name)
+            scheduler.add(subreddit.comments, key=(name, "comments"))
+            scheduler.add(subreddit.new, key=(name, "submissions"))
+        scheduler.add(reddit.inbox.unread, key="inbox")
+
+        for key, item in scheduler:
+            print(key, item)
+
+    """
+
+    def __init__(
+        self,
+        reddit: praw.Reddit,
+        *,
+        exception_handler: Callable[[Exception], None] | None = None,
+        max_interval: float = 60,
+        min_interval: float = 1,
+        request_budget: float = 1.0,
+    ) -> None:
+        """Initialize a :class:`.StreamScheduler` instance.
+
+        :param reddit: An instance of :class:`.Reddit`.
+        :param exception_handler: A callable that is invoked with the exception raised
+            while polling a stream, instead of letting it propagate. The stream is
+            polled again after its usual interval. When ``None``, exceptions propagate
+            and end the iteration; iterating over the scheduler again resumes every
+            stream (default: ``None``).
+        :param max_interval: The maximum number of seconds between two polls of a
+            stream (default: ``60``).
+        :param min_interval: The minimum number of seconds between two polls of a
+            stream (default: ``1``).
+        :param request_budget: The fraction of the rate limit the scheduler may use.
+            Lower values leave requests available for other uses of ``reddit``
+            (default: ``1.0``).
+
+        """
+        self._exception_handler = exception_handler
+        self._next_request = 0.0
+        self._order = count()
+        self._queue: list[tuple[float, int, Hashable]] = []
+        self._reddit = reddit
+        self._skip_existing: set[Hashable] = set()
+        self._streams: dict[Hashable, _StreamPoller] = {}
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+        self.request_budget = request_budget
+
+    def __iter__(self) -> Iterator[tuple[Hashable, Any]]:
+        """Yield a ``(key, item)`` tuple for each new item of every stream.
+
+        Iteration ends once every stream has been removed.
+
+        """
+        while self._queue:
+            due, _, key = heappop(self._queue)
+            if key not in self._streams:
+                continue  # Removed while queued
+            poller = self._streams[key]
+            delay = max(due, self._next_request) - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                items = poller.poll()
+            except Exception as exception:
+                if self._exception_handler is None:
+                    self._schedule(key, poller)
+                    raise
+                self._exception_handler(exception)
+                items = []
+            self._schedule(key, poller)
+            if key in self._skip_existing:
+                self._skip_existing.discard(key)
+                continue
+            for item in items:
+                yield key, item
+
+    def _request_spacing(self) -> float:
+        """Return the number of seconds to leave between requests."""
+        assert self._reddit._core is not None
+        rate_limiter = self._reddit._core._rate_limiter
+        if rate_limiter.remaining is None or rate_limiter.used is None:
+            return 0
+        requests_per_window = (rate_limiter.remaining + rate_limiter.used) * self.request_budget
+        return rate_limiter.window_size / max(requests_per_window, 1)
+
+    def _schedule(self, key: Hashable, poller: _StreamPoller) -> None:
+        now = time.monotonic()
+        self._next_request = now + self._request_spacing()
+        due = now + poller.interval(maximum=self.max_interval, minimum=self.min_interval)
+        heappush(self._queue, (due, next(self._order), key))
+
+    def add(
+        self,
+        function: Callable,
+        *,
+        attribute_name: str = "fullname",
+        continue_after_id: str | None = None,
+        dedup_window: int = 301,
+        exclude_before: bool = False,
+        key: Hashable | None = None,
+        skip_existing: bool = False,
+        **function_kwargs: Any,
+    ) -> None:
+        """Add a stream of the items returned by ``function``.
+
+        :param function: A callable that returns a :class:`.ListingGenerator`, e.g.,
+            :meth:`.Subreddit.comments` or :meth:`.Subreddit.new`.
+        :param attribute_name: The field to use as an ID (default: ``"fullname"``).
+        :param continue_after_id: The initial item ID value to use for ``before`` in
+            ``params``. The stream will continue from the item following this one
+            (default: ``None``).
+        :param dedup_window: The number of most recently seen items remembered to avoid
+            yielding an item twice (default: ``301``).
+        :param exclude_before: When ``True`` does not pass ``params`` to ``function``
+            (default: ``False``).
+        :param key: The value yielded along with each item of this stream, and used to
+            remove it. When ``None``, ``function`` is used (default: ``None``).
+        :param skip_existing: When ``True``, this does not yield any results from the
+            first request thereby skipping any items that existed in the stream prior to
+            starting the stream (default: ``False``).
+
+        Additional keyword arguments will be passed to ``function``.
+
+        The stream is first polled as soon as possible.
+
+        """
+        key = function if key is None else key
+        if key in self._streams:
+            msg = f"A stream with key {key!r} has already been added."
+            raise ValueError(msg)
+        poller = _StreamPoller(
+            function,
+            attribute_name=attribute_name,
+            continue_after_id=continue_after_id,
+            dedup_window=dedup_window,
+            exclude_before=exclude_before,
+            function_kwargs=function_kwargs,
+        )
+        self._streams[key] = poller
+        if skip_existing:
+            self._skip_existing.add(key)
+        heappush(self._queue, (time.monotonic(), next(self._order), key))
+
+    def remove(self, key: Hashable) -> None:
+        """Stop polling the stream added with ``key``.
+
+        :param key: The ``key`` of the stream, or its ``function`` if no ``key`` was
+            given to :meth:`.add`.
+
+        """
+        del self._streams[key]
+        self._skip_existing.discard(key)
+
+
+def _parse_fullname(fullname: str) -> tuple[str, int]:
+    prefix, _, base36_id = fullname.partition("_")
+    return prefix, int(base36_id, base=36)
+
+
+def _to_base36(number: int) -> str:
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append("0123456789abcdefghijklmnopqrstuvwxyz"[remainder])
+        if not number:
+            return "".join(reversed(digits))
+
+
+async def async_iterator(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Yield the items of a blocking ``iterator`` without blocking the event loop.
+
+    :param iterator: An iterator whose ``__next__`` may block, e.g., the result of
+        :func:`.stream_generator` or a :class:`.ListingGenerator`.
+
+    Each item is produced in a worker thread via :py:func:`asyncio.to_thread`, so
+    network requests and the sleeps between stream polls happen off of the event loop.
+    This keeps the event loop responsive to other tasks while the stream waits for new
+    items. For example, to consume a comment stream from a coroutine, try:
+
+    .. code-block:: python
+
+        from praw.models.util import async_iterator
+
+
+        async def watch(subreddit):
+            async for comment in async_iterator(subreddit.stream.comments()):
+                print(comment)
+
+    """
+    while True:
+        item = await asyncio.to_thread(next, iterator, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            return
+        yield item
+
+
 def permissions_string(*, known_permissions: set[str], permissions: list[str] | None) -> str:
     """Return a comma separated string of permission changes.
 
@@ -93,8 +603,14 @@ def permissions_string(*, known_permissions: set[str], permissions: list[str] |
 def stream_generator(
     function: Callable,
     *,
+    adaptive: bool = False,
     attribute_name: str = "fullname",
+    backfill: Callable[[Iterator[str]], Iterable[Any]] | None = None,
+    batch: bool = False,
+    checkpoint: BaseCheckpoint | None = None,
+    checkpoint_interval: float = 60,
     continue_after_id: str | None = None,
+    dedup_window: int = 301,
     exception_handler: Callable[[Exception], None] | None = None,
     exclude_before: bool = False,
     pause_after: int | None = None,
@@ -105,7 +621,34 @@ def stream_generator(
 
     :param function: A callable that returns a :class:`.ListingGenerator`, e.g.,
         :meth:`.Subreddit.comments` or :meth:`.Subreddit.new`.
+    :param adaptive: When ``True``, the delay between requests and the number of items
+        requested follow the observed rate at which new items arrive, rather than the
+        exponential backoff described below. Busy streams are requested again before a
+        page can fill up, and immediately when it did, while quiet streams are requested
+        as rarely as once a minute (default: ``False``).
     :param attribute_name: The field to use as an ID (default: ``"fullname"``).
+    :param backfill: A callable used to recover items that were missed because more of
+        them arrived between two requests than a response can hold. When a full response
+        shares no items with the previous ones, the callable is invoked with an iterator
+        of the fullnames between the newest item seen so far and the oldest item of the
+        response, and should return the items among them that belong to the stream, in
+        the same order. Those items are yielded before the ones of the response. This
+        relies on fullnames being sequential, as they are for comments and submissions.
+        When ``None``, missed items are not recovered (default: ``None``).
+    :param batch: When ``True``, the new items of each response are yielded together as
+        a :class:`.StreamBatch` rather than one at a time (default: ``False``).
+    :param checkpoint: A :class:`.BaseCheckpoint` that the position of the stream is
+        saved to every ``checkpoint_interval`` seconds and when the stream is closed.
+        When the stream starts and the checkpoint holds a saved position, the stream
+        continues from it, yielding every item that was not processed, and
+        ``skip_existing`` is ignored. An item is processed once the stream is advanced
+        past it, so the item being handled when the stream is interrupted is yielded
+        again after resuming (default: ``None``).
+    :param checkpoint_interval: The minimum number of seconds between two saves of the
+        position of the stream to ``checkpoint`` (default: ``60``).
+    :param dedup_window: The number of most recently seen items remembered to avoid
+        yielding an item twice. It should be a few times the number of items in a
+        response (default: ``301``).
     :param exclude_before: When ``True`` does not pass ``params`` to ``function``
         (default: ``False``).
     :param exception_handler: A callable that is invoked with the exception raised while
@@ -185,6 +728,34 @@ def stream_generator(
                 continue
             print(comment)
 
+    To follow a busy stream without overflowing a page of results, while waiting longer
+    between requests when it quietens down, pass ``adaptive=True``:
+
+    .. code-block:: python
+
+        for comment in reddit.subreddit("all").stream.comments(adaptive=True):
+            print(comment)
+
+    To insert new comments into a database in bulk, try:
+
+    .. code-block:: python
+
+        for comments in reddit.subreddit("test").stream.comments(batch=True):
+            database.insert_many(comments)
+            if comments.gap_suspected:
+                print("Some comments may have been missed")
+
+    To resume a stream where it left off when the program is restarted, pass a
+    ``checkpoint``:
+
+    .. code-block:: python
+
+        from praw.util.checkpoint import SQLiteCheckpoint
+
+        checkpoint = SQLiteCheckpoint(database="streams.db", key="test comments")
+        for comment in reddit.subreddit("test").stream.comments(checkpoint=checkpoint):
+            print(comment)
+
     To keep a stream alive across transient errors (e.g., network issues or server
     errors) rather than having it terminate, pass an ``exception_handler``:
 
@@ -211,50 +782,73 @@ def stream_generator(
             print(f"Stream error, retrying: {exception}")
 
     """
-    before_attribute = continue_after_id
+    poller = _StreamPoller(
+        function,
+        attribute_name=attribute_name,
+        backfill=backfill,
+        continue_after_id=continue_after_id,
+        dedup_window=dedup_window,
+        exclude_before=exclude_before,
+        function_kwargs=function_kwargs,
+    )
+    if checkpoint is not None and (state := checkpoint.load()) is not None:
+        poller.restore(state)
+        skip_existing = False
+    # The ID of the last item the caller has moved past, and the items of the latest
+    # response that are yet to be processed.
+    cursor = poller.before_attribute
+    items: list[Any] = []
+    position = 0
+    last_checkpoint = time.monotonic()
     exponential_counter = ExponentialCounter(max_counter=16)
-    seen_attributes = BoundedSet(301)
-    without_before_counter = 0
     responses_without_new = 0
     valid_pause_after = pause_after is not None
-    while True:
-        found = False
-        newest_attribute = None
-        limit = 100
-        if before_attribute is None:
-            limit -= without_before_counter
-            without_before_counter = (without_before_counter + 1) % 30
-        if not exclude_before:
-            function_kwargs["params"] = {"before": before_attribute}
-        try:
-            items = list(function(limit=limit, **function_kwargs))
-        except Exception as exception:
-            if exception_handler is None:
-                raise
-            exception_handler(exception)
-            time.sleep(exponential_counter.counter())
-            continue
-        for item in reversed(items):
-            attribute = getattr(item, attribute_name)
-            if attribute in seen_attributes:
+    try:
+        while True:
+            try:
+                items = poller.poll(limit=poller.page_size() if adaptive else None)
+            except Exception as exception:
+                if exception_handler is None:
+                    raise
+                exception_handler(exception)
+                time.sleep(exponential_counter.counter())
                 continue
-            found = True
-            seen_attributes.add(attribute)
-            newest_attribute = attribute
-            if not skip_existing:
-                yield item
-        before_attribute = newest_attribute
-        skip_existing = False
-        if valid_pause_after and pause_after < 0:
-            yield None
-        elif found:
-            exponential_counter.reset()
-            responses_without_new = 0
-        else:
-            responses_without_new += 1
-            if valid_pause_after and responses_without_new > pause_after:
+            position = 0
+            if skip_existing:
+                position = len(items)
+                cursor = poller.before_attribute or cursor
+            while position < len(items):
+                if batch:
+                    yield StreamBatch(
+                        items,
+                        fill_ratio=poller.fill_ratio,
+                        gap_suspected=poller.gap_suspected,
+                        latency=poller.latency,
+                    )
+                    position = len(items)
+                else:
+                    yield items[position]
+                    position += 1
+                cursor = getattr(items[position - 1], attribute_name)
+                if checkpoint is not None and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                    checkpoint.save(poller.state(before=cursor, unprocessed=items[position:]))
+                    last_checkpoint = time.monotonic()
+            skip_existing = False
+            if valid_pause_after and pause_after < 0:
+                yield None
+            elif items:
                 exponential_counter.reset()
                 responses_without_new = 0
-                yield None
             else:
-                time.sleep(exponential_counter.counter())
+                responses_without_new += 1
+                if valid_pause_after and responses_without_new > pause_after:
+                    exponential_counter.reset()
+                    responses_without_new = 0
+                    yield None
+                elif not adaptive:
+                    time.sleep(exponential_counter.counter())
+            if adaptive:
+                time.sleep(poller.interval(maximum=poller.MAX_INTERVAL, minimum=poller.MIN_INTERVAL))
+    finally:
+        if checkpoint is not None:
+            checkpoint.save(poller.state(before=cursor, unprocessed=items[position:]))
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from datetime import datetime
-from json import loads
 from typing import TYPE_CHECKING, Any
 
 from praw.exceptions import ClientException, RedditAPIException
@@ -13,6 +12,11 @@ if TYPE_CHECKING:
     import praw
     from praw.models.reddit.base import RedditBase
 
+# The sets of keys that identify responses probed more than once.
+_CONVERSATION_KEYS = frozenset({"messages", "modActions"})
+_MOD_NOTE_KEYS = frozenset({"mod_action_data", "user_note_data"})
+_THING_KEYS = frozenset({"kind", "data"})
+
 
 class Objector:
     """The objector builds :class:`.RedditBase` objects."""
@@ -64,18 +68,12 @@ class Objector:
         :returns: An instance of :class:`.RedditBase`, or the ``data`` dict.
 
         """
-        if {"messages", "modActions"}.issubset(data) and {
-            "conversations",
-            "conversation",
-        }.intersection(data):
+        if _CONVERSATION_KEYS.issubset(data) and {"conversations", "conversation"}.intersection(data):
             # fetched conversation
             data.update(data.pop("conversation") if "conversation" in data else data.pop("conversations"))
             parser = self.parsers["ModmailConversation"]
             parser._convert_conversation_objects(data, self._reddit)
-        elif {"messages", "modActions"}.issubset(data) or {
-            "legacyFirstMessageId",
-            "state",
-        }.issubset(data):
+        elif _CONVERSATION_KEYS.issubset(data) or {"legacyFirstMessageId", "state"}.issubset(data):
             # not fetched conversation i.e., from conversations()
             del data["objIds"]  # delete objIds since it could be missing data
             parser = self.parsers["ModmailConversation"]
@@ -122,11 +120,7 @@ class Objector:
             # Modmail subreddit
             data = snake_case_keys(data)
             parser = self.parsers[self._reddit.config.kinds[data["type"]]]
-        elif {"date", "id", "name"}.issubset(data) or {
-            "id",
-            "name",
-            "permissions",
-        }.issubset(data):
+        elif {"date", "id", "name"}.issubset(data) or {"id", "name", "permissions"}.issubset(data):
             parser = self.parsers[self._reddit.config.kinds["redditor"]]
         elif {"text", "url"}.issubset(data):
             key = "Button" if "color" in data or "linkUrl" in data else "MenuLink"
@@ -186,7 +180,7 @@ class Objector:
                     draft["subreddit"] = subreddits[draft["subreddit"]]
                 draft["modified"] = datetime.fromtimestamp(draft["modified"] / 1000).astimezone()
             parser = self.parsers["DraftList"]
-        elif {"mod_action_data", "user_note_data"}.issubset(data):
+        elif _MOD_NOTE_KEYS.issubset(data):
             redditor_parser = self.parsers[self._reddit.config.kinds["redditor"]]
             subreddit_parser = self.parsers[self._reddit.config.kinds["subreddit"]]
             data["moderator"] = redditor_parser(self._reddit, data["operator"])
@@ -198,11 +192,7 @@ class Objector:
             data.update(data["user_note_data"])
             del data["user_note_data"]
             parser = self.parsers["mod_note"]
-        elif (
-            "created" in data
-            and isinstance(data["created"], dict)
-            and {"mod_action_data", "user_note_data"}.issubset(data["created"])
-        ):
+        elif "created" in data and isinstance(data["created"], dict) and _MOD_NOTE_KEYS.issubset(data["created"]):
             data = data["created"]
             return self._objectify_dict(data=data)
         else:
@@ -212,6 +202,23 @@ class Objector:
             return data
         return parser.parse(data, self._reddit)
 
+    def _parse_thing(self, kind: str, data: dict[str, Any]) -> Any:
+        """Create an object from the ``data`` item of a thing, e.g., a :class:`.Listing`.
+
+        :param kind: The kind of the thing, e.g., ``"t2"``.
+        :param data: The ``data`` item of the thing.
+
+        Only these complete payloads are merged into the identity map. Partial ones, such
+        as moderator list entries, carry details that belong to the listing and are kept
+        apart from the shared object.
+
+        """
+        parser = self.parsers[kind]
+        instance = parser.parse(data, self._reddit)
+        if getattr(parser, "_identity_mapped", False) and self._reddit._identity_map is not None:
+            return self._reddit._identity_map.merge(instance)
+        return instance
+
     def objectify(
         self, *, data: dict[str, Any] | list[Any] | bool | None
     ) -> RedditBase | dict[str, Any] | list[Any] | bool | None:
@@ -225,6 +232,12 @@ class Objector:
         """
         if data is None:  # 204 no content
             return None
+        if isinstance(data, dict) and data.keys() == _THING_KEYS:
+            # Fast path for things, e.g., ``{"kind": "t1", "data": {...}}``, which make up
+            # the bulk of most responses.
+            kind = data.get("kind")
+            if kind in self.parsers and kind not in {"menu", "moderators", "ModeratedList"}:
+                return self._parse_thing(kind, data["data"])
         if isinstance(data, list):
             return [self.objectify(data=item) for item in data]
         if isinstance(data, bool):  # Reddit.username_available
@@ -239,18 +252,18 @@ class Objector:
             # This is a widget
             parser = self.parsers.get(data["kind"], self.parsers["widget"])
             return parser.parse(data, self._reddit)
-        if {"kind", "data"}.issubset(data) and data["kind"] in self.parsers:
+        if _THING_KEYS.issubset(data) and data["kind"] in self.parsers:
             parser = self.parsers[data["kind"]]
             if data["kind"] == "ModeratedList":
                 return parser.parse(data, self._reddit)
-            return parser.parse(data["data"], self._reddit)
+            return self._parse_thing(data["kind"], data["data"])
         if "json" in data and "data" in data["json"]:
             if "websocket_url" in data["json"]["data"]:
                 return data
             if "things" in data["json"]["data"]:  # Submission.reply
                 return self.objectify(data=data["json"]["data"]["things"])
             if "rules" in data["json"]["data"]:
-                return self.objectify(data=loads(data["json"]["data"]["rules"]))
+                return self.objectify(data=self._reddit._json_loads(data["json"]["data"]["rules"]))
             if "drafts_count" in data["json"]["data"] and all(
                 key not in data["json"]["data"] for key in ["name", "url"]
             ):  # Draft
@@ -8,6 +8,8 @@ import configparser
 import os
 import re
 import time
+from copy import deepcopy
+from functools import partial
 from itertools import islice
 from logging import getLogger
 from typing import IO, TYPE_CHECKING, Any, cast
@@ -25,6 +27,7 @@ from prawcore import (
     session,
 )
 from prawcore.exceptions import BadRequest
+from requests.adapters import HTTPAdapter
 
 from praw import models
 from praw.config import Config
@@ -35,6 +38,11 @@ from praw.exceptions import (
     RedditAPIException,
 )
 from praw.objector import Objector
+from praw.util.cache import IdentityMap, ResponseCache
+from praw.util.concurrency import SingleFlight, ThreadSafeRateLimiter, ordered_map
+from praw.util.decoding import JSONResponseHook, json_loads
+from praw.util.http_cache import HTTPCache, HTTPCacheAdapter
+from praw.util.instrumentation import RequestInstrumentation
 
 try:
     from update_checker import update_check
@@ -52,12 +60,15 @@ if TYPE_CHECKING:
     else:
         from typing_extensions import Self
 
-    from collections.abc import Generator, Iterable, Iterator
+    from collections.abc import Callable, Generator, Iterable, Iterator
 
     import prawcore.auth
     import prawcore.requestor
+    import requests
 
     from praw.exceptions import RedditErrorItem
+    from praw.models.reddit.base import RedditBase
+    from praw.util.instrumentation import RequestEvent
 
 
 Comment = models.Comment
@@ -194,6 +205,8 @@ class Reddit:
         """
         self._core = self._authorized_core = self._read_only_core = None
         self._objector: Objector
+        self._in_flight = SingleFlight()
+        self._instrumentation = RequestInstrumentation()
         self._unique_counter = 0
 
         try:
@@ -226,6 +239,8 @@ class Reddit:
             raise MissingRequiredAttributeException(msg)
 
         self._check_for_update()
+        self._identity_map = IdentityMap() if self.config.identity_map else None
+        self._json_loads = json_loads(self.config.json_decoder)
         self._prepare_objector()
         self._prepare_prawcore(requestor_class=requestor_class, requestor_kwargs=requestor_kwargs)
 
@@ -368,6 +383,25 @@ class Reddit:
 
         """
 
+        self.response_cache: ResponseCache | None = None
+        """An instance of :class:`.ResponseCache`, or ``None`` when responses are not cached.
+
+        Responses to ``GET`` requests are cached when the ``response_cache_ttl`` or
+        ``response_cache_ttls`` configuration options are set. For example, to see how
+        effective the cache is, run:
+
+        .. code-block:: python
+
+            print(reddit.response_cache.hits, reddit.response_cache.misses)
+
+        """
+        if self.config.response_cache_ttl > 0 or any(ttl > 0 for ttl in self.config.response_cache_ttls.values()):
+            self.response_cache = ResponseCache(
+                max_size=self.config.response_cache_size,
+                ttl=self.config.response_cache_ttl,
+                ttls=self.config.response_cache_ttls,
+            )
+
         self.subreddit = models.SubredditHelper(self, None)
         """An instance of :class:`.SubredditHelper`.
 
@@ -463,9 +497,29 @@ class Reddit:
                     return seconds + 1
         return None
 
+    def _http_cache_identity(self, request: requests.PreparedRequest) -> str | None:
+        """Return who ``request`` is made on behalf of, for :class:`.HTTPCacheAdapter`.
+
+        Requests made with an access token that belongs to neither session, such as
+        those obtaining the tokens, are not cached.
+
+        """
+        authorization = request.headers.get("Authorization")
+        if self._read_only_core is not None:
+            authorizer = self._read_only_core._authorizer
+            if authorizer.access_token and authorization == f"bearer {authorizer.access_token}":
+                return f"{self.config.client_id}\0"
+        if self._authorized_core is not None:
+            authorizer = self._authorized_core._authorizer
+            user = getattr(authorizer, "refresh_token", None) or self.config.username
+            if user and authorizer.access_token and authorization == f"bearer {authorizer.access_token}":
+                return f"{self.config.client_id}\0{user}"
+        return None
+
     def _objectify_request(
         self,
         *,
+        attempt: int = 0,
         data: dict[str, Any] | bytes | IO | str | None = None,
         files: dict[str, IO] | None = None,
         json: dict[Any, Any] | list[Any] | None = None,
@@ -475,6 +529,8 @@ class Reddit:
     ) -> Any:
         """Run a request through the ``Objector``.
 
+        :param attempt: The number of times the request was previously made (default:
+            ``0``).
         :param data: Dictionary, bytes, or file-like object to send in the body of the
             request (default: ``None``).
         :param files: Dictionary, filename to file (like) object mapping (default:
@@ -488,8 +544,8 @@ class Reddit:
         :param path: The path to fetch.
 
         """
-        return self._objector.objectify(
-            data=self.request(
+        with self._instrumentation.track(attempt=attempt, method=method, path=path) as event:
+            response = self.request(
                 data=data,
                 files=files,
                 json=json,
@@ -497,7 +553,12 @@ class Reddit:
                 params=params,
                 path=path,
             )
-        )
+            started = time.perf_counter()
+            try:
+                return self._objector.objectify(data=response)
+            finally:
+                if event is not None:
+                    event.objectify_time += time.perf_counter() - started
 
     def _prepare_common_authorizer(self, authenticator: prawcore.auth.BaseAuthenticator) -> None:
         if self.config.refresh_token:
@@ -505,7 +566,7 @@ class Reddit:
         else:
             self._core = self._read_only_core
             return
-        self._core = self._authorized_core = session(authorizer=authorizer, window_size=self.config.window_size)
+        self._core = self._authorized_core = self._prepare_session(authorizer)
 
     def _prepare_objector(self) -> None:
         mappings = {
@@ -573,12 +634,36 @@ class Reddit:
             user_agent=USER_AGENT_FORMAT.format(self.config.user_agent),
             **requestor_kwargs,
         )
+        adapter_kwargs: dict[str, Any] = {}
+        if self.config.connection_pool_size is not None:
+            adapter_kwargs = {
+                "pool_block": True,
+                "pool_connections": self.config.connection_pool_size,
+                "pool_maxsize": self.config.connection_pool_size,
+            }
+        if self.config.http_cache:
+            adapter = HTTPCacheAdapter(
+                HTTPCache(self.config.http_cache, max_entries=self.config.http_cache_max_entries),
+                identity=self._http_cache_identity,
+                **adapter_kwargs,
+            )
+            requestor._http.mount("https://", adapter)
+        elif adapter_kwargs:
+            requestor._http.mount("https://", HTTPAdapter(**adapter_kwargs))
+        if self.config.json_decoder != "json":
+            requestor._http.hooks["response"].append(JSONResponseHook(self._json_loads))
 
         if self.config.client_secret:
             self._prepare_trusted_prawcore(requestor)
         else:
             self._prepare_untrusted_prawcore(requestor)
 
+    def _prepare_session(self, authorizer: prawcore.auth.BaseAuthorizer) -> prawcore.Session:
+        core = session(authorizer=authorizer, window_size=self.config.window_size)
+        # Allow the session, and the Reddit instance owning it, to be shared by threads.
+        core._rate_limiter = ThreadSafeRateLimiter(window_size=self.config.window_size)
+        return core
+
     def _prepare_trusted_prawcore(self, requestor: prawcore.requestor.Requestor) -> None:
         # Only reached when client_secret is set (see _prepare_prawcore).
         assert self.config.client_secret is not None
@@ -589,15 +674,13 @@ class Reddit:
             requestor=requestor,
         )
         read_only_authorizer = ReadOnlyAuthorizer(authenticator=authenticator)
-        self._read_only_core = session(authorizer=read_only_authorizer, window_size=self.config.window_size)
+        self._read_only_core = self._prepare_session(read_only_authorizer)
 
         if self.config.username and self.config.password:
             script_authorizer = ScriptAuthorizer(
                 authenticator=authenticator, password=self.config.password, username=self.config.username
             )
-            self._core = self._authorized_core = session(
-                authorizer=script_authorizer, window_size=self.config.window_size
-            )
+            self._core = self._authorized_core = self._prepare_session(script_authorizer)
         else:
             self._prepare_common_authorizer(authenticator)
 
@@ -606,9 +689,79 @@ class Reddit:
             client_id=self.config.client_id, redirect_uri=self.config.redirect_uri, requestor=requestor
         )
         read_only_authorizer = DeviceIDAuthorizer(authenticator=authenticator)
-        self._read_only_core = session(authorizer=read_only_authorizer, window_size=self.config.window_size)
+        self._read_only_core = self._prepare_session(read_only_authorizer)
         self._prepare_common_authorizer(authenticator)
 
+    def _request(
+        self,
+        *,
+        data: dict[str, Any] | bytes | IO | str | None,
+        event: RequestEvent | None,
+        files: dict[str, IO] | None,
+        json: dict[Any, Any] | list[Any] | None,
+        method: str,
+        params: dict[str, str | int] | None,
+        path: str,
+    ) -> Any:
+        """Make the request described by :meth:`.request`, updating ``event``."""
+        if self.config.check_for_async:
+            self._check_for_async()
+        if data and json:
+            msg = "At most one of 'data' or 'json' is supported."
+            raise ClientException(msg)
+        assert self._core is not None
+        cache = self.response_cache
+        cache_key = None
+        if cache is not None and method == "GET":
+            cache_key = cache.key(identity=self._core, params=params, path=path)
+            if cache_key is not None and (response := cache.get(cache_key)) is not None:
+                if event is not None:
+                    event.cached = True
+                return response
+        core = self._core
+        request = partial(core.request, data=data, files=files, json=json, method=method, params=params, path=path)
+        shared = False
+        try:
+            if method == "GET" and not (data or files or json):
+                # Identical GET requests in flight at the same time share one response.
+                key = (core, path, tuple(sorted((params or {}).items())))
+                response, shared = self._in_flight.call(key, request)
+            else:
+                response = request()
+        except BadRequest as exception:
+            error_data: dict[str, Any]
+            try:
+                error_data = exception.response.json()
+            except ValueError:
+                if exception.response.text:
+                    error_data = {"reason": exception.response.text}
+                else:
+                    raise exception from None
+            if set(error_data) == {"error", "message"}:
+                raise
+            explanation = error_data.get("explanation")
+            if "fields" in error_data:
+                assert len(error_data["fields"]) == 1
+                field = error_data["fields"][0]
+            else:
+                field = None
+            raise RedditAPIException(
+                cast(
+                    "list[RedditErrorItem | list[str] | str]",
+                    [error_data["reason"], explanation, field],
+                )
+            ) from exception
+        finally:
+            if cache is not None and method != "GET":
+                cache.invalidate_path(path)
+        if shared:
+            if event is not None:
+                event.shared = True
+            response = deepcopy(response)
+        if cache is not None and cache_key is not None and response is not None:
+            cache.set(cache_key, response)
+        return response
+
     def _resolve_share_url(self, url: str) -> str:
         """Return the canonical URL for a given share URL."""
         parts = urlparse(url).path.rstrip("/").split("/")
@@ -622,6 +775,38 @@ class Reddit:
                 return next_request.url
         return url
 
+    def add_request_hook(self, hook: Callable[[RequestEvent], Any]) -> None:
+        """Call ``hook`` with a :class:`.RequestEvent` after each request completes.
+
+        :param hook: A callable that takes a :class:`.RequestEvent`. Exceptions raised
+            by ``hook`` are logged and otherwise ignored.
+
+        The event describes the duration of the request, the time spent on the network,
+        decoding the response, and building objects from it, as well as the endpoint,
+        status code, retries, and the rate limit reported by Reddit. Hooks are called on
+        the thread that made the request, so they should return quickly.
+
+        For example, to log the slowest endpoints:
+
+        .. code-block:: python
+
+            def log_slow_requests(event):
+                if event.duration > 1:
+                    print(f"{event.endpoint} took {event.duration:.2f} seconds")
+
+
+            reddit.add_request_hook(log_slow_requests)
+
+        To record each request as an OpenTelemetry span, see :class:`.OpenTelemetryHook`.
+
+        """
+        if not self._instrumentation.hooks:
+            assert self._read_only_core is not None
+            session = self._read_only_core.requestor._http
+            if self._instrumentation.response_hook not in session.hooks["response"]:
+                session.hooks["response"].append(self._instrumentation.response_hook)
+        self._instrumentation.hooks.append(hook)
+
     def comment(self, id: str | None = None, *, url: str | None = None) -> models.Comment:
         """Return a lazy instance of :class:`.Comment`.
 
@@ -681,10 +866,78 @@ class Reddit:
         """
         return self._objectify_request(method="GET", params=params, path=path)
 
+    def hydrate(
+        self,
+        objects: Iterable[models.Comment | models.Submission | models.Subreddit],
+        *,
+        concurrency: int | None = None,
+        defer: bool = False,
+    ) -> None:
+        """Fetch the attributes of many lazy objects with as few requests as possible.
+
+        :param objects: The :class:`.Comment`, :class:`.Submission`, and
+            :class:`.Subreddit` instances to fetch. Instances that have already been
+            fetched, and instances of other classes, are ignored.
+        :param concurrency: The maximum number of batches to request at once (default:
+            ``None``). See :meth:`.info`.
+        :param defer: When ``True``, nothing is fetched immediately. Instead, the first
+            time any of the unfetched ``objects`` needs to be fetched, all of those that
+            are still unfetched are fetched together (default: ``False``).
+
+        Unfetched objects are grouped by kind and fetched through :meth:`.info`, 100 at a
+        time, and each instance is updated in place. Objects that Reddit does not return
+        are left unfetched, and will be fetched individually when one of their missing
+        attributes is accessed.
+
+        .. note::
+
+            The comments of a :class:`.Submission` are not fetched. They will be fetched
+            the first time :attr:`.Submission.comments` is accessed.
+
+        For example, to fetch the score of many comments with one request per 100
+        comments, try:
+
+        .. code-block:: python
+
+            comments = [reddit.comment(comment_id) for comment_id in comment_ids]
+            reddit.hydrate(comments)
+            for comment in comments:
+                print(comment.score)
+
+        """
+        # Instances sharing a fullname, or a display name, are hydrated by the same item.
+        by_fullname: dict[str, list[RedditBase]] = {}
+        by_name: dict[str, list[RedditBase]] = {}
+        for item in objects:
+            if getattr(item, "_fetched", True):
+                continue
+            if isinstance(item, models.Subreddit):
+                by_name.setdefault(item.display_name.lower(), []).append(item)
+            elif isinstance(item, (models.Comment, models.Submission)):
+                by_fullname.setdefault(item.fullname.lower(), []).append(item)
+        if defer:
+            siblings = [item for group in (*by_fullname.values(), *by_name.values()) for item in group]
+            for item in siblings:
+                item._siblings = siblings
+            return
+        for group in (*by_fullname.values(), *by_name.values()):
+            for item in group:
+                item.__dict__.pop("_siblings", None)
+        if by_fullname:
+            for other in self.info(concurrency=concurrency, fullnames=list(by_fullname)):
+                for item in by_fullname.get(other.fullname.lower(), ()):
+                    item._hydrate(other)
+        if by_name:
+            for other in self.info(concurrency=concurrency, subreddits=list(by_name)):
+                for item in by_name.get(other.display_name.lower(), ()):
+                    item._hydrate(other)
+
     def info(
         self,
         *,
+        concurrency: int | None = None,
         fullnames: Iterable[str] | None = None,
+        missing: list[str] | None = None,
         subreddits: Iterable[models.Subreddit | str] | None = None,
         url: str | None = None,
     ) -> Generator[
@@ -694,8 +947,15 @@ class Reddit:
     ]:
         """Fetch information about each item in ``fullnames``, ``url``, or ``subreddits``.
 
+        :param concurrency: The maximum number of batches of ``fullnames`` or
+            ``subreddits`` to request at once. Items are still yielded in their relative
+            order. When ``None``, batches are requested one after the other (default:
+            ``None``).
         :param fullnames: A list of fullnames for comments, submissions, and/or
             subreddits.
+        :param missing: A list that the fullnames or subreddit names that could not be
+            matched are appended to, in their relative order, as their batches are
+            yielded (default: ``None``).
         :param subreddits: A list of subreddit names or :class:`.Subreddit` objects to
             retrieve subreddits from.
         :param url: A url (as a string) to retrieve lists of link submissions from.
@@ -717,6 +977,16 @@ class Reddit:
             literally by Reddit's API. As such, the URLs ``"youtube.com"`` and
             ``"https://www.youtube.com"`` will provide a different set of submissions.
 
+        For example, to fetch many comments four batches at a time and find out which of
+        them no longer exist, try:
+
+        .. code-block:: python
+
+            missing = []
+            for comment in reddit.info(concurrency=4, fullnames=fullnames, missing=missing):
+                print(comment.score)
+            print(f"{len(missing)} comments were not found")
+
         """
         set_count = sum(1 for value in (fullnames, url, subreddits) if value is not None)
         if set_count != 1:
@@ -743,12 +1013,22 @@ class Reddit:
                 iterable: Iterator[str] = (
                     iter(str(item) for item in names) if is_using_fullnames else iter([str(item) for item in names])
                 )
-                while True:
-                    chunk = list(islice(iterable, 100))
-                    if not chunk:
-                        break
-                    params: dict[str, str | int] = {api_parameter_name: ",".join(chunk)}
-                    yield from self.get(API_PATH["info"], params=params)
+                chunks = iter(lambda: list(islice(iterable, 100)), [])
+                if concurrency is None:
+                    results = map(fetch_chunk, chunks)
+                else:
+                    results = ordered_map(fetch_chunk, chunks, workers=concurrency)
+                for chunk, listing in results:
+                    if missing is not None:
+                        found = {
+                            (item.fullname if is_using_fullnames else item.display_name).lower() for item in listing
+                        }
+                        missing.extend(name for name in chunk if name.lower() not in found)
+                    yield from listing
+
+            def fetch_chunk(chunk: list[str]) -> tuple[list[str], Any]:
+                params: dict[str, str | int] = {api_parameter_name: ",".join(chunk)}
+                return chunk, self.get(API_PATH["info"], params=params)
 
             return name_generator(ids_or_names)
 
@@ -835,6 +1115,7 @@ class Reddit:
                     files[name].seek(position)
             try:
                 return self._objectify_request(
+                    attempt=attempt,
                     data=data,
                     files=files,
                     json=json,
@@ -881,8 +1162,20 @@ class Reddit:
         Either ``name`` or ``fullname`` can be provided, but not both.
 
         """
+        if self._identity_map is not None and name is not None and fullname is None:
+            return self._identity_map.get(models.Redditor, name, lambda: models.Redditor(self, name=name))
         return models.Redditor(self, fullname=fullname, name=name)
 
+    def remove_request_hook(self, hook: Callable[[RequestEvent], Any]) -> None:
+        """Stop calling ``hook`` after each request.
+
+        :param hook: A hook previously passed to :meth:`.add_request_hook`.
+
+        :raises: :py:class:`ValueError` if ``hook`` was not added.
+
+        """
+        self._instrumentation.hooks.remove(hook)
+
     def request(
         self,
         *,
@@ -908,44 +1201,10 @@ class Reddit:
         :param path: The path to fetch.
 
         """
-        if self.config.check_for_async:
-            self._check_for_async()
-        if data and json:
-            msg = "At most one of 'data' or 'json' is supported."
-            raise ClientException(msg)
-        assert self._core is not None
-        try:
-            return self._core.request(
-                data=data,
-                files=files,
-                json=json,
-                method=method,
-                params=params,
-                path=path,
+        with self._instrumentation.track(method=method, path=path) as event:
+            return self._request(
+                data=data, event=event, files=files, json=json, method=method, params=params, path=path
             )
-        except BadRequest as exception:
-            error_data: dict[str, Any]
-            try:
-                error_data = exception.response.json()
-            except ValueError:
-                if exception.response.text:
-                    error_data = {"reason": exception.response.text}
-                else:
-                    raise exception from None
-            if set(error_data) == {"error", "message"}:
-                raise
-            explanation = error_data.get("explanation")
-            if "fields" in error_data:
-                assert len(error_data["fields"]) == 1
-                field = error_data["fields"][0]
-            else:
-                field = None
-            raise RedditAPIException(
-                cast(
-                    "list[RedditErrorItem | list[str] | str]",
-                    [error_data["reason"], explanation, field],
-                )
-            ) from exception
 
     def submission(self, id: str | None = None, *, url: str | None = None) -> models.Submission:
         """Return a lazy instance of :class:`.Submission`.
@@ -2,10 +2,75 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import re
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from weakref import WeakValueDictionary
+
+from praw.endpoints import API_PATH
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable, Mapping
+
+    from praw.models.reddit.base import RedditBase
+
+    # The credentials, endpoint name, path, and sorted query parameters of a request.
+    _CacheKey = tuple[Hashable, str | None, str, tuple[tuple[str, str | int], ...]]
+
+_T = TypeVar("_T", bound="RedditBase")
+
+# The endpoints whose cached responses are stale once a request that is not a ``GET``
+# is made to the endpoint on the left. Every endpoint also invalidates itself.
+INVALIDATES = MappingProxyType({
+    "add_subreddit_rule": ("rules",),
+    "emoji_delete": ("emoji_list",),
+    "emoji_update": ("emoji_list",),
+    "emoji_upload": ("emoji_list",),
+    "preferences": ("me",),
+    "removal_reason": ("removal_reasons_list",),
+    "remove_subreddit_rule": ("rules",),
+    "reorder_subreddit_rules": ("rules",),
+    "site_admin": ("subreddit_about", "subreddit_settings"),
+    "update_subreddit_rule": ("rules",),
+    "widget_create": ("widgets",),
+    "widget_modify": ("widgets",),
+    "widget_order": ("widgets",),
+})
+
+
+@lru_cache(maxsize=1)
+def _endpoint_pattern() -> tuple[tuple[str, ...], re.Pattern[str]]:
+    # Templates with fewer placeholders are tried first so that, e.g.,
+    # ``r/{subreddit}/about/rules`` wins over ``r/{subreddit}/about/{location}``.
+    names = tuple(sorted(API_PATH, key=lambda name: (API_PATH[name].count("{"), -len(API_PATH[name]))))
+    alternatives = []
+    for index, name in enumerate(names):
+        template = re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(API_PATH[name].strip("/")))
+        alternatives.append(f"(?P<e{index}>{template}/?)")
+    return names, re.compile("|".join(alternatives))
+
+
+@lru_cache(maxsize=1024)
+def endpoint_name(path: str) -> str | None:
+    """Return the name of the endpoint ``path`` refers to.
+
+    :param path: The path of a request, e.g., ``"r/test/about/rules"``.
+
+    The name is the key of the endpoint in ``praw.endpoints.API_PATH``. Returns
+    ``None`` when ``path`` does not match any endpoint.
+
+    """
+    names, pattern = _endpoint_pattern()
+    match = pattern.fullmatch(path.strip("/"))
+    if match is None:
+        return None
+    assert match.lastgroup is not None
+    return names[int(match.lastgroup[1:])]
 
 
 class cachedproperty:  # ruff:ignore[invalid-class-name]
@@ -53,3 +118,231 @@ class cachedproperty:  # ruff:ignore[invalid-class-name]
     def __repr__(self) -> str:
         """Return an object initialization representation of the instance."""
         return f"<{self.__class__.__name__} {self.func}>"
+
+
+class IdentityMap:
+    """A map from names to the objects with those names that are still in use.
+
+    Objects are held through weak references, so an object is discarded once nothing
+    else refers to it. While it is in use, asking for an object of the same class and
+    name, which is compared case-insensitively, returns the same object.
+
+    Only complete redditor and subreddit payloads are merged into these objects. Entries
+    of moderator and other user lists are kept apart, as details such as
+    ``mod_permissions`` belong to the list they came from.
+
+    An instance is used when the ``identity_map`` configuration option is enabled. See
+    :ref:`misc_options` for more info.
+
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return an empty state for pickling, as the objects are not kept."""
+        return {}
+
+    def __init__(self) -> None:
+        """Initialize an :class:`.IdentityMap` instance."""
+        self._lock = Lock()
+        self._objects: WeakValueDictionary[tuple[type, str], RedditBase] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """Return the number of objects in the map."""
+        return len(self._objects)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state after unpickling."""
+        self.__init__()
+
+    def get(self, cls: type[_T], name: str, factory: Callable[[], _T]) -> _T:
+        """Return the object of ``cls`` named ``name``, creating it if needed.
+
+        :param cls: The class of the object.
+        :param name: The name of the object, e.g., the display name of a subreddit.
+        :param factory: A function returning a new object, called when none is in use.
+
+        """
+        key = (cls, name.lower())
+        with self._lock:
+            instance = self._objects.get(key)
+            if instance is None:
+                instance = self._objects[key] = factory()
+        # Objects are stored under their own class, so the one found is a ``cls``.
+        return cast("_T", instance)
+
+    def merge(self, instance: _T) -> _T:
+        """Return the object in use with the same class and name as ``instance``.
+
+        :param instance: A newly built object.
+
+        When there is such an object, the attributes of ``instance`` are copied to it.
+        Otherwise, ``instance`` is added to the map and returned.
+
+        """
+        name = instance.__dict__.get(instance.STR_FIELD)
+        if not isinstance(name, str):
+            return instance
+        key = (type(instance), name.lower())
+        with self._lock:
+            existing = self._objects.setdefault(key, instance)
+        if existing is not instance:
+            fetched = existing._fetched or instance._fetched
+            existing.__dict__.update(instance.__dict__)
+            existing._fetched = fetched
+        return cast("_T", existing)
+
+
+class ResponseCache:
+    """A least recently used cache of the responses to ``GET`` requests.
+
+    Responses are cached per endpoint for the number of seconds given in ``ttls``, or
+    ``ttl`` for endpoints that are not listed. Responses from endpoints whose time to live
+    is ``0`` are not cached.
+
+    A request other than ``GET`` to an endpoint discards the cached responses from that
+    endpoint and from the endpoints it is known to modify, e.g., adding a rule to a
+    subreddit discards the cached ``rules`` responses.
+
+    An instance is available as :attr:`.Reddit.response_cache` when one of the
+    ``response_cache_ttl`` or ``response_cache_ttls`` configuration options is set. See
+    :ref:`misc_options` for more info.
+
+    """
+
+    def __contains__(self, key: _CacheKey) -> bool:
+        """Return whether an unexpired response is cached for ``key``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the configuration for pickling, as the responses are not kept."""
+        return {"max_size": self.max_size, "ttl": self.ttl, "ttls": self.ttls}
+
+    def __init__(self, *, max_size: int = 1024, ttl: float = 0, ttls: Mapping[str, float] | None = None) -> None:
+        """Initialize a :class:`.ResponseCache` instance.
+
+        :param max_size: The maximum number of responses to cache (default: ``1024``).
+        :param ttl: The number of seconds responses are cached for when their endpoint is
+            not in ``ttls`` (default: ``0``).
+        :param ttls: A mapping of endpoint names, the keys of
+            ``praw.endpoints.API_PATH``, to the number of seconds their responses are
+            cached for (default: ``None``).
+
+        """
+        ttls = dict(ttls or {})
+        if unknown := sorted(set(ttls) - set(API_PATH)):
+            msg = f"Unknown endpoint(s) given for the response cache: {', '.join(unknown)}."
+            raise ValueError(msg)
+        self._entries: OrderedDict[_CacheKey, tuple[float, str | None, Any]] = OrderedDict()
+        # The keys of the cached responses from each endpoint, so that invalidating an
+        # endpoint does not scan every entry.
+        self._keys_by_endpoint: dict[str | None, set[_CacheKey]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.max_size = max_size
+        self.misses = 0
+        self.ttl = ttl
+        self.ttls = ttls
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including expired ones."""
+        return len(self._entries)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the configuration after unpickling."""
+        self.__init__(**state)
+
+    def _discard(self, key: _CacheKey) -> None:
+        _, name, _ = self._entries.pop(key)
+        keys = self._keys_by_endpoint[name]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_endpoint[name]
+
+    def _ttl(self, name: str | None) -> float:
+        return self.ttl if name is None else self.ttls.get(name, self.ttl)
+
+    def clear(self) -> None:
+        """Discard all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_endpoint.clear()
+
+    def get(self, key: _CacheKey) -> Any | None:
+        """Return a copy of the response cached for ``key``, or ``None``.
+
+        :param key: A key returned by :meth:`.key`.
+
+        Expired responses are discarded. The ``hits`` and ``misses`` counters are updated.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return deepcopy(entry[2])
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """Discard the cached responses from ``endpoint``.
+
+        :param endpoint: The name of an endpoint in ``praw.endpoints.API_PATH``, e.g.,
+            ``"rules"``. When ``None``, all responses are discarded (default:
+            ``None``).
+
+        """
+        if endpoint is None:
+            self.clear()
+            return
+        with self._lock:
+            for key in self._keys_by_endpoint.pop(endpoint, ()):
+                del self._entries[key]
+
+    def invalidate_path(self, path: str) -> None:
+        """Discard the cached responses that a modifying request to ``path`` makes stale.
+
+        :param path: The path of a request that is not a ``GET`` request.
+
+        """
+        if (name := endpoint_name(path)) is None:
+            return
+        for endpoint in (name, *INVALIDATES.get(name, ())):
+            self.invalidate(endpoint)
+
+    def key(self, *, identity: Hashable, params: dict[str, str | int] | None, path: str) -> _CacheKey | None:
+        """Return the key to cache the response to a ``GET`` request under.
+
+        :param identity: An object identifying the credentials the request is made with.
+        :param params: The query parameters of the request.
+        :param path: The path of the request.
+
+        Returns ``None`` when responses from the endpoint are not to be cached.
+
+        """
+        name = endpoint_name(path)
+        if self._ttl(name) <= 0:
+            return None
+        return identity, name, path, tuple(sorted((params or {}).items()))
+
+    def set(self, key: _CacheKey, response: Any) -> None:
+        """Cache a copy of ``response`` under ``key``.
+
+        :param key: A key returned by :meth:`.key`.
+        :param response: The decoded response.
+
+        The least recently used responses are discarded to stay within ``max_size``.
+
+        """
+        name = key[1]
+        expires_at = time.monotonic() + self._ttl(name)
+        with self._lock:
+            self._entries[key] = (expires_at, name, deepcopy(response))
+            self._entries.move_to_end(key)
+            self._keys_by_endpoint.setdefault(name, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
@@ -0,0 +1,109 @@
+"""Checkpoints persist the position of a stream so that it can be resumed later.
+
+A checkpoint is given to :func:`.stream_generator` (or any ``stream`` method) through
+the ``checkpoint`` parameter. When the stream starts, the saved state, if any, is
+loaded and the stream continues from the last item that was processed, without yielding
+any of the items that preceded it again. The state is saved periodically while the
+stream runs and once more when it is closed.
+
+The state of a stream is a ``dict`` whose values can be encoded as JSON.
+
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import os
+
+
+class BaseCheckpoint(ABC):
+    """An abstract class for all checkpoints."""
+
+    @abstractmethod
+    def load(self) -> dict[str, Any] | None:
+        """Return the saved state of the stream, or ``None`` if there is none."""
+
+    @abstractmethod
+    def save(self, state: dict[str, Any]) -> None:
+        """Save the state of the stream.
+
+        :param state: The state to save, replacing any previously saved state.
+
+        """
+
+
+class FileCheckpoint(BaseCheckpoint):
+    """Provides a single-file based checkpoint.
+
+    The state is written to a temporary file which then replaces ``filename``, so that
+    an interrupted write never leaves a partial state behind.
+
+    """
+
+    def __init__(self, filename: str | os.PathLike[str]) -> None:
+        """Initialize a :class:`.FileCheckpoint` instance.
+
+        :param filename: The file the state is saved to and loaded from.
+
+        """
+        self._path = Path(filename)
+
+    def load(self) -> dict[str, Any] | None:
+        """Return the state saved in the file, or ``None`` if it does not exist."""
+        try:
+            with self._path.open(encoding="utf-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: dict[str, Any]) -> None:
+        """Save the state to the file."""
+        temporary_path = self._path.with_name(f"{self._path.name}.tmp")
+        with temporary_path.open("w", encoding="utf-8") as fp:
+            json.dump(state, fp)
+        temporary_path.replace(self._path)
+
+
+class SQLiteCheckpoint(BaseCheckpoint):
+    """Provides a SQLite3 based checkpoint.
+
+    The database is created on first use. Unlike :class:`.FileCheckpoint`, many streams
+    can share the same database as long as each uses a different ``key``.
+
+    """
+
+    def __init__(self, *, database: str, key: str) -> None:
+        """Initialize a :class:`.SQLiteCheckpoint` instance.
+
+        :param database: The path to the SQLite database.
+        :param key: The key used to locate the state of the stream. It can be any string
+            that uniquely identifies the stream, e.g., ``"AskReddit comments"``.
+
+        """
+        self._connection = sqlite3.connect(database)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS checkpoints (id, state, updated_at)")
+        self._connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_checkpoints_id on checkpoints(id)")
+        self._connection.commit()
+        self.key = key
+
+    def load(self) -> dict[str, Any] | None:
+        """Return the state saved under ``key``, or ``None`` if there is none."""
+        row = self._connection.execute("SELECT state FROM checkpoints WHERE id=?", (self.key,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def save(self, state: dict[str, Any]) -> None:
+        """Save the state under ``key``."""
+        self._connection.execute(
+            "REPLACE INTO checkpoints VALUES (?, ?, ?)",
+            (self.key, json.dumps(state), datetime.now(timezone.utc).isoformat()),
+        )
+        self._connection.commit()
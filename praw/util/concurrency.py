@@ -0,0 +1,166 @@
+"""Utilities for sharing a :class:`.Reddit` instance across threads."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from prawcore.rate_limit import RateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+    from concurrent.futures import Future
+
+    from requests.models import Response
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def ordered_map(function: Callable[[_T], _R], iterable: Iterable[_T], *, workers: int) -> Iterator[_R]:
+    """Yield ``function`` applied to each item of ``iterable``, in order.
+
+    :param function: The function to call with each item.
+    :param iterable: The items. They are consumed only as fast as results are yielded.
+    :param workers: The maximum number of calls to ``function`` in progress at once.
+
+    Unlike :py:meth:`concurrent.futures.Executor.map`, no more than ``workers`` items
+    are taken from ``iterable`` ahead of the result being yielded, so that arbitrarily
+    long iterables can be processed.
+
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[_R]] = deque()
+        for item in iterable:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class _Call:
+    """A call in progress whose outcome is shared by :class:`.SingleFlight`."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.exception: BaseException | None = None
+        self.result: Any = None
+
+
+class SingleFlight:
+    """Share the outcome of a call among the callers that make it at the same time.
+
+    While a call for a given key is in progress, other threads making a call with the
+    same key wait for it to complete instead of calling the function again, and then
+    receive its result or exception. A call that starts after the previous one completed
+    calls the function again; nothing is cached.
+
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state without the lock and calls in progress for pickling."""
+        return {}
+
+    def __init__(self) -> None:
+        """Initialize a :class:`.SingleFlight` instance."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = Lock()
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state after unpickling."""
+        self.__init__()
+
+    def call(self, key: Hashable, function: Callable[[], _R]) -> tuple[_R, bool]:
+        """Return the result of ``function``, or that of a call in progress for ``key``.
+
+        :param key: Identifies calls that are interchangeable.
+        :param function: The function to call when no call for ``key`` is in progress.
+
+        :returns: A tuple of the result, and whether it is shared with the thread that
+            called ``function``. Callers receiving a shared result must not modify it.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result, True
+        try:
+            call.result = function()
+        except BaseException as exception:
+            call.exception = exception
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class ThreadSafeRateLimiter(RateLimiter):
+    """A ``prawcore`` rate limiter that may be used by several threads at once.
+
+    The rate limit state is only ever read or written while holding a lock, but the lock
+    is released while the HTTP request is in flight so that requests from different
+    threads overlap.
+
+    Because the callback producing the request headers runs while the lock is held, an
+    expired access token is refreshed by exactly one thread; the others wait for the
+    refresh to complete and then reuse the new token.
+
+    """
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state of the rate limiter without its lock for pickling."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __init__(self, *, window_size: int) -> None:
+        """Initialize a :class:`.ThreadSafeRateLimiter` instance.
+
+        :param window_size: The size of the rate limit reset window in seconds.
+
+        """
+        super().__init__(window_size=window_size)
+        self._lock = Lock()
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of the rate limiter with a new lock."""
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def call(
+        self,
+        *,
+        method: str,
+        request_function: Callable[..., Response],
+        set_header_callback: Callable[[], dict[str, str]],
+        url: str,
+        **kwargs: Any,
+    ) -> Response:
+        """Rate limit the call to ``request_function``.
+
+        :param method: The HTTP method of the request.
+        :param request_function: A function call that returns an HTTP response object.
+        :param set_header_callback: A callback function used to set the request headers.
+            This callback is called after any necessary sleep time occurs.
+        :param url: The URL of the request.
+        :param kwargs: The keyword arguments to ``request_function``.
+
+        """
+        with self._lock:
+            self.delay()
+            kwargs["headers"] = set_header_callback()
+        response = request_function(method, url, **kwargs)
+        with self._lock:
+            self.update(response_headers=response.headers)
+        return response
@@ -0,0 +1,62 @@
+"""Provide the JSON decoders that may be used to decode responses."""
+
+from __future__ import annotations
+
+import json
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from requests.models import Response
+
+JSON_DECODERS = ("json", "msgspec", "orjson")
+
+
+def _msgspec_loads() -> Callable[[bytes | str], Any]:
+    msgspec = import_module("msgspec")
+    decode, decode_error = msgspec.json.decode, msgspec.DecodeError
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decode(data)
+        except decode_error as exception:
+            # ``prawcore`` expects decoding errors to be a ValueError.
+            raise ValueError(str(exception)) from exception
+
+    return loads
+
+
+def json_loads(decoder: str) -> Callable[[bytes | str], Any]:
+    """Return a function that decodes JSON using ``decoder``.
+
+    :param decoder: One of ``"json"``, ``"msgspec"``, or ``"orjson"``.
+
+    :raises: :py:class:`ImportError` if the package for ``decoder`` is not installed.
+
+    """
+    if decoder not in JSON_DECODERS:
+        msg = f"An incorrect config value was given for option json_decoder. The expected value is one of {', '.join(JSON_DECODERS)}, but the given value is {decoder}."
+        raise ValueError(msg)
+    if decoder == "msgspec":
+        return _msgspec_loads()
+    if decoder == "orjson":
+        return import_module("orjson").loads
+    return json.loads
+
+
+class JSONResponseHook:
+    """A ``requests`` response hook that decodes responses with a given function."""
+
+    def __call__(self, response: Response, **_: Any) -> None:
+        """Replace ``response.json`` with a call to the decoding function."""
+        response.json = lambda **_: self.loads(response.content)
+
+    def __init__(self, loads: Callable[[bytes | str], Any]) -> None:
+        """Initialize a :class:`.JSONResponseHook` instance.
+
+        :param loads: The function used to decode the body of each response.
+
+        """
+        self.loads = loads
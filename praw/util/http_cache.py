@@ -0,0 +1,204 @@
+"""Provide a persistent HTTP cache that revalidates responses with Reddit."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from copy import copy
+from datetime import datetime, timezone
+from hashlib import sha256
+from threading import Lock
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from requests.adapters import HTTPAdapter
+from requests.status_codes import codes
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable
+
+    from requests import PreparedRequest, Response
+
+
+class CachedResponse(NamedTuple):
+    """A response saved by :class:`.HTTPCache`."""
+
+    body: bytes
+    etag: str | None
+    headers: dict[str, str]
+    last_modified: str | None
+
+
+class HTTPCache:
+    """Provides a SQLite3 based store for responses and their validators.
+
+    Only successful responses to ``GET`` requests that carry an ``ETag`` or a
+    ``Last-Modified`` header are stored. Later requests for the same URL are made
+    conditional, so that Reddit can reply with ``304 Not Modified`` instead of sending
+    the body again.
+
+    The database can be shared by many processes, which lets a freshly started process
+    revalidate what another process has already downloaded. The responses saved least
+    recently are discarded to keep about ``max_entries`` of them. This is done on the
+    first save, and then every ``PRUNE_INTERVAL`` saves, so the database may briefly hold
+    more.
+
+    An instance is used when the ``http_cache`` configuration option is set. See
+    :ref:`misc_options` for more info.
+
+    """
+
+    #: The number of saves between discarding the responses over ``max_entries``.
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, database: str | os.PathLike[str], *, max_entries: int = 10000) -> None:
+        """Initialize a :class:`.HTTPCache` instance.
+
+        :param database: The path to the SQLite database. It is created on first use.
+        :param max_entries: The maximum number of responses to keep (default:
+            ``10000``).
+
+        """
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key PRIMARY KEY, etag, last_modified, headers, body, updated_at)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS ix_responses_updated_at on responses(updated_at)")
+        self._connection.commit()
+        self._lock = Lock()
+        self.hits = 0
+        self.max_entries = max_entries
+        self.misses = 0
+        self._saves_until_prune = 0
+
+    def _prune(self) -> None:
+        self._connection.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def clear(self) -> None:
+        """Discard all saved responses."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def load(self, key: str) -> CachedResponse | None:
+        """Return the response saved under ``key``, or ``None`` if there is none."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, headers, last_modified FROM responses WHERE key=?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, headers, last_modified = row
+        return CachedResponse(body=body, etag=etag, headers=json.loads(headers), last_modified=last_modified)
+
+    def record(self, *, hit: bool) -> None:
+        """Count a request that was, or was not, answered from the cache.
+
+        :param hit: Whether the saved response was reused.
+
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def save(self, key: str, response: CachedResponse) -> None:
+        """Save ``response`` under ``key``, replacing any previously saved response.
+
+        Every ``PRUNE_INTERVAL`` saves, the responses saved least recently are discarded
+        to stay within ``max_entries``.
+
+        """
+        with self._lock:
+            self._connection.execute(
+                "REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.etag,
+                    response.last_modified,
+                    json.dumps(response.headers),
+                    response.body,
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+            self._saves_until_prune -= 1
+            if self._saves_until_prune <= 0:
+                self._prune()
+                self._saves_until_prune = self.PRUNE_INTERVAL
+            self._connection.commit()
+
+
+class HTTPCacheAdapter(HTTPAdapter):
+    """A transport adapter that revalidates ``GET`` requests with an :class:`.HTTPCache`.
+
+    A ``304 Not Modified`` reply is turned into a ``200 OK`` response carrying the saved
+    body, so that the rest of PRAW, and prawcore, handle it like any other response.
+
+    """
+
+    # The headers of a saved response that a ``304 Not Modified`` reply does not repeat.
+    # The body is saved decoded, so ``Content-Encoding`` is not one of them.
+    SAVED_HEADERS = ("content-type",)
+
+    def __init__(
+        self,
+        cache: HTTPCache,
+        *,
+        identity: Callable[[PreparedRequest], str | None],
+        **kwargs: Any,
+    ) -> None:
+        """Initialize a :class:`.HTTPCacheAdapter` instance.
+
+        :param cache: The :class:`.HTTPCache` to save responses in.
+        :param identity: A function returning a string that identifies the credentials
+            a request is made with, or ``None`` if its response must not be cached.
+            Responses are only reused for requests with the same identity.
+
+        Additional keyword arguments are passed to :class:`requests.adapters.HTTPAdapter`.
+
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.identity = identity
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:  # pyright: ignore[reportIncompatibleMethodOverride]  # the remaining arguments are passed through to HTTPAdapter.send
+        """Send ``request``, revalidating a saved response when there is one."""
+        if request.method != "GET" or kwargs.get("stream") or (identity := self.identity(request)) is None:
+            return super().send(request, **kwargs)
+        key = sha256(f"{identity}\0{request.url}".encode()).hexdigest()
+        saved = self.cache.load(key)
+        if saved is not None:
+            if saved.etag is not None:
+                request.headers["If-None-Match"] = saved.etag
+            if saved.last_modified is not None:
+                request.headers["If-Modified-Since"] = saved.last_modified
+        response = super().send(request, **kwargs)
+        if response.status_code == codes["not_modified"] and saved is not None:
+            self.cache.record(hit=True)
+            return self._revalidated(response, saved)
+        self.cache.record(hit=False)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == codes["ok"] and (etag or last_modified):
+            headers = {name: response.headers[name] for name in self.SAVED_HEADERS if name in response.headers}
+            self.cache.save(
+                key, CachedResponse(body=response.content, etag=etag, headers=headers, last_modified=last_modified)
+            )
+        return response
+
+    @staticmethod
+    def _revalidated(response: Response, saved: CachedResponse) -> Response:
+        revalidated = copy(response)
+        revalidated.headers = copy(response.headers)
+        revalidated.headers.pop("Content-Encoding", None)
+        revalidated.headers.update(saved.headers)
+        revalidated.headers["Content-Length"] = str(len(saved.body))
+        revalidated._content = saved.body
+        revalidated._content_consumed = True
+        revalidated.reason = "OK"
+        revalidated.status_code = 200
+        return revalidated
@@ -0,0 +1,270 @@
+"""Provide hooks to measure the requests made by a :class:`.Reddit` instance."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from importlib import import_module
+from logging import getLogger
+from threading import local
+from typing import TYPE_CHECKING, Any
+
+from praw.const import __version__
+from praw.endpoints import API_PATH
+from praw.util.cache import endpoint_name
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from requests.models import Response
+
+logger = getLogger("praw")
+
+
+class RequestEvent:
+    """Describes a request made through :meth:`.Reddit.request`.
+
+    An instance is passed to each hook added with :meth:`.Reddit.add_request_hook` once
+    the request, and building objects from its response, has completed.
+
+    ========================= ==========================================================
+    Attribute                 Description
+    ========================= ==========================================================
+    ``attempt``               The number of times the request was previously made and
+                              failed because of a rate limit, see :meth:`.Reddit.post`.
+    ``cached``                Whether the response came from the response cache.
+    ``duration``              The number of seconds from the start of the request until
+                              objects were built from its response.
+    ``endpoint``              The name of the endpoint in ``praw.endpoints.API_PATH``,
+                              or ``None`` if ``path`` does not match one.
+    ``exception``             The exception raised by the request, or ``None``.
+    ``method``                The HTTP method of the request.
+    ``network_time``          The number of seconds spent sending the request and
+                              receiving the response, including retries.
+    ``objectify_time``        The number of seconds spent building objects from the
+                              response.
+    ``parse_time``            The number of seconds spent decoding the response.
+    ``path``                  The path of the request.
+    ``ratelimit_remaining``   The number of requests remaining in the rate limit
+                              window, as reported by Reddit.
+    ``ratelimit_reset``       The number of seconds until the rate limit window resets,
+                              as reported by Reddit.
+    ``ratelimit_used``        The number of requests used in the rate limit window, as
+                              reported by Reddit.
+    ``response_bytes``        The size of the body of the response.
+    ``retries``               The number of times the request was retried because of a
+                              server error or an expired access token.
+    ``shared``                Whether the response was shared with an identical request
+                              made by another thread at the same time.
+    ``started_at``            When the request started, in nanoseconds since the epoch.
+    ``status``                The HTTP status code of the response, or ``None`` when no
+                              response was received.
+    ``template``              The path template of ``endpoint``, e.g.,
+                              ``"r/{subreddit}/about/"``, or ``None``.
+    ========================= ==========================================================
+
+    """
+
+    def __init__(self, *, attempt: int = 0, method: str, path: str) -> None:
+        """Initialize a :class:`.RequestEvent` instance.
+
+        :param attempt: The number of previous attempts at the request (default: ``0``).
+        :param method: The HTTP method of the request.
+        :param path: The path of the request.
+
+        """
+        self.attempt = attempt
+        self.cached = False
+        self.duration = 0.0
+        self.endpoint = endpoint_name(path)
+        self.exception: BaseException | None = None
+        self.method = method
+        self.network_time = 0.0
+        self.objectify_time = 0.0
+        self.parse_time = 0.0
+        self.path = path
+        self.ratelimit_remaining: float | None = None
+        self.ratelimit_reset: float | None = None
+        self.ratelimit_used: int | None = None
+        self.response_bytes = 0
+        self.retries = 0
+        self.shared = False
+        self.started_at = time.time_ns()
+        self.status: int | None = None
+        self.template = None if self.endpoint is None else API_PATH[self.endpoint]
+
+    def __repr__(self) -> str:
+        """Return an object initialization representation of the instance."""
+        return f"{self.__class__.__name__}(method={self.method!r}, path={self.path!r}, status={self.status!r})"
+
+
+class RequestInstrumentation:
+    """Collects a :class:`.RequestEvent` for each request and passes it to the hooks.
+
+    The event of the request in progress is kept per thread. Requests made while another
+    is in progress on the same thread, e.g., through :meth:`.Reddit.request` from
+    :meth:`.Reddit.get`, contribute to the event of the outermost request.
+
+    """
+
+    # Requests for access tokens are made on behalf of other requests, and are not
+    # measured.
+    ACCESS_TOKEN_PATH = "/api/v1/access_token"  # ruff:ignore[hardcoded-password-string]
+
+    @property
+    def current(self) -> RequestEvent | None:
+        """The event of the request in progress on the current thread, if any."""
+        return getattr(self._local, "event", None)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return an empty state for pickling, as hooks are not kept."""
+        return {}
+
+    def __init__(self) -> None:
+        """Initialize a :class:`.RequestInstrumentation` instance."""
+        self._local = local()
+        self.hooks: list[Callable[[RequestEvent], Any]] = []
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state after unpickling."""
+        self.__init__()
+
+    def _emit(self, event: RequestEvent) -> None:
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("The request hook %r failed", hook)
+
+    def response_hook(self, response: Response, **_: Any) -> None:
+        """Record the status, size, timing and rate limit headers of ``response``.
+
+        This is a ``requests`` response hook. It wraps ``response.json`` in order to
+        measure the time spent decoding the response.
+
+        """
+        event = self.current
+        if event is None or (response.request.path_url or "").startswith(self.ACCESS_TOKEN_PATH):
+            return
+        started = time.perf_counter()
+        event.response_bytes = len(response.content)
+        event.network_time += response.elapsed.total_seconds() + time.perf_counter() - started
+        if event.status is not None:
+            event.retries += 1
+        event.status = response.status_code
+        headers = response.headers
+        if "x-ratelimit-remaining" in headers:
+            event.ratelimit_remaining = float(headers["x-ratelimit-remaining"])
+        if "x-ratelimit-reset" in headers:
+            event.ratelimit_reset = float(headers["x-ratelimit-reset"])
+        if "x-ratelimit-used" in headers:
+            event.ratelimit_used = int(headers["x-ratelimit-used"])
+
+        decode = response.json
+
+        def timed_decode(**kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return decode(**kwargs)
+            finally:
+                event.parse_time += time.perf_counter() - started
+
+        response.json = timed_decode
+
+    @contextmanager
+    def track(self, *, attempt: int = 0, method: str, path: str) -> Generator[RequestEvent | None, None, None]:
+        """Collect the event of a request, and pass it to the hooks when it completes.
+
+        :param attempt: The number of previous attempts at the request (default: ``0``).
+        :param method: The HTTP method of the request.
+        :param path: The path of the request.
+
+        Yields the event to update, or ``None`` when there are no hooks. When a request
+        is already in progress on the current thread, its event is yielded instead.
+
+        """
+        outer = self.current
+        if outer is not None or not self.hooks:
+            yield outer
+            return
+        event = self._local.event = RequestEvent(attempt=attempt, method=method, path=path)
+        started = time.perf_counter()
+        try:
+            yield event
+        except BaseException as exception:
+            event.exception = exception
+            raise
+        finally:
+            event.duration = time.perf_counter() - started
+            self._local.event = None
+            self._emit(event)
+
+
+class OpenTelemetryHook:
+    """A request hook that records each request as an OpenTelemetry span.
+
+    This requires the ``opentelemetry-api`` package. Spans are only exported when an
+    OpenTelemetry SDK is configured; otherwise, they are discarded.
+
+    For example, to record the requests made by ``reddit``, try:
+
+    .. code-block:: python
+
+        from praw.util.instrumentation import OpenTelemetryHook
+
+        reddit.add_request_hook(OpenTelemetryHook())
+
+    """
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Record ``event`` as a span."""
+        span = self.tracer.start_span(
+            f"{event.method} {event.template or event.path}",
+            attributes=self.attributes(event),
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=event.started_at,
+        )
+        if event.exception is not None:
+            span.record_exception(event.exception)
+            span.set_attribute("error.type", type(event.exception).__qualname__)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.exception)))
+        span.end(end_time=event.started_at + int(event.duration * 1_000_000_000))
+
+    def __init__(self, tracer: Any | None = None) -> None:
+        """Initialize an :class:`.OpenTelemetryHook` instance.
+
+        :param tracer: The OpenTelemetry tracer to create spans with. When ``None``, the
+            tracer named ``praw`` of the global tracer provider is used (default:
+            ``None``).
+
+        :raises: :py:class:`ImportError` if ``opentelemetry-api`` is not installed.
+
+        """
+        self._trace = import_module("opentelemetry.trace")
+        self.tracer = tracer or self._trace.get_tracer("praw", __version__)
+
+    @staticmethod
+    def attributes(event: RequestEvent) -> dict[str, Any]:
+        """Return the attributes of the span recording ``event``."""
+        attributes: dict[str, Any] = {
+            "http.request.method": event.method,
+            "praw.attempt": event.attempt,
+            "praw.cached": event.cached,
+            "praw.network_time": event.network_time,
+            "praw.objectify_time": event.objectify_time,
+            "praw.parse_time": event.parse_time,
+            "praw.retries": event.retries,
+            "praw.shared": event.shared,
+            "url.path": event.path,
+        }
+        optional = {
+            "http.response.body.size": event.response_bytes if event.status is not None else None,
+            "http.response.status_code": event.status,
+            "praw.endpoint": event.endpoint,
+            "praw.ratelimit.remaining": event.ratelimit_remaining,
+            "praw.ratelimit.reset": event.ratelimit_reset,
+            "praw.ratelimit.used": event.ratelimit_used,
+            "url.template": event.template,
+        }
+        attributes.update({key: value for key, value in optional.items() if value is not None})
+        return attributes
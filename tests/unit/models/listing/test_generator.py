@@ -1,13 +1,65 @@
 """Test praw.models.listing.generator."""
 
+import asyncio
+import gc
+import threading
+from weakref import WeakMethod
+
 import pytest
 
-from praw.models.listing.generator import ListingGenerator
+from praw.exceptions import RedditAPIException
+from praw.models import Comment
+from praw.models.listing.generator import ListingGenerator, _call_weakly
+from praw.models.listing.listing import Listing
 
 from ... import UnitTest
 
 
 class TestListingGenerator(UnitTest):
+    @staticmethod
+    def patch_get(reddit, pages):
+        requested = []
+
+        def get(path, params=None):
+            requested.append(dict(params))
+            return Listing(reddit, _data=pages[len(requested) - 1])
+
+        reddit.get = get
+        return requested
+
+    @staticmethod
+    def patch_request(reddit, pages):
+        requested = []
+
+        def request(*, method, params, path):
+            assert method == "GET"
+            requested.append(dict(params))
+            return pages[len(requested) - 1]
+
+        reddit.request = request
+        return requested
+
+    def test_async_iteration(self, reddit):
+        pages = [
+            {"after": "t3_b", "children": [{"id": "a"}, {"id": "b"}]},
+            {"after": None, "children": [{"id": "c"}]},
+        ]
+        requested = self.patch_get(reddit, pages)
+
+        async def collect():
+            return [item async for item in ListingGenerator(reddit, "listing", limit=None)]
+
+        assert asyncio.run(collect()) == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        assert [params.get("after") for params in requested] == [None, "t3_b"]
+
+    def test_async_iteration__limit(self, reddit):
+        self.patch_get(reddit, [{"after": "t3_b", "children": [{"id": "a"}, {"id": "b"}]}])
+
+        async def collect():
+            return [item async for item in ListingGenerator(reddit, "listing", limit=1)]
+
+        assert asyncio.run(collect()) == [{"id": "a"}]
+
     def test_bad_dict(self):
         generator = ListingGenerator(None, None)
         with pytest.raises(ValueError) as excinfo:
@@ -16,9 +68,224 @@ class TestListingGenerator(UnitTest):
             "The generator returned a dictionary PRAW didn't recognize. File a bug report at PRAW."
         )
 
+    @pytest.mark.parametrize("option", ["lazy", "raw"])
+    def test_error(self, option, reddit):
+        self.patch_request(reddit, [{"json": {"errors": [["RATELIMIT", "Take a break.", "ratelimit"]]}}])
+        with pytest.raises(RedditAPIException) as excinfo:
+            next(ListingGenerator(reddit, "listing", **{option: True}))
+        assert excinfo.value.items[0].error_type == "RATELIMIT"
+
+    def test_lazy(self, reddit):
+        pages = [
+            {
+                "data": {
+                    "after": "t1_b",
+                    "children": [{"data": {"id": "a"}, "kind": "t1"}, {"data": {"id": "b"}, "kind": "t1"}],
+                },
+                "kind": "Listing",
+            },
+            [
+                {"data": {"after": None, "children": []}, "kind": "Listing"},
+                {"data": {"after": None, "children": [{"data": {"id": "c"}, "kind": "t1"}]}, "kind": "Listing"},
+            ],
+        ]
+        requested = self.patch_request(reddit, pages)
+        objectified = []
+        objectify = reddit._objector.objectify
+
+        def record(*, data):
+            objectified.append(data)
+            return objectify(data=data)
+
+        reddit._objector.objectify = record
+        generator = ListingGenerator(reddit, "listing", lazy=True, limit=None)
+        comment = next(generator)
+        assert isinstance(comment, Comment)
+        assert comment.id == "a"
+        assert len(objectified) == 1
+        assert [comment.id for comment in generator] == ["b", "c"]
+        assert len(objectified) == 3
+        assert [params.get("after") for params in requested] == [None, "t1_b"]
+
+    def test_lazy__flair(self, reddit):
+        pages = [
+            {"next": "b", "users": [{"flair_text": "a", "user": "a"}]},
+            {"users": [{"flair_text": "b", "user": "b"}]},
+        ]
+        requested = self.patch_request(reddit, pages)
+        generator = ListingGenerator(reddit, "flair", lazy=True, limit=None)
+        assert [str(item["user"]) for item in generator] == ["a", "b"]
+        assert [params.get("after") for params in requested] == [None, "b"]
+
     def test_params_are_not_modified(self):
         params = {"prawtest": "yes"}
         generator = ListingGenerator(None, None, params=params)
         assert "limit" in generator.params
         assert "limit" not in params
         assert ("prawtest", "yes") in generator.params.items()
+
+    def test_prefetch(self, reddit):
+        pages = [
+            {"after": "t3_b", "children": [{"id": "a"}, {"id": "b"}]},
+            {"after": "t3_d", "children": [{"id": "c"}, {"id": "d"}]},
+            {"after": "t3_e", "children": [{"id": "e"}]},
+            {"after": None, "children": [{"id": "f"}]},
+        ]
+        requested = self.patch_get(reddit, pages)
+        generator = ListingGenerator(reddit, "listing", limit=None, prefetch=2)
+        assert next(generator) == {"id": "a"}
+        generator._pending[-1].result()
+        # The two following pages are requested while the first is iterated over
+        assert [params.get("after") for params in requested] == [None, "t3_b", "t3_d"]
+        assert list(generator) == [{"id": "b"}, {"id": "c"}, {"id": "d"}, {"id": "e"}, {"id": "f"}]
+        assert [params.get("after") for params in requested] == [None, "t3_b", "t3_d", "t3_e"]
+        assert generator._executor is None
+
+    def test_prefetch__close(self, reddit):
+        pages = [
+            {"after": "t3_a", "children": [{"id": "a"}]},
+            {"after": "t3_b", "children": [{"id": "b"}]},
+            {"after": None, "children": [{"id": "c"}]},
+        ]
+        requested = self.patch_get(reddit, pages)
+        generator = ListingGenerator(reddit, "listing", limit=None, prefetch=2)
+        assert next(generator) == {"id": "a"}
+        executor = generator._executor
+        generator.close()
+        assert executor._shutdown
+        assert generator._executor is None
+        assert not generator._pending
+        assert list(generator) == [{"id": "b"}, {"id": "c"}]
+        assert requested[-1].get("after") == "t3_b"
+
+    def test_prefetch__del(self, reddit):
+        release = threading.Event()
+        started = threading.Event()
+
+        def get(path, params=None):
+            if params.get("after"):
+                started.set()
+                release.wait(5)
+            return Listing(reddit, _data={"after": f"t3_{len(params)}", "children": [{"id": "a"}]})
+
+        reddit.get = get
+        generator = ListingGenerator(reddit, "listing", limit=None, prefetch=2)
+        assert next(generator) == {"id": "a"}
+        started.wait(5)
+        executor = generator._executor
+        running, queued = generator._pending
+        del generator
+        gc.collect()
+        # The page being requested keeps the generator alive until it is received.
+        release.set()
+        assert list(running.result()[0]) == [{"id": "a"}]
+        assert queued.cancelled()
+        assert executor._shutdown
+
+    def test_prefetch__del__dequeued(self, reddit):
+        method = WeakMethod(ListingGenerator(reddit, "listing")._fetch_page)
+        assert _call_weakly(method, {}) == ([], None)
+
+    def test_prefetch__exception(self, reddit):
+        failures = []
+
+        def get(path, params=None):
+            if params.get("after") and not failures:
+                failures.append(params)
+                raise RuntimeError
+            if params.get("after"):
+                return Listing(reddit, _data={"after": None, "children": [{"id": "b"}]})
+            return Listing(reddit, _data={"after": "t3_a", "children": [{"id": "a"}]})
+
+        reddit.get = get
+        generator = ListingGenerator(reddit, "listing", limit=None, prefetch=1)
+        assert next(generator) == {"id": "a"}
+        with pytest.raises(RuntimeError):
+            next(generator)
+        assert generator._executor is None
+        # The failed page is requested again rather than its failure being raised again.
+        assert list(generator) == [{"id": "b"}]
+
+    def test_prefetch__limit(self, reddit):
+        pages = [
+            {"after": "t3_b", "children": [{"id": "a"}, {"id": "b"}]},
+            {"after": "t3_d", "children": [{"id": "c"}, {"id": "d"}]},
+            {"after": "t3_f", "children": [{"id": "e"}, {"id": "f"}]},
+        ]
+        requested = self.patch_get(reddit, pages)
+        generator = ListingGenerator(reddit, "listing", limit=3, prefetch=5, request_limit=2)
+        assert list(generator) == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        assert [params.get("after") for params in requested] == [None, "t3_b"]
+
+    def test_prefetch__raw(self, reddit):
+        pages = [
+            {"data": {"after": "t1_a", "children": [{"data": {"id": "a"}, "kind": "t1"}]}, "kind": "Listing"},
+            {"data": {"after": None, "children": [{"data": {"id": "b"}, "kind": "t1"}]}, "kind": "Listing"},
+        ]
+        requested = self.patch_request(reddit, pages)
+        generator = ListingGenerator(reddit, "listing", limit=None, prefetch=3, raw=True)
+        assert list(generator) == [{"id": "a"}, {"id": "b"}]
+        assert [params.get("after") for params in requested] == [None, "t1_a"]
+
+    def test_raw(self, reddit):
+        pages = [
+            {
+                "data": {
+                    "after": "t1_b",
+                    "children": [{"data": {"id": "a"}, "kind": "t1"}, {"data": {"id": "b"}, "kind": "t1"}],
+                },
+                "kind": "Listing",
+            },
+            {"data": {"after": None, "children": [{"data": {"id": "c"}, "kind": "t1"}]}, "kind": "Listing"},
+        ]
+        requested = self.patch_request(reddit, pages)
+        generator = ListingGenerator(reddit, "listing", limit=None, raw=True)
+        assert list(generator) == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        assert [params.get("after") for params in requested] == [None, "t1_b"]
+
+    def test_raw__duplicates(self, reddit):
+        listing = {"data": {"after": None, "children": [{"data": {"id": "b"}, "kind": "t3"}]}, "kind": "Listing"}
+        self.patch_request(reddit, [[{"data": {}, "kind": "Listing"}, listing]])
+        assert list(ListingGenerator(reddit, "duplicates", raw=True)) == [{"id": "b"}]
+
+    def test_raw__flair(self, reddit):
+        pages = [
+            {"next": "b", "users": [{"flair_text": "a", "user": "a"}]},
+            {"users": [{"flair_text": "b", "user": "b"}]},
+        ]
+        requested = self.patch_request(reddit, pages)
+        assert [item["user"] for item in ListingGenerator(reddit, "flair", limit=None, raw=True)] == ["a", "b"]
+        assert [params.get("after") for params in requested] == [None, "b"]
+
+    def test_raw__mod_notes(self, reddit):
+        pages = [
+            {"end_cursor": "x", "has_next_page": True, "mod_notes": [{"id": "a"}]},
+            {"end_cursor": "y", "has_next_page": False, "mod_notes": [{"id": "b"}]},
+        ]
+        requested = self.patch_request(reddit, pages)
+        assert list(ListingGenerator(reddit, "notes", limit=None, raw=True)) == [{"id": "a"}, {"id": "b"}]
+        assert [params.get("before") for params in requested] == [None, "x"]
+
+    def test_raw__modmail_conversations(self, reddit):
+        pages = [
+            {
+                "conversationIds": ["b", "a"],
+                "conversations": {"a": {"id": "a", "objIds": []}, "b": {"id": "b", "objIds": []}},
+                "messages": {},
+            },
+            {"conversationIds": [], "conversations": {}, "messages": {}},
+        ]
+        requested = self.patch_request(reddit, pages)
+        generator = ListingGenerator(reddit, "api/mod/conversations", limit=None, raw=True)
+        assert [item["id"] for item in generator] == ["b", "a"]
+        assert [params.get("after") for params in requested] == [None, "a"]
+
+    def test_raw__unrecognized(self, reddit):
+        self.patch_request(reddit, [{"unexpected": []}])
+        with pytest.raises(ValueError):
+            next(ListingGenerator(reddit, "listing", raw=True))
+
+    def test_raw__user_list(self, reddit):
+        banned = [{"date": 1.0, "id": "t2_a", "name": "a", "rel_id": "rb_a"}]
+        self.patch_request(reddit, [{"data": {"after": None, "children": banned}, "kind": "UserList"}])
+        assert list(ListingGenerator(reddit, "r/test/about/banned/", raw=True)) == banned
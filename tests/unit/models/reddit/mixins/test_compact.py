@@ -0,0 +1,82 @@
+import pickle
+
+import pytest
+
+from praw import Reddit
+from praw.models import Comment, Redditor, Submission, Subreddit
+
+from .... import UnitTest
+
+
+class TestCompactMixin(UnitTest):
+    @pytest.fixture
+    def compact_reddit(self):
+        reddit = Reddit(client_id="dummy", client_secret="dummy", compact_models=True, user_agent="dummy")
+        reddit._core.request = None
+        return reddit
+
+    @staticmethod
+    def comment_data(**data):
+        return {
+            "author": "spez",
+            "body": "Hello",
+            "context": "/r/test/comments/abc/title/dummy/?context=3",
+            "id": "dummy",
+            "replies": "",
+            "score": 1,
+            "subreddit": "test",
+            **data,
+        }
+
+    def test_attributes(self, compact_reddit):
+        comment = Comment(compact_reddit, _data=self.comment_data())
+        assert set(comment.__dict__) == {"_compact", "_fetched", "_reddit", "_replies", "_submission", "id"}
+        assert comment.body == "Hello"
+        assert comment.score == 1
+        assert isinstance(comment.author, Redditor)
+        assert comment.author is comment.author
+        assert isinstance(comment.subreddit, Subreddit)
+        assert comment.submission.id == "abc"
+        assert comment.replies.list() == []
+
+    def test_delete(self, compact_reddit):
+        comment = Comment(compact_reddit, _data=self.comment_data())
+        del comment.body
+        assert not comment._has_attribute("body")
+        comment.body = "Changed"
+        assert comment.body == "Changed"
+        comment.other = 1
+        del comment.other
+        assert not comment._has_attribute("other")
+
+    def test_disabled(self, reddit):
+        comment = Comment(reddit, _data=self.comment_data())
+        assert "_compact" not in comment.__dict__
+        assert comment.__dict__["body"] == "Hello"
+
+    def test_missing_attribute(self, compact_reddit):
+        with pytest.raises(AttributeError):
+            Comment(compact_reddit, _data=self.comment_data())._missing  # noqa: B018
+
+    def test_pickle(self, compact_reddit):
+        comment = Comment(compact_reddit, _data=self.comment_data())
+        assert comment.body == "Hello"
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(comment, protocol=level))
+            assert other.body == "Hello"
+            assert other.author == "spez"
+
+    def test_setattr(self, compact_reddit):
+        submission = Submission(compact_reddit, _data={"author": "spez", "id": "dummy", "title": "Title"})
+        submission.author = "bboe"
+        submission.title = "Changed"
+        assert "author" not in submission.__dict__
+        assert submission.author == "bboe"
+        assert submission.title == "Changed"
+
+    def test_update(self, compact_reddit):
+        comment = Comment(compact_reddit, _data=self.comment_data())
+        assert comment.score == 1
+        other = Comment(compact_reddit, _data=self.comment_data(score=5))
+        comment.__dict__.update(other.__dict__)
+        assert comment.score == 5
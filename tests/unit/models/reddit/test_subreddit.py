@@ -272,6 +272,40 @@ class TestSubredditModmailConversationsStream(UnitTest):
         assert submodstream.subreddit == "all"
 
 
+class TestSubredditStream(UnitTest):
+    @pytest.mark.parametrize(
+        ("display_name", "expected"),
+        [
+            ("test", ["t1_1"]),
+            ("Test+other", ["t1_1", "t1_3"]),
+            ("all", ["t1_1", "t1_2", "t1_3"]),
+            ("all-other", ["t1_1", "t1_2"]),
+        ],
+    )
+    def test__backfill(self, display_name, expected, reddit):
+        comments = [
+            mock.Mock(fullname="t1_1", subreddit=Subreddit(reddit, "test")),
+            mock.Mock(fullname="t1_2", subreddit=Subreddit(reddit, "third")),
+            mock.Mock(fullname="t1_3", subreddit=Subreddit(reddit, "Other")),
+        ]
+        stream = Subreddit(reddit, display_name).stream
+        with mock.patch.object(reddit, "info", return_value=iter(comments)) as info:
+            recovered = list(stream._backfill(iter(["t1_1", "t1_2", "t1_3"])))
+        assert [comment.fullname for comment in recovered] == expected
+        assert list(info.call_args.kwargs["fullnames"]) == ["t1_1", "t1_2", "t1_3"]
+
+    def test_comments__fill_gaps(self, reddit):
+        stream = Subreddit(reddit, "all").stream
+        with mock.patch("praw.models.reddit.subreddit.stream.stream_generator") as stream_generator:
+            stream.comments(fill_gaps=True, pause_after=0)
+        stream_generator.assert_called_once_with(stream.subreddit.comments, backfill=stream._backfill, pause_after=0)
+
+    @pytest.mark.parametrize("display_name", ["friends", "mod", "Popular"])
+    def test_submissions__fill_gaps_unsupported(self, display_name, reddit):
+        with pytest.raises(ValueError):
+            Subreddit(reddit, display_name).stream.submissions(fill_gaps=True)
+
+
 class TestSubredditWiki(UnitTest):
     def test__getitem(self, reddit):
         subreddit = Subreddit(reddit, display_name="name")
@@ -0,0 +1,241 @@
+"""Test praw.models.comment_forest."""
+
+import threading
+
+import pytest
+
+from praw.const import API_PATH
+from praw.exceptions import DuplicateReplaceException
+from praw.models import Comment, MoreComments, Submission
+from praw.models.comment_forest import CommentForest
+
+from .. import UnitTest
+
+
+class TestCommentForest(UnitTest):
+    @staticmethod
+    def comment(reddit, id, parent_id, replies=()):
+        comment = Comment(
+            reddit, _data={"id": id, "link_id": "t3_s", "name": f"t1_{id}", "parent_id": parent_id, "replies": ""}
+        )
+        comment._replies = list(replies)
+        return comment
+
+    @staticmethod
+    def more(reddit, id, parent_id, children):
+        return MoreComments(
+            reddit,
+            {"children": children, "count": len(children), "id": id, "name": f"t1_{id}", "parent_id": parent_id},
+        )
+
+    def forest(self, reddit):
+        """Return a forest along with the comments Reddit would return for its stubs.
+
+        The forest is::
+
+            a
+            +-- [more: b, c]
+            d
+            [more: e, f, g]
+
+        and resolving ``e`` uncovers a further stub for ``h``.
+
+        """
+        submission = Submission(reddit, id="s")
+        submission._comments = CommentForest(submission)
+        comment_a = self.comment(reddit, "a", "t3_s", [self.more(reddit, "m1", "t1_a", ["b", "c"])])
+        submission._comments._update([
+            comment_a,
+            self.comment(reddit, "d", "t3_s"),
+            self.more(reddit, "m2", "t3_s", ["e", "f", "g"]),
+        ])
+        server = {
+            "b": lambda: self.comment(reddit, "b", "t1_a"),
+            "c": lambda: self.comment(reddit, "c", "t1_b"),
+            "e": lambda: self.comment(reddit, "e", "t3_s"),
+            "f": lambda: self.more(reddit, "m3", "t1_e", ["h"]),
+            "g": lambda: self.comment(reddit, "g", "t3_s"),
+            "h": lambda: self.comment(reddit, "h", "t1_e"),
+        }
+        return submission, server
+
+    @staticmethod
+    def patch_post(reddit, server, barrier=None):
+        requests = []
+
+        def post(path, data):
+            assert path == API_PATH["morechildren"]
+            requests.append(data["children"])
+            if barrier is not None and len(requests) <= barrier.parties:
+                barrier.wait()
+            return [server[child]() for child in data["children"].split(",")]
+
+        reddit.post = post
+        return requests
+
+    def test_list(self, reddit):
+        submission, _ = self.forest(reddit)
+        assert [comment.id for comment in submission.comments.list()] == ["a", "d", "m2", "m1"]
+
+    def test_remove_more_comments__by_identity(self, reddit):
+        more = self.more(reddit, "m1", "t3_s", ["b"])
+        duplicate = self.more(reddit, "m1", "t3_s", ["b"])
+        tree = [duplicate, more]
+        more._remove_from = tree
+        CommentForest._remove_more_comments([more])
+        assert tree == [duplicate]
+        assert tree[0] is duplicate
+
+    def test_replace_more__workers(self, reddit):
+        submission, server = self.forest(reddit)
+        self.patch_post(reddit, server)
+        assert submission.comments.replace_more(limit=None) == []
+        expected = [comment.id for comment in submission.comments.list()]
+
+        submission, server = self.forest(reddit)
+        # Both initial stubs must be requested at the same time to pass the barrier.
+        requests = self.patch_post(reddit, server, barrier=threading.Barrier(2, timeout=5))
+        assert submission.comments.replace_more(limit=None, workers=2) == []
+        assert [comment.id for comment in submission.comments.list()] == expected
+        assert expected == ["a", "d", "e", "g", "b", "h", "c"]
+        assert sorted(requests) == ["b,c", "e,f,g", "h"]
+
+    def test_replace_more__workers_uncovered_stub_first(self, reddit):
+        def forest():
+            submission = Submission(reddit, id="s")
+            submission._comments = CommentForest(submission)
+            submission._comments._update([
+                self.more(reddit, "m1", "t3_s", ["x", "w", "v"]),
+                self.more(reddit, "m2", "t3_s", ["z"]),
+            ])
+            server = {
+                "v": lambda: self.comment(reddit, "v", "t3_s"),
+                "w": lambda: self.comment(reddit, "w", "t3_s"),
+                "x": lambda: self.more(reddit, "m3", "t3_s", ["y", "u"]),
+                "u": lambda: self.comment(reddit, "u", "t3_s"),
+                "y": lambda: self.comment(reddit, "y", "t3_s"),
+                "z": lambda: self.comment(reddit, "z", "t3_s"),
+            }
+            return submission, server
+
+        for limit in (None, 2):
+            submission, server = forest()
+            self.patch_post(reddit, server)
+            expected_skipped = [more.id for more in submission.comments.replace_more(limit=limit)]
+            expected = [comment.id for comment in submission.comments.list()]
+
+            submission, server = forest()
+            self.patch_post(reddit, server)
+            skipped = submission.comments.replace_more(limit=limit, workers=2)
+            assert [more.id for more in skipped] == expected_skipped
+            assert [comment.id for comment in submission.comments.list()] == expected
+        assert expected == ["w", "v", "y", "u"]
+        assert expected_skipped == ["m2"]
+
+    def test_replace_more__workers_with_limit(self, reddit):
+        submission, server = self.forest(reddit)
+        requests = self.patch_post(reddit, server)
+        skipped = submission.comments.replace_more(limit=1, workers=4)
+        assert requests == ["e,f,g"]
+        assert [more.children for more in skipped] == [["b", "c"], ["h"]]
+        assert all(isinstance(comment, Comment) for comment in submission.comments.list())
+
+    def test_replace_more__workers_propagates_exception(self, reddit):
+        submission, _ = self.forest(reddit)
+
+        def post(path, data):
+            raise RuntimeError(data["children"])
+
+        reddit.post = post
+        with pytest.raises(RuntimeError):
+            submission.comments.replace_more(workers=2)
+        types = [type(comment) for comment in submission.comments.list()]
+        assert types.count(MoreComments) == 2
+
+    def test_replace_more__batch(self, reddit):
+        submission, server = self.forest(reddit)
+        self.patch_post(reddit, server)
+        submission.comments.replace_more(limit=None)
+        expected = [comment.id for comment in submission.comments.list()]
+
+        submission, server = self.forest(reddit)
+        requests = self.patch_post(reddit, server)
+        assert submission.comments.replace_more(batch=True, limit=None) == []
+        assert requests == ["e,f,g,b,c", "h"]
+        assert [comment.id for comment in submission.comments.list()] == expected
+
+    def test_replace_more__batch_respects_request_size(self, reddit):
+        submission = Submission(reddit, id="s")
+        submission._comments = CommentForest(submission)
+        large = [f"l{index}" for index in range(99)]
+        submission._comments._update([
+            self.more(reddit, "m1", "t3_s", large),
+            self.more(reddit, "m2", "t3_s", ["x", "y"]),
+            self.more(reddit, "m3", "t3_s", ["z"]),
+            self.more(reddit, "m4", "t1_a", []),
+        ])
+        server = {child: lambda child=child: self.comment(reddit, child, "t3_s") for child in [*large, "x", "y", "z"]}
+        requests = self.patch_post(reddit, server)
+        skipped = submission.comments.replace_more(batch=True, limit=2, workers=2)
+        assert sorted(requests) == [",".join([*large, "z"]), "x,y"]
+        assert [more.id for more in skipped] == ["m4"]
+        assert len(submission.comments.list()) == 102
+
+    def test_replace_more__batch_first_fit(self, reddit):
+        submission = Submission(reddit, id="s")
+        submission._comments = CommentForest(submission)
+        large = [f"l{index}" for index in range(97)]
+        submission._comments._update([
+            self.more(reddit, "m1", "t3_s", large),
+            self.more(reddit, "m2", "t3_s", ["w", "x", "y", "z"]),
+            self.more(reddit, "m3", "t3_s", ["u", "v"]),
+            self.more(reddit, "m4", "t3_s", ["t"]),
+        ])
+        children = [*large, "t", "u", "v", "w", "x", "y", "z"]
+        server = {child: lambda child=child: self.comment(reddit, child, "t3_s") for child in children}
+        requests = self.patch_post(reddit, server)
+        assert submission.comments.replace_more(batch=True, limit=None) == []
+        assert requests == [",".join([*large, "u", "v", "t"]), "w,x,y,z"]
+        assert len(submission.comments.list()) == 104
+
+    def test_iter_bfs(self, reddit):
+        submission, _ = self.forest(reddit)
+        assert [comment.id for comment in submission.comments.iter_bfs()] == ["a", "d", "m2", "m1"]
+        assert [comment.id for comment in submission.comments.iter_bfs(max_depth=0)] == ["a", "d", "m2"]
+
+    def test_iter_bfs__replace_more(self, reddit):
+        submission, server = self.forest(reddit)
+        requests = self.patch_post(reddit, server)
+        comments = submission.comments.iter_bfs(replace_more=True)
+        assert next(comments).id == "a"
+        assert requests == []
+        assert [comment.id for comment in comments] == ["d", "e", "g", "b", "h", "c"]
+        assert requests == ["e,f,g", "b,c", "h"]
+        assert [comment.id for comment in submission.comments.list()] == ["a", "d", "e", "g", "b", "h", "c"]
+
+    def test_iter_dfs(self, reddit):
+        submission, _ = self.forest(reddit)
+        assert [comment.id for comment in submission.comments.iter_dfs()] == ["a", "m1", "d", "m2"]
+
+    def test_iter_dfs__replace_more(self, reddit):
+        submission, server = self.forest(reddit)
+        requests = self.patch_post(reddit, server)
+        comments = [comment.id for comment in submission.comments.iter_dfs(replace_more=True)]
+        assert comments == ["a", "b", "c", "d", "e", "h", "g"]
+        assert requests == ["b,c", "e,f,g", "h"]
+
+    def test_iter_dfs__max_depth_and_predicate(self, reddit):
+        submission, server = self.forest(reddit)
+        requests = self.patch_post(reddit, server)
+        comments = submission.comments.iter_dfs(
+            max_depth=0, predicate=lambda comment: comment.id != "a", replace_more=True
+        )
+        assert [comment.id for comment in comments] == ["d", "e", "g"]
+        assert requests == ["e,f,g"]
+
+    def test_iter_dfs__replace_more_duplicate(self, reddit):
+        submission, server = self.forest(reddit)
+        server["b"] = lambda: self.comment(reddit, "d", "t3_s")
+        self.patch_post(reddit, server)
+        with pytest.raises(DuplicateReplaceException):
+            list(submission.comments.iter_dfs(replace_more=True))
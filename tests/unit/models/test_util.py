@@ -1,19 +1,35 @@
 """Test praw.models.util."""
 
+import asyncio
 from collections import namedtuple
+from unittest import mock
 
 import pytest
 
 from praw.models.util import (
     BoundedSet,
+    DedupWindow,
     ExponentialCounter,
+    StreamBatch,
+    StreamScheduler,
+    _StreamPoller,
+    async_iterator,
     permissions_string,
     stream_generator,
 )
+from praw.util.checkpoint import FileCheckpoint
 
 from .. import UnitTest
 
 
+class TestAsyncIterator(UnitTest):
+    def test_async_iterator(self):
+        async def collect():
+            return [item async for item in async_iterator(iter([1, None, 3]))]
+
+        assert asyncio.run(collect()) == [1, None, 3]
+
+
 class TestBoundedSet(UnitTest):
     def test_bound(self):
         bset = BoundedSet(max_items=10)
@@ -43,6 +59,60 @@ class TestBoundedSet(UnitTest):
         assert 1 not in bset
 
 
+class TestDedupWindow(UnitTest):
+    def test_bound(self):
+        window = DedupWindow(max_items=10)
+        for i in range(20):
+            window.add(f"t1_{i}")
+            assert len(window) == min(i + 1, 10)
+
+    def test_contains(self):
+        window = DedupWindow(max_items=10)
+        window.add("t3_abc")
+        assert "t3_abc" in window
+        assert "t1_abc" not in window
+        assert "t3_abd" not in window
+
+    def test_iter(self):
+        window = DedupWindow(max_items=10)
+        items = ["t1_c5s96e0", "t4_1", "abc", "t_x", "tx_1", "t1_no!", 5]
+        for item in items:
+            window.add(item)
+        assert list(window) == items
+        for item in items:
+            assert item in window
+
+    def test_lru_add(self):
+        window = DedupWindow(max_items=10)
+        for i in range(10):
+            window.add(f"t1_{i}")
+        window.add("t1_0")
+        window.add("t1_10")
+        assert "t1_0" in window
+        assert "t1_1" not in window
+
+    def test_lru_contains(self):
+        window = DedupWindow(max_items=10)
+        for i in range(10):
+            window.add(f"t1_{i}")
+        assert "t1_0" in window
+        window.add("t1_10")
+        assert "t1_0" in window
+        assert "t1_1" not in window
+
+    def test_lru_order(self):
+        window = DedupWindow(max_items=3)
+        for item in ["t1_a", "b", "t1_c"]:
+            window.add(item)
+        for _ in range(4):
+            assert "t1_a" in window
+        assert "b" in window
+        assert list(window) == ["t1_c", "t1_a", "b"]
+        window.add("t1_d")
+        assert list(window) == ["t1_a", "b", "t1_d"]
+        assert len(window._order) <= 6
+
+
 class TestExponentialCounter(UnitTest):
     MAX_DELTA = 1.0 / 32
 
@@ -96,6 +166,100 @@ class TestPermissionsString(UnitTest):
         assert permissions_string(known_permissions=self.PERMISSIONS, permissions=["d"]) == "-all,-a,-b,-c,+d"
 
 
+class TestStreamScheduler(UnitTest):
+    Thing = namedtuple("Thing", ["fullname"])
+
+    def test_add__duplicate_key(self, reddit):
+        scheduler = StreamScheduler(reddit)
+        scheduler.add(lambda **_: [], key="a")
+        with pytest.raises(ValueError):
+            scheduler.add(lambda **_: [], key="a")
+
+    def test_exception_handler(self, reddit):
+        handled = []
+        responses = [RuntimeError("boom"), [self.Thing(1)]]
+
+        def generate(limit, **kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        scheduler = StreamScheduler(reddit, exception_handler=handled.append)
+        scheduler.add(generate, key="a")
+        assert next(iter(scheduler)) == ("a", self.Thing(1))
+        assert str(handled[0]) == "boom"
+
+    def test_exception_propagates_without_handler(self, reddit):
+        def generate(limit, **kwargs):
+            raise RuntimeError("boom")
+
+        scheduler = StreamScheduler(reddit)
+        scheduler.add(generate, key="a")
+        with pytest.raises(RuntimeError):
+            next(iter(scheduler))
+        # The stream remains scheduled
+        with pytest.raises(RuntimeError):
+            next(iter(scheduler))
+
+    def test_interval__adapts_to_rate(self, reddit, monkeypatch):
+        now = 0.0
+        monkeypatch.setattr("praw.models.util.time.monotonic", lambda: now)
+        counter = 0
+
+        def busy(limit, **kwargs):
+            nonlocal counter
+            counter += 50
+            return [self.Thing(n) for n in reversed(range(counter))][:limit]
+
+        scheduler = StreamScheduler(reddit, max_interval=60, min_interval=1)
+        scheduler.add(busy, key="busy")
+        scheduler.add(lambda **_: [], key="quiet")
+        for _ in range(3):
+            for poller in scheduler._streams.values():
+                poller.poll()
+            now += 10
+        assert scheduler._streams["busy"].interval(maximum=60, minimum=1) < 60
+        assert scheduler._streams["quiet"].interval(maximum=60, minimum=1) == 60
+
+    def test_iter(self, reddit):
+        def comments(limit, **kwargs):
+            return [self.Thing("c2"), self.Thing("c1")]
+
+        def submissions(limit, **kwargs):
+            return [self.Thing("s1")]
+
+        scheduler = StreamScheduler(reddit)
+        scheduler.add(comments, key="comments")
+        scheduler.add(submissions)
+        iterator = iter(scheduler)
+        assert [next(iterator) for _ in range(3)] == [
+            ("comments", self.Thing("c1")),
+            ("comments", self.Thing("c2")),
+            (submissions, self.Thing("s1")),
+        ]
+
+    def test_remove(self, reddit):
+        scheduler = StreamScheduler(reddit)
+        scheduler.add(lambda **_: [self.Thing(1)], key="a")
+        scheduler.remove("a")
+        assert list(scheduler) == []
+
+    def test_request_spacing(self, reddit):
+        scheduler = StreamScheduler(reddit, request_budget=0.5)
+        assert scheduler._request_spacing() == 0
+        rate_limiter = reddit._core._rate_limiter
+        rate_limiter.remaining = 900
+        rate_limiter.used = 100
+        assert scheduler._request_spacing() == rate_limiter.window_size / 500
+
+    def test_skip_existing(self, reddit):
+        responses = [[self.Thing(1)], [self.Thing(2), self.Thing(1)]]
+        scheduler = StreamScheduler(reddit)
+        scheduler.add(lambda **_: responses.pop(0), key="a", skip_existing=True)
+        assert next(iter(scheduler)) == ("a", self.Thing(2))
+
+
 class TestStream(UnitTest):
     def test_comments__with_continue_after_id(
         self,
@@ -144,6 +308,232 @@ class TestStream(UnitTest):
             assert thing not in seen
             seen.add(thing)
 
+    def test_stream__adaptive(self, monkeypatch):
+        now = 0.0
+        sleeps = []
+
+        def sleep(seconds):
+            nonlocal now
+            now += seconds
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("praw.models.util.time.monotonic", lambda: now)
+        monkeypatch.setattr("praw.models.util.time.sleep", sleep)
+        Thing = namedtuple("Thing", ["fullname"])
+        limits = []
+
+        def generate(limit, params=None, **kwargs):
+            nonlocal now
+            limits.append(limit)
+            now += 1
+            # 100 existing items, then one new item per second
+            return [Thing(n) for n in reversed(range(100 + int(now)))][:limit]
+
+        stream = stream_generator(generate, adaptive=True)
+        for _ in range(300):
+            next(stream)
+        # The first page was full, so it was followed up immediately
+        assert sleeps[0] == 0
+        # Half a page of new items takes about 50 seconds to arrive
+        assert 45 < sleeps[-1] < 55
+        assert limits[0] == 100
+        assert limits[-1] == 100
+
+    def test_stream__adaptive__quiet(self, monkeypatch):
+        now = 0.0
+        sleeps = []
+        monkeypatch.setattr("praw.models.util.time.monotonic", lambda: now)
+        monkeypatch.setattr("praw.models.util.time.sleep", sleeps.append)
+
+        def generate(limit, params=None, **kwargs):
+            nonlocal now
+            now += 1
+            return []
+
+        stream = stream_generator(generate, adaptive=True, pause_after=2)
+        assert next(stream) is None
+        assert sleeps == [1, 60]
+
+    def test_stream__adaptive__page_size(self, monkeypatch):
+        now = 0.0
+        monkeypatch.setattr("praw.models.util.time.monotonic", lambda: now)
+        Thing = namedtuple("Thing", ["fullname"])
+        poller = _StreamPoller(lambda limit, **_: [Thing(now)], function_kwargs={})
+        assert poller.page_size() == 100
+        poller.poll()
+        now += 1
+        poller.poll()
+        assert poller.rate == 1
+        now += 100
+        assert poller.page_size() == 100
+        now -= 90
+        assert poller.page_size() == 25
+
+    def test_stream__backfill(self):
+        Thing = namedtuple("Thing", ["fullname"])
+        requested = []
+        responses = [
+            [Thing("t1_2"), Thing("t1_1")],
+            # "t1_3" to "t1_8" were missed
+            [Thing("t1_b"), Thing("t1_a"), Thing("t1_9")],
+        ]
+
+        def backfill(fullnames):
+            requested.extend(fullnames)
+            # "t1_5" cannot be recovered
+            return [Thing(fullname) for fullname in requested if fullname != "t1_5"]
+
+        def generate(limit, params=None, **kwargs):
+            return responses.pop(0)
+
+        poller = _StreamPoller(generate, backfill=backfill, function_kwargs={})
+        assert poller.poll(limit=2) == [Thing("t1_1"), Thing("t1_2")]
+        poller.before_attribute = None
+        assert [thing.fullname for thing in poller.poll(limit=3)] == [
+            "t1_3",
+            "t1_4",
+            "t1_6",
+            "t1_7",
+            "t1_8",
+            "t1_9",
+            "t1_a",
+            "t1_b",
+        ]
+        assert requested == ["t1_3", "t1_4", "t1_5", "t1_6", "t1_7", "t1_8"]
+
+    def test_stream__backfill__continued(self):
+        Thing = namedtuple("Thing", ["fullname"])
+        responses = [[Thing("t1_2"), Thing("t1_1")], [Thing("t1_z"), Thing("t1_y")]]
+
+        def backfill(fullnames):
+            raise AssertionError
+
+        def generate(limit, params=None, **kwargs):
+            return responses.pop(0)
+
+        poller = _StreamPoller(generate, backfill=backfill, function_kwargs={})
+        assert poller.poll(limit=2) == [Thing("t1_1"), Thing("t1_2")]
+        # The second request continues after "t1_2", so nothing was missed
+        assert poller.poll(limit=2) == [Thing("t1_y"), Thing("t1_z")]
+
+    @pytest.mark.parametrize(
+        "page",
+        [
+            # The oldest new item directly follows the newest seen one
+            ["t1_4", "t1_3"],
+            # The IDs of different kinds cannot be compared
+            ["t3_9", "t3_8"],
+        ],
+    )
+    def test_stream__backfill__no_gap(self, page):
+        Thing = namedtuple("Thing", ["fullname"])
+        responses = [[Thing("t1_2"), Thing("t1_1")], [Thing(fullname) for fullname in page]]
+
+        def backfill(fullnames):
+            raise AssertionError
+
+        def generate(limit, params=None, **kwargs):
+            return responses.pop(0)
+
+        poller = _StreamPoller(generate, backfill=backfill, function_kwargs={})
+        poller.poll(limit=2)
+        poller.before_attribute = None
+        assert [thing.fullname for thing in poller.poll(limit=2)] == page[::-1]
+        assert poller.gap_suspected
+
+    def test_stream__backfill__seen(self):
+        Thing = namedtuple("Thing", ["fullname"])
+        responses = [[Thing("t1_2"), Thing("t1_1")], [Thing("t1_6"), Thing("t1_5")]]
+
+        def backfill(fullnames):
+            assert list(fullnames) == ["t1_3", "t1_4"]
+            # "t1_3" was already yielded, e.g., by another listing of the stream
+            return [Thing("t1_3"), Thing("t1_4")]
+
+        def generate(limit, params=None, **kwargs):
+            return responses.pop(0)
+
+        poller = _StreamPoller(generate, backfill=backfill, function_kwargs={})
+        poller.poll(limit=2)
+        poller.seen_attributes.add("t1_3")
+        poller.before_attribute = None
+        assert [thing.fullname for thing in poller.poll(limit=2)] == ["t1_4", "t1_5", "t1_6"]
+
+    def test_stream__batch(self, monkeypatch):
+        now = 0.0
+        monkeypatch.setattr("praw.models.util.time.monotonic", lambda: now)
+        Thing = namedtuple("Thing", ["fullname"])
+        responses = [
+            [Thing("t1_2"), Thing("t1_1")],
+            [],
+            [Thing("t1_3"), Thing("t1_2")],
+            # Shares nothing with the previous responses
+            [Thing("t1_c"), Thing("t1_b")],
+        ]
+
+        def generate(limit, params=None, **kwargs):
+            nonlocal now
+            now += 0.5
+            return responses.pop(0)
+
+        stream = stream_generator(generate, batch=True)
+        batch = next(stream)
+        assert isinstance(batch, StreamBatch)
+        assert list(batch) == [Thing("t1_1"), Thing("t1_2")]
+        assert batch.fill_ratio == 0.02
+        assert batch.latency == 0.5
+        assert not batch.gap_suspected
+        assert list(next(stream)) == [Thing("t1_3")]
+        stream.close()
+
+        poller = _StreamPoller(lambda **_: responses.pop(0), function_kwargs={})
+        responses[:] = [[Thing("t1_2"), Thing("t1_1")], [Thing("t1_c"), Thing("t1_b")]]
+        poller.poll(limit=2)
+        poller.before_attribute = None
+        poller.without_before_counter = 0
+        poller.poll(limit=2)
+        assert poller.fill_ratio == 1
+        assert poller.gap_suspected
+
+    def test_stream__checkpoint(self, tmp_path):
+        Thing = namedtuple("Thing", ["fullname"])
+        things = [Thing(n) for n in reversed(range(10))]
+        requests = []
+
+        def generate(limit, params=None, **kwargs):
+            requests.append(params["before"])
+            if params["before"] is None:
+                return things
+            return things[: next(i for i, thing in enumerate(things) if thing.fullname == params["before"])]
+
+        checkpoint = FileCheckpoint(tmp_path / "checkpoint.json")
+        stream = stream_generator(generate, checkpoint=checkpoint)
+        assert [next(stream).fullname for _ in range(4)] == [0, 1, 2, 3]
+        stream.close()
+        # Thing 3 was yielded but the stream was not advanced past it
+        assert checkpoint.load() == {"before": 2, "seen": [0, 1, 2]}
+
+        requests.clear()
+        stream = stream_generator(generate, checkpoint=checkpoint, skip_existing=True)
+        assert [next(stream).fullname for _ in range(7)] == [3, 4, 5, 6, 7, 8, 9]
+        assert requests == [2]
+
+    def test_stream__checkpoint__interval(self, monkeypatch):
+        now = 0.0
+        monkeypatch.setattr("praw.models.util.time.monotonic", lambda: now)
+        Thing = namedtuple("Thing", ["fullname"])
+        saved = []
+        checkpoint = mock.Mock(load=mock.Mock(return_value=None), save=saved.append)
+
+        stream = stream_generator(
+            lambda **_: [Thing(2), Thing(1), Thing(0)], checkpoint=checkpoint, checkpoint_interval=10
+        )
+        next(stream)
+        now = 10
+        next(stream)
+        next(stream)
+        assert saved == [{"before": 0, "seen": [0]}]
+
     def test_stream__exception_handler(self, monkeypatch):
         monkeypatch.setattr("praw.models.util.time.sleep", lambda *_: None)
         Thing = namedtuple("Thing", ["fullname"])
@@ -48,9 +48,58 @@ class TestConfig:
             config = Config("DEFAULT", check_for_updates=value)
             assert config.check_for_updates is True
 
+    def test_compact_models(self):
+        assert Config("DEFAULT").compact_models is False
+        assert Config("DEFAULT", compact_models="true").compact_models is True
+
+    def test_json_decoder(self):
+        assert Config("DEFAULT").json_decoder == "json"
+        assert Config("DEFAULT", json_decoder="orjson").json_decoder == "orjson"
+
     def test_config_boolean__not_set(self):
         assert Config._config_boolean(item=Config.CONFIG_NOT_SET) is False
 
+    def test_connection_pool_size(self):
+        assert Config("DEFAULT").connection_pool_size is None
+        assert Config("DEFAULT", connection_pool_size="4").connection_pool_size == 4
+
+    def test_connection_pool_size__invalid(self):
+        with pytest.raises(ValueError) as excinfo:
+            Config("DEFAULT", connection_pool_size="many")
+        assert excinfo.value.args[0] == (
+            "An incorrect config type was given for option connection_pool_size. The expected type is int, but the"
+            " given value is many."
+        )
+
+    def test_http_cache(self):
+        assert Config("DEFAULT").http_cache is None
+        assert Config("DEFAULT").http_cache_max_entries == 10000
+        config = Config("DEFAULT", http_cache="praw_cache.db", http_cache_max_entries="50")
+        assert config.http_cache == "praw_cache.db"
+        assert config.http_cache_max_entries == 50
+
+    def test_identity_map(self):
+        assert Config("DEFAULT").identity_map is False
+        assert Config("DEFAULT", identity_map="true").identity_map is True
+
+    def test_response_cache(self):
+        config = Config("DEFAULT")
+        assert config.response_cache_size == 1024
+        assert config.response_cache_ttl == 0
+        assert config.response_cache_ttls == {}
+        config = Config("DEFAULT", response_cache_ttl="30", response_cache_ttls="rules=600, subreddit_about = 3600")
+        assert config.response_cache_ttl == 30
+        assert config.response_cache_ttls == {"rules": 600, "subreddit_about": 3600}
+        assert Config("DEFAULT", response_cache_ttls={"rules": 600}).response_cache_ttls == {"rules": 600}
+
+    def test_response_cache_ttls__invalid(self):
+        with pytest.raises(ValueError) as excinfo:
+            Config("DEFAULT", response_cache_ttls="rules")
+        assert excinfo.value.args[0] == (
+            "An incorrect config value was given for option response_cache_ttls. The expected format is"
+            " 'name=number, ...', but the given value is rules."
+        )
+
     def test_custom__extra_values_set(self):
         config = Config("DEFAULT", user1="foo", user2="bar")
         assert config.custom == {"user1": "foo", "user2": "bar"}
@@ -1,6 +1,7 @@
 import pytest
 
 from praw.exceptions import ClientException, RedditAPIException
+from praw.models import Comment, Submission
 
 from . import UnitTest
 
@@ -14,6 +15,24 @@ class TestObjector(UnitTest):
         with pytest.raises(RedditAPIException):
             objector.check_error(error_response)
 
+    def test_objectify__things(self, reddit):
+        objector = reddit._objector
+        comment, submission, other = objector.objectify(
+            data=[
+                {"data": {"id": "c", "replies": ""}, "kind": "t1"},
+                {"data": {"id": "s"}, "kind": "t3"},
+                {"data": {"id": "o"}, "kind": "unknown"},
+            ]
+        )
+        # Things with additional keys take the slower path
+        extended = objector.objectify(data={"data": {"id": "e", "replies": ""}, "kind": "t1", "modhash": None})
+        assert isinstance(comment, Comment)
+        assert comment.id == "c"
+        assert isinstance(submission, Submission)
+        assert other == {"data": {"id": "o"}, "kind": "unknown"}
+        assert isinstance(extended, Comment)
+        assert extended.id == "e"
+
     def test_objectify_returns_None_for_None(self, reddit):
         assert reddit._objector.objectify(data=None) is None
 
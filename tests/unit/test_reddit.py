@@ -1,5 +1,8 @@
 import asyncio
 import configparser
+import json
+import threading
+import time
 import types
 from io import BytesIO
 from unittest import mock
@@ -13,6 +16,10 @@ from prawcore.exceptions import BadRequest
 from praw import Reddit, __version__
 from praw.config import Config
 from praw.exceptions import ClientException, RedditAPIException, RedditErrorItem
+from praw.models import Comment, Submission, Subreddit
+from praw.util.cache import ResponseCache
+from praw.util.concurrency import ThreadSafeRateLimiter
+from praw.util.http_cache import HTTPCacheAdapter
 
 from . import UnitTest
 
@@ -32,6 +39,73 @@ class TestReddit(UnitTest):
         response.status_code = 200
         return response
 
+    def test_add_request_hook(self, reddit):
+        hook = mock.Mock()
+        reddit.add_request_hook(hook)
+        reddit.add_request_hook(hook)
+        assert reddit._core.requestor._http.hooks["response"] == [reddit._instrumentation.response_hook]
+        with mock.patch.object(reddit._core, "request", return_value={"kind": "t5", "data": {"display_name": "test"}}):
+            assert reddit.get("r/test/about/") == Subreddit(reddit, "test")
+            reddit.remove_request_hook(hook)
+            reddit.get("r/test/about/")
+            reddit.remove_request_hook(hook)
+            reddit.get("r/test/about/")
+        assert hook.call_count == 3
+        event = hook.call_args[0][0]
+        assert (event.endpoint, event.method, event.path) == ("subreddit_about", "GET", "r/test/about/")
+        assert event.duration >= event.objectify_time > 0
+        assert event.exception is None
+        with pytest.raises(ValueError):
+            reddit.remove_request_hook(hook)
+
+    def test_add_request_hook__cached(self, reddit):
+        events = []
+        reddit.add_request_hook(events.append)
+        reddit.response_cache = ResponseCache(ttl=60)
+        with mock.patch.object(reddit._core, "request", return_value={"kind": "t5", "data": {"display_name": "test"}}):
+            reddit.request(method="GET", path="r/test/about/")
+            reddit.request(method="GET", path="r/test/about/")
+        assert [(event.cached, event.shared) for event in events] == [(False, False), (True, False)]
+        assert events[1].network_time == 0
+
+    def test_add_request_hook__shared(self, reddit):
+        events = []
+        release = threading.Event()
+        started = threading.Event()
+
+        def core_request(**kwargs):
+            started.set()
+            release.wait(5)
+            return {"kind": "t5", "data": {"display_name": "test"}}
+
+        def target():
+            reddit.request(method="GET", path="r/test/about/")
+
+        class WaitCountingEvent(threading.Event):
+            waiting = 0
+
+            def wait(self, timeout=None):
+                type(self).waiting += 1
+                return super().wait(timeout)
+
+        reddit.add_request_hook(events.append)
+        with (
+            mock.patch.object(reddit._core, "request", side_effect=core_request) as request,
+            mock.patch("praw.util.concurrency.Event", WaitCountingEvent),
+        ):
+            threads = [threading.Thread(target=target) for _ in range(2)]
+            threads[0].start()
+            started.wait(5)
+            threads[1].start()
+            while WaitCountingEvent.waiting < 1:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join()
+        assert request.call_count == 1
+        assert sorted(event.shared for event in events) == [False, True]
+        assert not any(event.cached for event in events)
+
     def test_check_for_async(self, caplog):
         reddit = Reddit(**self.REQUIRED_DUMMY_SETTINGS)
         reddit._core.request = self.patch_request
@@ -76,6 +150,120 @@ class TestReddit(UnitTest):
         with Reddit(**self.REQUIRED_DUMMY_SETTINGS) as reddit:
             assert not reddit.config.check_for_updates
 
+    def test_hydrate(self, reddit):
+        def fake_get(path, params):
+            if "sr_name" in params:
+                return [Subreddit(reddit, _data={"display_name": "Python", "subscribers": 3})]
+            return [
+                Comment(reddit, _data={"id": "c1", "score": 5}),
+                Submission(reddit, _data={"id": "s1", "title": "Title"}),
+            ]
+
+        comments = [reddit.comment("c1"), reddit.comment("c1"), reddit.comment("c2")]
+        submission = reddit.submission("s1")
+        submission.comment_sort = "new"
+        subreddit = reddit.subreddit("python")
+        with mock.patch.object(reddit, "get", side_effect=fake_get) as get:
+            reddit.hydrate([*comments, submission, subreddit, reddit.redditor("spez")])
+        assert get.call_args_list == [
+            mock.call("api/info/", params={"id": "t1_c1,t1_c2,t3_s1"}),
+            mock.call("api/info/", params={"sr_name": "python"}),
+        ]
+        assert comments[0]._fetched
+        assert comments[0].score == comments[1].score == 5
+        assert not comments[2]._fetched
+        assert not submission._fetched
+        assert submission.comment_sort == "new"
+        assert submission.title == "Title"
+        assert subreddit._fetched
+        assert subreddit.subscribers == 3
+
+    def test_hydrate__fetched(self, reddit):
+        fetched = [
+            Comment(reddit, _data={"id": "c1", "score": 1}),
+            Subreddit(reddit, _data={"display_name": "python", "subscribers": 3}),
+        ]
+        for item in fetched:
+            item._fetched = True
+        lazy = [reddit.comment("c2"), reddit.subreddit("test")]
+        returned = [[Comment(reddit, _data={"id": "c2", "score": 2})], []]
+        with mock.patch.object(reddit, "get", side_effect=returned) as get:
+            reddit.hydrate([fetched[0], lazy[0], fetched[1], lazy[1]])
+        assert get.call_args_list == [
+            mock.call("api/info/", params={"id": "t1_c2"}),
+            mock.call("api/info/", params={"sr_name": "test"}),
+        ]
+        assert fetched[0].score == 1
+        assert lazy[0].score == 2
+
+    def test_hydrate__defer(self, reddit):
+        comments = [reddit.comment("c1"), reddit.comment("c2")]
+        returned = [Comment(reddit, _data={"id": "c1", "score": 1}), Comment(reddit, _data={"id": "c2", "score": 2})]
+        with mock.patch.object(reddit, "get", return_value=returned) as get:
+            reddit.hydrate(comments, defer=True)
+            get.assert_not_called()
+            assert comments[1].score == 2
+            assert comments[0].score == 1
+        get.assert_called_once_with("api/info/", params={"id": "t1_c1,t1_c2"})
+        assert "_siblings" not in comments[0].__dict__
+
+    def test_request__coalesced(self, reddit):
+        started = threading.Event()
+        release = threading.Event()
+
+        def core_request(**kwargs):
+            started.set()
+            release.wait(5)
+            return {"kind": "t5", "data": {"display_name": "test"}}
+
+        def target():
+            responses.append(reddit.request(method="GET", params={"a": 1}, path="r/test/about/"))
+
+        class WaitCountingEvent(threading.Event):
+            waiting = 0
+
+            def wait(self, timeout=None):
+                type(self).waiting += 1
+                return super().wait(timeout)
+
+        responses = []
+        with (
+            mock.patch.object(reddit._core, "request", side_effect=core_request) as request,
+            mock.patch("praw.util.concurrency.Event", WaitCountingEvent),
+        ):
+            threads = [threading.Thread(target=target) for _ in range(3)]
+            threads[0].start()
+            started.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            while WaitCountingEvent.waiting < 2:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join()
+        assert request.call_count == 1
+        assert responses == [{"kind": "t5", "data": {"display_name": "test"}}] * 3
+        assert len({id(response) for response in responses}) == 3
+
+    def test_info__concurrency(self, reddit):
+        def fake_get(path, params):
+            return [reddit.comment(name[3:]) for name in params["id"].split(",") if int(name[3:], 36) % 7]
+
+        fullnames = [f"t1_{number:x}" for number in range(1, 251)]
+        missing = []
+        with mock.patch.object(reddit, "get", side_effect=fake_get) as get:
+            comments = list(reddit.info(concurrency=3, fullnames=fullnames, missing=missing))
+        assert get.call_count == 3
+        assert [comment.fullname for comment in comments] == [name for name in fullnames if int(name[3:], 36) % 7]
+        assert missing == [name for name in fullnames if not int(name[3:], 36) % 7]
+
+    def test_info__missing_subreddits(self, reddit):
+        with mock.patch.object(reddit, "get", return_value=[reddit.subreddit("Python")]):
+            missing = []
+            subreddits = list(reddit.info(missing=missing, subreddits=["python", "nonexistent"]))
+        assert [subreddit.display_name for subreddit in subreddits] == ["Python"]
+        assert missing == ["nonexistent"]
+
     def test_info__invalid_param(self, reddit):
         with pytest.raises(TypeError) as excinfo:
             reddit.info(fullnames=None)
@@ -463,6 +651,9 @@ class TestReddit(UnitTest):
     def test_submission(self, reddit):
         assert reddit.submission("2gmzqe").id == "2gmzqe"
 
+    def test_session__thread_safe_rate_limiter(self, reddit):
+        assert isinstance(reddit._read_only_core._rate_limiter, ThreadSafeRateLimiter)
+
     def test_subreddit(self, reddit):
         assert reddit.subreddit("redditdev").display_name == "redditdev"
 
@@ -492,6 +683,110 @@ class TestRedditCustomRequestor(UnitTest):
         assert isinstance(_reddit._core.requestor, CustomRequestor)
         assert not isinstance(reddit._core.requestor, CustomRequestor)
 
+    def test_connection_pool_size(self):
+        reddit = Reddit(client_id="dummy", client_secret="dummy", connection_pool_size=4, user_agent="dummy")
+        adapter = reddit._core.requestor._http.get_adapter("https://oauth.reddit.com")
+        assert adapter._pool_block is True
+        assert adapter._pool_maxsize == 4
+
+    def test_http_cache(self, tmp_path):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            connection_pool_size=4,
+            http_cache=str(tmp_path / "cache.db"),
+            http_cache_max_entries=5,
+            password="dummy",
+            user_agent="dummy",
+            username="dummy",
+        )
+        adapter = reddit._core.requestor._http.get_adapter("https://oauth.reddit.com")
+        assert isinstance(adapter, HTTPCacheAdapter)
+        assert adapter._pool_maxsize == 4
+        assert adapter.cache.max_entries == 5
+
+        reddit._read_only_core._authorizer.access_token = "read-only"
+        reddit._authorized_core._authorizer.access_token = "authorized"
+        identities = [
+            adapter.identity(requests.Request("GET", "https://oauth.reddit.com", headers=headers).prepare())
+            for headers in (
+                {"Authorization": "bearer read-only"},
+                {"Authorization": "bearer authorized"},
+                {"Authorization": "bearer expired"},
+                {},
+            )
+        ]
+        assert identities == ["dummy\0", "dummy\0dummy", None, None]
+
+    def test_identity_map(self):
+        reddit = Reddit(client_id="dummy", client_secret="dummy", identity_map=True, user_agent="dummy")
+        comments = reddit._objector.objectify(
+            data={
+                "kind": "Listing",
+                "data": {
+                    "after": None,
+                    "before": None,
+                    "children": [
+                        {"kind": "t1", "data": {"author": "Spez", "id": f"c{index}", "subreddit": "Test"}}
+                        for index in range(3)
+                    ],
+                    "dist": 3,
+                },
+            }
+        )
+        subreddit = reddit.subreddit("test")
+        assert all(comment.subreddit is subreddit for comment in comments)
+        assert all(comment.author is comments[0].author for comment in comments)
+        assert reddit.redditor("spez") is comments[0].author
+
+        parsed = reddit._objector.objectify(data={"kind": "t5", "data": {"display_name": "test", "subscribers": 7}})
+        assert parsed is subreddit
+        assert comments[0].subreddit.subscribers == 7
+        assert reddit._objector.objectify(data={"kind": "t2", "data": {"name": "spez"}}) is comments[0].author
+        assert Reddit(client_id="dummy", client_secret="dummy", user_agent="dummy")._identity_map is None
+
+    def test_identity_map__listing_entries(self):
+        reddit = Reddit(client_id="dummy", client_secret="dummy", identity_map=True, user_agent="dummy")
+        redditor = reddit.redditor("spez")
+        moderators = [
+            reddit._objector.objectify(
+                data={
+                    "kind": "UserList",
+                    "data": {"children": [{"date": 1, "id": "t2_1", "mod_permissions": permissions, "name": "spez"}]},
+                }
+            )[0]
+            for permissions in (["all"], ["wiki"])
+        ]
+        assert moderators[0] is not moderators[1]
+        assert all(moderator is not redditor for moderator in moderators)
+        assert [moderator.mod_permissions for moderator in moderators] == [["all"], ["wiki"]]
+        assert "mod_permissions" not in vars(redditor)
+
+    def test_response_cache(self):
+        reddit = Reddit(client_id="dummy", client_secret="dummy", user_agent="dummy")
+        assert reddit.response_cache is None
+        reddit = Reddit(client_id="dummy", client_secret="dummy", response_cache_ttls="rules=60", user_agent="dummy")
+        responses = [{"rules": []}, {"data": {}}, {}, {"rules": [{"short_name": "Be nice"}]}]
+        with mock.patch.object(reddit._core, "request", side_effect=responses) as request:
+            assert reddit.request(method="GET", path="r/test/about/rules") == {"rules": []}
+            assert reddit.request(method="GET", path="r/test/about/rules") == {"rules": []}
+            assert request.call_count == 1
+            reddit.request(method="GET", path="r/test/about/")
+            reddit.request(method="POST", path="api/add_subreddit_rule")
+            assert reddit.request(method="GET", path="r/test/about/rules") == {"rules": [{"short_name": "Be nice"}]}
+        assert request.call_count == 4
+        assert (reddit.response_cache.hits, reddit.response_cache.misses) == (1, 2)
+
+    def test_json_decoder(self):
+        reddit = Reddit(client_id="dummy", client_secret="dummy", user_agent="dummy")
+        assert reddit._json_loads is json.loads
+        assert reddit._core.requestor._http.hooks["response"] == []
+
+        with mock.patch("praw.reddit.json_loads", return_value=mock.sentinel.loads):
+            reddit = Reddit(client_id="dummy", client_secret="dummy", json_decoder="orjson", user_agent="dummy")
+        (hook,) = reddit._core.requestor._http.hooks["response"]
+        assert hook.loads is reddit._json_loads is mock.sentinel.loads
+
     def test_requestor_kwargs(self):
         session = mock.Mock(headers={})
         reddit = Reddit(
@@ -1,6 +1,13 @@
 """Test praw.util.cache."""
 
-from praw.util.cache import cachedproperty
+import gc
+import pickle
+from unittest import mock
+
+import pytest
+
+from praw.models import Redditor, Subreddit
+from praw.util.cache import IdentityMap, ResponseCache, cachedproperty, endpoint_name
 
 from .. import UnitTest
 
@@ -41,3 +48,145 @@ class TestCachedProperty(UnitTest):
 
         property_repr = repr(self.Klass.ten)
         assert property_repr.startswith("<cachedproperty <function")
+
+
+class TestIdentityMap(UnitTest):
+    def test_get(self, reddit):
+        identity_map = IdentityMap()
+        subreddit = identity_map.get(Subreddit, "Test", lambda: Subreddit(reddit, "Test"))
+        assert identity_map.get(Subreddit, "test", lambda: Subreddit(reddit, "test")) is subreddit
+        redditor = identity_map.get(Redditor, "test", lambda: Redditor(reddit, "test"))
+        assert redditor is not subreddit
+        assert len(identity_map) == 2
+        del subreddit, redditor
+        gc.collect()
+        assert len(identity_map) == 0
+
+    def test_merge(self, reddit):
+        identity_map = IdentityMap()
+        subreddit = identity_map.get(Subreddit, "test", lambda: Subreddit(reddit, "test"))
+        subreddit._fetched = True
+        parsed = Subreddit(reddit, _data={"display_name": "Test", "subscribers": 5})
+        assert identity_map.merge(parsed) is subreddit
+        assert subreddit.display_name == "Test"
+        assert subreddit.subscribers == 5
+        assert subreddit._fetched
+        other = Subreddit(reddit, _data={"display_name": "other"})
+        assert identity_map.merge(other) is other
+        fullname_only = Redditor(reddit, fullname="t2_test")
+        assert identity_map.merge(fullname_only) is fullname_only
+        assert len(identity_map) == 2
+
+    def test_pickle(self, reddit):
+        identity_map = IdentityMap()
+        subreddit = identity_map.get(Subreddit, "test", lambda: Subreddit(reddit, "test"))
+        other = pickle.loads(pickle.dumps(identity_map))
+        assert len(other) == 0
+        assert other.get(Subreddit, "test", lambda: subreddit) is subreddit
+
+
+class TestResponseCache(UnitTest):
+    def test_clear(self):
+        cache = ResponseCache(ttl=60)
+        about = cache.key(identity=None, params=None, path="r/test/about/")
+        rules = cache.key(identity=None, params=None, path="r/test/about/rules")
+        cache.set(about, {})
+        cache.set(rules, {})
+        cache.invalidate()
+        assert len(cache) == 0
+        cache.set(about, {})
+        cache.clear()
+        assert about not in cache
+        assert cache._keys_by_endpoint == {}
+
+    def test_endpoint_name(self):
+        assert endpoint_name("r/test/about/") == "subreddit_about"
+        assert endpoint_name("/r/test/about/rules") == "rules"
+        assert endpoint_name("r/test/about/moderators/") == "list_moderator"
+        assert endpoint_name("api/v1/me") == "me"
+        assert endpoint_name("not/an/endpoint/at/all") is None
+
+    def test_get(self):
+        cache = ResponseCache(ttl=60)
+        key = cache.key(identity=None, params={"raw_json": 1}, path="r/test/about/")
+        assert cache.get(key) is None
+        response = {"data": {"display_name": "test"}}
+        cache.set(key, response)
+        response["data"]["display_name"] = "changed"
+        cached = cache.get(key)
+        assert cached == {"data": {"display_name": "test"}}
+        cached["data"].clear()
+        assert cache.get(key) == {"data": {"display_name": "test"}}
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    @mock.patch("praw.util.cache.time.monotonic", return_value=0)
+    def test_get__expired(self, monotonic):
+        cache = ResponseCache(ttl=60, ttls={"rules": 300})
+        about = cache.key(identity=None, params=None, path="r/test/about/")
+        rules = cache.key(identity=None, params=None, path="r/test/about/rules")
+        cache.set(about, {})
+        cache.set(rules, {})
+        monotonic.return_value = 60
+        assert about not in cache
+        assert cache.get(about) is None
+        assert cache.get(rules) == {}
+        assert len(cache) == 1
+        assert list(cache._keys_by_endpoint) == ["rules"]
+
+    def test_invalidate_path(self):
+        cache = ResponseCache(ttl=60)
+        about = cache.key(identity=None, params=None, path="r/test/about/")
+        rules = cache.key(identity=None, params=None, path="r/test/about/rules")
+        other_rules = cache.key(identity=None, params=None, path="r/other/about/rules")
+        for key in (about, rules, other_rules):
+            cache.set(key, {})
+        cache.invalidate_path("api/add_subreddit_rule")
+        assert about in cache
+        assert rules not in cache
+        assert other_rules not in cache
+        cache.invalidate_path("api/site_admin/")
+        assert about not in cache
+        cache.set(about, {})
+        cache.invalidate_path("not/an/endpoint/at/all")
+        assert about in cache
+
+    def test_key(self):
+        cache = ResponseCache(ttls={"rules": 60})
+        assert cache.key(identity=None, params=None, path="r/test/about/") is None
+        assert cache.key(identity=1, params={"b": 2, "a": 1}, path="r/test/about/rules") == cache.key(
+            identity=1, params={"a": 1, "b": 2}, path="r/test/about/rules"
+        )
+        assert cache.key(identity=1, params=None, path="r/test/about/rules") != cache.key(
+            identity=2, params=None, path="r/test/about/rules"
+        )
+
+    def test_max_size(self):
+        cache = ResponseCache(max_size=2, ttl=60)
+        keys = [cache.key(identity=None, params=None, path=f"r/{name}/about/") for name in "abc"]
+        cache.set(keys[0], {})
+        cache.set(keys[1], {})
+        cache.get(keys[0])
+        cache.set(keys[2], {})
+        assert keys[0] in cache
+        assert keys[1] not in cache
+        assert keys[2] in cache
+        assert cache._keys_by_endpoint == {"subreddit_about": {keys[0], keys[2]}}
+
+    def test_pickle(self, reddit):
+        cache = ResponseCache(max_size=2, ttl=60, ttls={"rules": 5})
+        key = cache.key(identity=None, params=None, path="r/test/about/")
+        cache.set(key, {})
+        cache = pickle.loads(pickle.dumps(cache))
+        assert (cache.max_size, cache.ttl, cache.ttls) == (2, 60, {"rules": 5})
+        assert len(cache) == 0
+        cache.set(key, {})
+        assert key in cache
+
+        reddit.response_cache = ResponseCache(ttl=60)
+        submission = pickle.loads(pickle.dumps(reddit.submission("abc")))
+        assert submission._reddit.response_cache.ttl == 60
+
+    def test_unknown_endpoint(self):
+        with pytest.raises(ValueError) as excinfo:
+            ResponseCache(ttls={"rules": 60, "unknown": 60})
+        assert excinfo.value.args[0] == "Unknown endpoint(s) given for the response cache: unknown."
@@ -0,0 +1,46 @@
+"""Test praw.util.checkpoint."""
+
+import pytest
+
+from praw.util.checkpoint import BaseCheckpoint, FileCheckpoint, SQLiteCheckpoint
+
+from .. import UnitTest
+
+
+class TestBaseCheckpoint(UnitTest):
+    def test_init_base_fail(self):
+        with pytest.raises(TypeError):
+            BaseCheckpoint()
+
+
+class TestFileCheckpoint(UnitTest):
+    def test_load__missing(self, tmp_path):
+        assert FileCheckpoint(tmp_path / "checkpoint.json").load() is None
+
+    def test_save(self, tmp_path):
+        checkpoint = FileCheckpoint(tmp_path / "checkpoint.json")
+        checkpoint.save({"before": "t1_a", "seen": ["t1_9", "t1_a"]})
+        checkpoint.save({"before": "t1_b", "seen": ["t1_a", "t1_b"]})
+        assert FileCheckpoint(str(tmp_path / "checkpoint.json")).load() == {
+            "before": "t1_b",
+            "seen": ["t1_a", "t1_b"],
+        }
+        assert [path.name for path in tmp_path.iterdir()] == ["checkpoint.json"]
+
+
+class TestSQLiteCheckpoint(UnitTest):
+    def test_load__missing(self):
+        assert SQLiteCheckpoint(database=":memory:", key="comments").load() is None
+
+    def test_save(self, tmp_path):
+        database = str(tmp_path / "checkpoints.db")
+        comments = SQLiteCheckpoint(database=database, key="comments")
+        submissions = SQLiteCheckpoint(database=database, key="submissions")
+        comments.save({"before": "t1_a", "seen": ["t1_a"]})
+        comments.save({"before": "t1_b", "seen": ["t1_a", "t1_b"]})
+        submissions.save({"before": None, "seen": []})
+        assert SQLiteCheckpoint(database=database, key="comments").load() == {
+            "before": "t1_b",
+            "seen": ["t1_a", "t1_b"],
+        }
+        assert submissions.load() == {"before": None, "seen": []}
@@ -0,0 +1,191 @@
+"""Test praw.util.concurrency."""
+
+import pickle
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from praw.util.concurrency import SingleFlight, ThreadSafeRateLimiter, ordered_map
+
+from .. import UnitTest
+
+
+class TestOrderedMap(UnitTest):
+    def test_ordered_map(self):
+        started = threading.Barrier(2, timeout=5)
+
+        def function(number):
+            if number < 2:
+                started.wait()
+            return number * 2
+
+        assert list(ordered_map(function, range(10), workers=2)) == list(range(0, 20, 2))
+
+    def test_ordered_map__exception(self):
+        def function(number):
+            if number == 3:
+                raise ValueError
+            return number
+
+        results = ordered_map(function, range(5), workers=2)
+        assert [next(results) for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(ValueError):
+            next(results)
+
+
+class WaitCountingEvent(threading.Event):
+    waiting = 0
+
+    def wait(self, timeout=None):
+        type(self).waiting += 1
+        return super().wait(timeout)
+
+
+class TestSingleFlight(UnitTest):
+    @staticmethod
+    def run_concurrently(single_flight, function, followers):
+        """Call ``function`` through ``single_flight`` once, and ``followers`` more times while it runs."""
+        results = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def leader_function():
+            started.set()
+            release.wait(5)
+            return function()
+
+        def target(function):
+            try:
+                results.append(single_flight.call("key", function))
+            except ValueError as exception:
+                results.append(exception)
+
+        WaitCountingEvent.waiting = 0
+        with mock.patch("praw.util.concurrency.Event", WaitCountingEvent):
+            threads = [threading.Thread(target=target, args=(leader_function,))]
+            threads[0].start()
+            started.wait(5)
+            threads.extend(threading.Thread(target=target, args=(function,)) for _ in range(followers))
+            for thread in threads[1:]:
+                thread.start()
+            while WaitCountingEvent.waiting < followers:
+                time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_call(self):
+        single_flight = SingleFlight()
+        assert single_flight.call("key", lambda: 1) == (1, False)
+        assert single_flight.call("key", lambda: 2) == (2, False)
+        assert single_flight._calls == {}
+
+    def test_call__concurrent(self):
+        single_flight = SingleFlight()
+        function = mock.Mock(return_value={"data": 1})
+        results = self.run_concurrently(single_flight, function, 3)
+        assert function.call_count == 1
+        assert [shared for _, shared in results] == [False, True, True, True]
+        assert all(result is results[0][0] for result, _ in results)
+        assert single_flight._calls == {}
+
+    def test_call__exception(self):
+        single_flight = SingleFlight()
+        function = mock.Mock(side_effect=ValueError)
+        results = self.run_concurrently(single_flight, function, 2)
+        assert function.call_count == 1
+        assert len(results) == 3
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.call("key", lambda: 1) == (1, False)
+
+    def test_pickle(self):
+        single_flight = pickle.loads(pickle.dumps(SingleFlight()))
+        assert single_flight.call("key", lambda: 1) == (1, False)
+
+
+class TestThreadSafeRateLimiter(UnitTest):
+    def test_call(self):
+        rate_limiter = ThreadSafeRateLimiter(window_size=600)
+        response = mock.Mock(
+            headers={"x-ratelimit-remaining": "99", "x-ratelimit-reset": "100", "x-ratelimit-used": "1"}
+        )
+        request_function = mock.Mock(return_value=response)
+        result = rate_limiter.call(
+            method="GET",
+            request_function=request_function,
+            set_header_callback=lambda: {"Authorization": "bearer token"},
+            url="https://oauth.reddit.com/",
+            params={},
+        )
+        assert result is response
+        request_function.assert_called_once_with(
+            "GET", "https://oauth.reddit.com/", headers={"Authorization": "bearer token"}, params={}
+        )
+        assert rate_limiter.remaining == 99
+        assert rate_limiter.used == 1
+
+    def test_call__concurrent_requests_overlap(self):
+        rate_limiter = ThreadSafeRateLimiter(window_size=600)
+        in_flight = threading.Barrier(2, timeout=5)
+
+        def request_function(method, url, **kwargs):
+            # Both requests must be in flight at once for the barrier to release.
+            in_flight.wait()
+            return mock.Mock(headers={})
+
+        threads = [
+            threading.Thread(
+                target=rate_limiter.call,
+                kwargs={
+                    "method": "GET",
+                    "request_function": request_function,
+                    "set_header_callback": dict,
+                    "url": "https://oauth.reddit.com/",
+                },
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not in_flight.broken
+
+    def test_pickle(self):
+        rate_limiter = ThreadSafeRateLimiter(window_size=600)
+        rate_limiter.remaining = 5
+        other = pickle.loads(pickle.dumps(rate_limiter))
+        assert other.remaining == 5
+        assert not other._lock.locked()
+
+    def test_call__header_callback_is_serialized(self):
+        rate_limiter = ThreadSafeRateLimiter(window_size=600)
+        refreshes = []
+        token = {}
+
+        def set_header_callback():
+            if "value" not in token:
+                refreshes.append(threading.current_thread())
+                token["value"] = "fresh"
+            return {"Authorization": f"bearer {token['value']}"}
+
+        threads = [
+            threading.Thread(
+                target=rate_limiter.call,
+                kwargs={
+                    "method": "GET",
+                    "request_function": lambda *_, **__: mock.Mock(headers={}),
+                    "set_header_callback": set_header_callback,
+                    "url": "https://oauth.reddit.com/",
+                },
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(refreshes) == 1
@@ -0,0 +1,64 @@
+"""Test praw.util.decoding."""
+
+import json
+import sys
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from praw.util.decoding import JSONResponseHook, json_loads
+
+from .. import UnitTest
+
+
+class DecodeError(Exception):
+    pass
+
+
+def decode(data):
+    if data == b"invalid":
+        raise DecodeError(data)
+    return json.loads(data)
+
+
+class TestJSONLoads(UnitTest):
+    def test_json(self):
+        assert json_loads("json") is json.loads
+
+    def test_msgspec(self):
+        msgspec = SimpleNamespace(DecodeError=DecodeError, json=SimpleNamespace(decode=decode))
+        with mock.patch.dict(sys.modules, {"msgspec": msgspec}):
+            loads = json_loads("msgspec")
+        # The module is looked up once, when the decoder is chosen.
+        with mock.patch.dict(sys.modules, {"msgspec": None}):
+            assert loads(b'{"a": [1]}') == {"a": [1]}
+            with pytest.raises(ValueError):
+                loads(b"invalid")
+
+    def test_not_installed(self):
+        with mock.patch.dict(sys.modules, {"orjson": None}), pytest.raises(ImportError):
+            json_loads("orjson")
+
+    def test_orjson(self):
+        orjson = SimpleNamespace(loads=decode)
+        with mock.patch.dict(sys.modules, {"orjson": orjson}):
+            loads = json_loads("orjson")
+        assert loads is decode
+
+    def test_unknown(self):
+        with pytest.raises(ValueError) as excinfo:
+            json_loads("yaml")
+        assert str(excinfo.value) == (
+            "An incorrect config value was given for option json_decoder. The expected"
+            " value is one of json, msgspec, orjson, but the given value is yaml."
+        )
+
+
+class TestJSONResponseHook(UnitTest):
+    def test_call(self):
+        loads = mock.Mock(return_value={"a": 1})
+        response = mock.Mock(content=b'{"a": 1}')
+        assert JSONResponseHook(loads)(response, timeout=16) is None
+        assert response.json() == {"a": 1}
+        loads.assert_called_once_with(b'{"a": 1}')
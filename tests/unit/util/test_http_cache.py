@@ -0,0 +1,117 @@
+"""Test praw.util.http_cache."""
+
+from unittest import mock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from praw.util.http_cache import CachedResponse, HTTPCache, HTTPCacheAdapter
+
+from .. import UnitTest
+
+
+def make_response(status_code, *, body=b"", headers=None):
+    response = requests.Response()
+    response._content = body
+    response.headers.update(headers or {})
+    response.status_code = status_code
+    return response
+
+
+class TestHTTPCache(UnitTest):
+    def test_clear(self, tmp_path):
+        cache = HTTPCache(tmp_path / "cache.db")
+        cache.save("key", CachedResponse(body=b"{}", etag='"1"', headers={}, last_modified=None))
+        cache.clear()
+        assert cache.load("key") is None
+
+    def test_max_entries(self, tmp_path):
+        cache = HTTPCache(tmp_path / "cache.db", max_entries=2)
+        cache.PRUNE_INTERVAL = 4
+        for key in "abcd":
+            cache.save(key, CachedResponse(body=key.encode(), etag=None, headers={}, last_modified="yesterday"))
+        # Only the first save has pruned so far.
+        assert [cache.load(key).body for key in "abcd"] == [b"a", b"b", b"c", b"d"]
+        cache.save("e", CachedResponse(body=b"e", etag=None, headers={}, last_modified="yesterday"))
+        assert [cache.load(key) for key in "abc"] == [None, None, None]
+        assert cache.load("d").body == b"d"
+        assert cache.load("e").body == b"e"
+
+    def test_record(self, tmp_path):
+        cache = HTTPCache(tmp_path / "cache.db")
+        cache.record(hit=True)
+        cache.record(hit=False)
+        cache.record(hit=False)
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_save(self, tmp_path):
+        response = CachedResponse(
+            body=b"{}", etag=None, headers={"content-type": "application/json"}, last_modified="yesterday"
+        )
+        HTTPCache(tmp_path / "cache.db").save("key", response)
+        assert HTTPCache(str(tmp_path / "cache.db")).load("key") == response
+
+
+class TestHTTPCacheAdapter(UnitTest):
+    @staticmethod
+    def request(token="token", url="https://oauth.reddit.com/r/test/wiki/index"):
+        return requests.Request("GET", url, headers={"Authorization": f"bearer {token}"}).prepare()
+
+    def test_send(self, tmp_path):
+        adapter = HTTPCacheAdapter(HTTPCache(tmp_path / "cache.db"), identity=lambda request: "user")
+        responses = [
+            make_response(200, body=b'{"a": 1}', headers={"content-type": "application/json", "ETag": '"1"'}),
+            make_response(304, headers={"Content-Encoding": "gzip", "x-ratelimit-used": "2"}),
+        ]
+        with mock.patch.object(HTTPAdapter, "send", side_effect=responses) as send:
+            assert adapter.send(self.request()).json() == {"a": 1}
+            assert "If-None-Match" not in send.call_args[0][0].headers
+            response = adapter.send(self.request())
+        assert send.call_args[0][0].headers["If-None-Match"] == '"1"'
+        assert response.status_code == 200
+        assert response.json() == {"a": 1}
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-length"] == "8"
+        assert response.headers["x-ratelimit-used"] == "2"
+        assert "content-encoding" not in response.headers
+        assert (adapter.cache.hits, adapter.cache.misses) == (1, 1)
+
+    def test_send__changed(self, tmp_path):
+        adapter = HTTPCacheAdapter(HTTPCache(tmp_path / "cache.db"), identity=lambda request: "user")
+        responses = [
+            make_response(200, body=b"1", headers={"Last-Modified": "Mon"}),
+            make_response(200, body=b"2", headers={"Last-Modified": "Tue"}),
+            make_response(304),
+        ]
+        with mock.patch.object(HTTPAdapter, "send", side_effect=responses) as send:
+            adapter.send(self.request())
+            assert adapter.send(self.request()).content == b"2"
+            assert send.call_args[0][0].headers["If-Modified-Since"] == "Mon"
+            assert adapter.send(self.request()).content == b"2"
+            assert send.call_args[0][0].headers["If-Modified-Since"] == "Tue"
+
+    def test_send__identity(self, tmp_path):
+        adapter = HTTPCacheAdapter(
+            HTTPCache(tmp_path / "cache.db"), identity=lambda request: request.headers["Authorization"]
+        )
+        with mock.patch.object(
+            HTTPAdapter, "send", return_value=make_response(200, body=b"{}", headers={"ETag": '"1"'})
+        ) as send:
+            adapter.send(self.request(token="a"))
+            adapter.send(self.request(token="b"))
+            assert "If-None-Match" not in send.call_args[0][0].headers
+            adapter.send(self.request(token="a"))
+            assert "If-None-Match" in send.call_args[0][0].headers
+
+    def test_send__not_cached(self, tmp_path):
+        adapter = HTTPCacheAdapter(HTTPCache(tmp_path / "cache.db"), identity=lambda request: None)
+        response = make_response(200, body=b"{}", headers={"ETag": '"1"'})
+        with mock.patch.object(HTTPAdapter, "send", return_value=response) as send:
+            adapter.send(self.request())
+            adapter.send(self.request())
+            adapter.identity = lambda request: "user"
+            post = requests.Request("POST", "https://oauth.reddit.com/api/comment").prepare()
+            adapter.send(post)
+            adapter.send(self.request(), stream=True)
+        assert all("If-None-Match" not in call[0][0].headers for call in send.call_args_list)
+        assert (adapter.cache.hits, adapter.cache.misses) == (0, 0)
@@ -0,0 +1,180 @@
+"""Test praw.util.instrumentation."""
+
+import pickle
+import sys
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import requests
+
+from praw.util.instrumentation import OpenTelemetryHook, RequestEvent, RequestInstrumentation
+
+from .. import UnitTest
+
+
+def make_response(status_code, *, body=b"{}", headers=None, path="/r/test/about/"):
+    response = requests.Response()
+    response._content = body
+    response.elapsed = timedelta(seconds=0.5)
+    response.headers.update(headers or {})
+    response.request = requests.Request("GET", f"https://oauth.reddit.com{path}").prepare()
+    response.status_code = status_code
+    return response
+
+
+class TestRequestEvent(UnitTest):
+    def test_init(self):
+        event = RequestEvent(method="GET", path="r/test/about/")
+        assert event.endpoint == "subreddit_about"
+        assert event.template == "r/{subreddit}/about/"
+        assert event.status is None
+        assert repr(event) == "RequestEvent(method='GET', path='r/test/about/', status=None)"
+
+    def test_init__unknown_path(self):
+        event = RequestEvent(attempt=1, method="POST", path="not/an/endpoint/at/all")
+        assert event.attempt == 1
+        assert event.endpoint is None
+        assert event.template is None
+
+
+class TestRequestInstrumentation(UnitTest):
+    def test_pickle(self):
+        instrumentation = RequestInstrumentation()
+        instrumentation.hooks.append(print)
+        instrumentation = pickle.loads(pickle.dumps(instrumentation))
+        assert instrumentation.hooks == []
+        assert instrumentation.current is None
+
+    def test_response_hook(self):
+        instrumentation = RequestInstrumentation()
+        events = []
+        instrumentation.hooks.append(events.append)
+        headers = {"x-ratelimit-remaining": "99.0", "x-ratelimit-reset": "300", "x-ratelimit-used": "1"}
+        with instrumentation.track(method="GET", path="r/test/about/") as event:
+            instrumentation.response_hook(make_response(500))
+            response = make_response(200, body=b'{"a": 1}', headers=headers)
+            instrumentation.response_hook(response)
+            assert response.json() == {"a": 1}
+        assert events == [event]
+        assert event.duration > 0
+        assert event.exception is None
+        assert event.network_time >= 1
+        assert event.parse_time > 0
+        assert (event.ratelimit_remaining, event.ratelimit_reset, event.ratelimit_used) == (99, 300, 1)
+        assert event.response_bytes == 8
+        assert event.retries == 1
+        assert event.status == 200
+        assert instrumentation.current is None
+
+    def test_response_hook__access_token(self):
+        instrumentation = RequestInstrumentation()
+        instrumentation.hooks.append(mock.Mock())
+        with instrumentation.track(method="GET", path="r/test/about/") as event:
+            instrumentation.response_hook(make_response(200, path="/api/v1/access_token"))
+        assert event.status is None
+        assert event.network_time == 0
+
+    def test_response_hook__not_tracked(self):
+        response = make_response(200)
+        RequestInstrumentation().response_hook(response)
+        assert "json" not in vars(response)
+
+    def test_track__exception(self):
+        instrumentation = RequestInstrumentation()
+        hook = mock.Mock()
+        instrumentation.hooks.append(hook)
+        with pytest.raises(ValueError), instrumentation.track(method="GET", path="r/test/about/"):
+            raise ValueError
+        (event,) = hook.call_args[0]
+        assert isinstance(event.exception, ValueError)
+
+    def test_track__hook_exception(self, caplog):
+        instrumentation = RequestInstrumentation()
+        hook = mock.Mock()
+        instrumentation.hooks.extend([mock.Mock(side_effect=RuntimeError), hook])
+        with instrumentation.track(method="GET", path="r/test/about/"):
+            pass
+        assert hook.call_count == 1
+        assert "The request hook" in caplog.text
+
+    def test_track__nested(self):
+        instrumentation = RequestInstrumentation()
+        hook = mock.Mock()
+        instrumentation.hooks.append(hook)
+        with instrumentation.track(attempt=2, method="POST", path="api/submit/") as outer:
+            with instrumentation.track(method="POST", path="api/submit/") as inner:
+                assert inner is outer
+            assert hook.call_count == 0
+        hook.assert_called_once_with(outer)
+        assert outer.attempt == 2
+
+    def test_track__without_hooks(self):
+        instrumentation = RequestInstrumentation()
+        with instrumentation.track(method="GET", path="r/test/about/") as event:
+            assert event is None
+            assert instrumentation.current is None
+
+
+class TestOpenTelemetryHook(UnitTest):
+    @pytest.fixture
+    def trace(self):
+        trace = SimpleNamespace(
+            SpanKind=SimpleNamespace(CLIENT="client"),
+            Status=mock.Mock(),
+            StatusCode=SimpleNamespace(ERROR="error"),
+            get_tracer=mock.Mock(),
+        )
+        with mock.patch.dict(sys.modules, {"opentelemetry.trace": trace}):
+            yield trace
+
+    def test_attributes(self):
+        event = RequestEvent(method="GET", path="r/test/about/")
+        event.ratelimit_used = 1
+        event.response_bytes = 2
+        event.status = 200
+        attributes = OpenTelemetryHook.attributes(event)
+        assert attributes["http.request.method"] == "GET"
+        assert attributes["http.response.body.size"] == 2
+        assert attributes["http.response.status_code"] == 200
+        assert attributes["praw.endpoint"] == "subreddit_about"
+        assert attributes["praw.ratelimit.used"] == 1
+        assert attributes["url.template"] == "r/{subreddit}/about/"
+        assert "praw.ratelimit.remaining" not in attributes
+
+    def test_call(self, trace):
+        hook = OpenTelemetryHook()
+        trace.get_tracer.assert_called_once_with("praw", mock.ANY)
+        event = RequestEvent(method="GET", path="r/test/about/")
+        event.duration = 1.5
+        event.status = 200
+        hook(event)
+        hook.tracer.start_span.assert_called_once_with(
+            "GET r/{subreddit}/about/",
+            attributes=OpenTelemetryHook.attributes(event),
+            kind="client",
+            start_time=event.started_at,
+        )
+        span = hook.tracer.start_span.return_value
+        span.end.assert_called_once_with(end_time=event.started_at + 1_500_000_000)
+        span.record_exception.assert_not_called()
+
+    def test_call__exception(self, trace):
+        tracer = mock.Mock()
+        hook = OpenTelemetryHook(tracer)
+        assert hook.tracer is tracer
+        event = RequestEvent(method="GET", path="not/an/endpoint/at/all")
+        event.exception = ValueError("invalid")
+        hook(event)
+        tracer.start_span.assert_called_once_with(
+            "GET not/an/endpoint/at/all", attributes=mock.ANY, kind="client", start_time=event.started_at
+        )
+        span = tracer.start_span.return_value
+        span.record_exception.assert_called_once_with(event.exception)
+        span.set_attribute.assert_called_once_with("error.type", "ValueError")
+        trace.Status.assert_called_once_with("error", "invalid")
+
+    def test_not_installed(self):
+        with mock.patch.dict(sys.modules, {"opentelemetry.trace": None}), pytest.raises(ImportError):
+            OpenTelemetryHook()
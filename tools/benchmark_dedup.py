@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Compare the memory and throughput of the structures streams use to skip items.
+
+Each structure is filled with fullnames, then fed pages of 100 fullnames of which half
+have been seen before, as a stream polling a busy listing would.
+
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from praw.models.util import BoundedSet, DedupWindow
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+PAGE_SIZE = 100
+
+
+def base36(number):
+    digits = ""
+    while number:
+        number, digit = divmod(number, 36)
+        digits = DIGITS[digit] + digits
+    return digits or "0"
+
+
+def fullnames(start, stop):
+    return [f"t1_{base36(number)}" for number in range(start, stop)]
+
+
+def measure_memory(cls, window):
+    # The fullnames are built while tracing, so the strings that a structure keeps
+    # count toward its memory.
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    seen = cls(window)
+    for number in range(10**9, 10**9 + window):
+        seen.add(f"t1_{base36(number)}")
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / window
+
+
+def measure_throughput(cls, window, pages):
+    seen = cls(window)
+    for item in fullnames(0, window):
+        seen.add(item)
+    step = PAGE_SIZE // 2
+    batches = [fullnames(window + page * step - step, window + page * step + step) for page in range(pages)]
+    started = time.perf_counter()
+    for batch in batches:
+        for item in batch:
+            if item not in seen:
+                seen.add(item)
+    return pages * PAGE_SIZE / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", default=2000, type=int, help="The pages fed to each structure.")
+    parser.add_argument("windows", default=[301, 3000, 100000], nargs="*", type=int, help="The window sizes.")
+    args = parser.parse_args()
+
+    print(f"{'window':>8}  {'structure':<11}  {'bytes/item':>10}  {'items/s':>10}")
+    for window in args.windows:
+        for cls in (BoundedSet, DedupWindow):
+            memory = measure_memory(cls, window)
+            throughput = measure_throughput(cls, window, args.pages)
+            print(f"{window:>8}  {cls.__name__:<11}  {memory:>10.0f}  {throughput / 1e6:>9.2f}M")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
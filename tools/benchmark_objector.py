@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Time Objector.objectify over the response bodies recorded in the test cassettes.
+
+With ``--no-op-parsers``, every parser is replaced by one that builds nothing, which
+isolates the time spent choosing a parser from the time spent building models. To
+compare with another checkout, run this with ``PYTHONPATH`` set to that checkout.
+
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+from praw import Reddit
+
+CASSETTES = pathlib.Path(__file__).parent.parent / "tests" / "integration" / "cassettes"
+
+
+class NoOpParser:
+    def __init__(self, *_):
+        pass
+
+    @staticmethod
+    def _convert_conversation_objects(*_):
+        pass
+
+    @staticmethod
+    def parse(*_):
+        return None
+
+
+def load_bodies():
+    bodies = []
+    for path in sorted(CASSETTES.glob("*.json")):
+        for interaction in json.loads(path.read_text())["interactions"]:
+            body = interaction["response"]["body"].get("string") or ""
+            if body[:1] in {"{", "["}:
+                bodies.append(body)
+    return bodies
+
+
+def objectify_all(reddit, payloads):
+    failures = 0
+    started = time.perf_counter()
+    for payload in payloads:
+        try:
+            reddit._objector.objectify(data=payload)
+        except Exception:  # noqa: BLE001
+            failures += 1
+    return time.perf_counter() - started, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--no-op-parsers", action="store_true", help="Replace every parser with one that does nothing.")
+    parser.add_argument("--runs", default=30, type=int, help="The number of runs to take the best of.")
+    args = parser.parse_args()
+
+    reddit = Reddit(check_for_async=False, client_id="dummy", client_secret="dummy", user_agent="dummy")
+    if args.no_op_parsers:
+        reddit._objector.parsers = dict.fromkeys(reddit._objector.parsers, NoOpParser)
+    bodies = load_bodies()
+    best = float("inf")
+    for _ in range(args.runs):
+        # ``objectify`` modifies the payloads, so each run decodes them again.
+        payloads = [json.loads(body) for body in bodies]
+        elapsed, failures = objectify_all(reddit, payloads)
+        best = min(best, elapsed)
+    print(f"{len(bodies)} payloads ({failures} raised), best of {args.runs}: {best * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())